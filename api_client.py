@@ -0,0 +1,199 @@
+# api_client.py
+# 나라장터(조달청 공공데이터포털) 입찰공고 API 호출을 한 곳에서 처리합니다.
+# 연결을 재사용하는 세션 하나를 프로그램 전체가 함께 쓰고, 일시적인 오류는 자동으로 다시 시도하며,
+# 같은 조회(주소 + 조건)는 일정 시간 동안 저장해 둔 응답을 바로 돌려줍니다.
+import ssl
+import json
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolManager
+from urllib3.util.retry import Retry
+
+import config
+import perf
+
+DEFAULT_BASE_URL = "https://apis.data.go.kr/1230000/ad/BidPublicInfoService"
+# 업종 -> 입찰공고목록 조회 오퍼레이션
+BID_LIST_OPERATIONS = {
+    "공사": "getBidPblancListInfoCnstwk",
+    "용역": "getBidPblancListInfoServc",
+    "물품": "getBidPblancListInfoThng",
+}
+
+REQUEST_TIMEOUT = 15  # 초
+MAX_RETRIES = 3  # 연결 실패, 429/5xx 응답 시 다시 시도하는 횟수 (0.5, 1, 2초 간격)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+CACHE_TTL = 600  # 응답 보관 시간(초)
+CACHE_SIZE = 256
+POOL_SIZE = 10
+PAGE_SIZE = 100  # numOfRows 최댓값
+MAX_PAGES = 50  # 기간 조회 시 가져올 최대 페이지 수 (5,000건)
+PAGE_WORKERS = 4
+
+
+class TLSAdapter(HTTPAdapter):
+    """data.go.kr 서버와 TLS 연결이 되도록 보안 수준을 낮춘 어댑터입니다."""
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        context = ssl.create_default_context(); context.set_ciphers('DEFAULT@SECLEVEL=1'); context.minimum_version = ssl.TLSVersion.TLSv1_2
+        self.poolmanager = PoolManager(num_pools=connections, maxsize=maxsize, block=block, ssl_context=context, **pool_kwargs)
+
+
+def is_success_response(data):
+    """API 응답(JSON 딕셔너리)의 결과 코드가 정상('00')인지 확인합니다."""
+    header = (data or {}).get('response', {}).get('header', {})
+    return str(header.get('resultCode')) == '00'
+
+
+def parse_bid_list(text):
+    """
+    입찰공고목록 응답 본문을 (공고 목록, 전체 건수)로 바꿉니다.
+    JSON이 아니거나 결과 코드가 정상이 아니면 ValueError를 발생시킵니다.
+    """
+    if not text or not text.strip().startswith('{'):
+        raise ValueError(f"서버로부터 유효한 JSON 응답을 받지 못했습니다.\n응답 내용: {text}")
+    data = json.loads(text)
+    if not is_success_response(data):
+        result_msg = data.get('response', {}).get('header', {}).get('resultMsg', '알 수 없는 오류')
+        raise ValueError(f"API 서버에서 오류가 발생했습니다: {result_msg}")
+    body = data['response'].get('body', {}) or {}
+    items = body.get('items', []) or []
+    if isinstance(items, dict):
+        items = [items]
+    try:
+        total_count = int(body.get('totalCount', len(items)))
+    except (TypeError, ValueError):
+        total_count = len(items)
+    return items, total_count
+
+
+class NaraApiClient:
+    def __init__(self, base_url=DEFAULT_BASE_URL, timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES,
+                 cache_ttl=CACHE_TTL, pool_size=POOL_SIZE):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        retry = Retry(total=max_retries, backoff_factor=0.5, status_forcelist=RETRY_STATUS_CODES,
+                      allowed_methods=frozenset({"GET"}), raise_on_status=False)
+        self.session = requests.Session()
+        self.session.mount('https://', TLSAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry))
+        # 로컬 테스트 서버(http) 용
+        self.session.mount('http://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry))
+        self._cache = OrderedDict()  # (주소, 조건) -> (만료 시각, 응답 본문)
+        self._lock = threading.Lock()
+
+    def bid_list_url(self, biz_field):
+        return f"{self.base_url}/{BID_LIST_OPERATIONS[biz_field]}"
+
+    @staticmethod
+    def _cache_key(url, params):
+        return url, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def get_text(self, url, params, use_cache=True):
+        """
+        GET 요청의 응답 본문을 반환합니다. 정상 응답(resultCode '00')만 보관하고, 보관 중이면 요청하지 않습니다.
+        다시 시도해도 실패하면 requests.exceptions.RequestException을 그대로 발생시킵니다.
+        """
+        key = self._cache_key(url, params)
+        if use_cache:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached and cached[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    return cached[1]
+
+        with perf.span("api.request"):
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            text = response.text
+
+        if use_cache and self.cache_ttl > 0:
+            try:
+                cacheable = is_success_response(json.loads(text))
+            except (ValueError, AttributeError):
+                cacheable = False
+            if cacheable:
+                with self._lock:
+                    self._cache[key] = (time.monotonic() + self.cache_ttl, text)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > CACHE_SIZE:
+                        self._cache.popitem(last=False)
+        return text
+
+    def get_bid_list(self, biz_field, params):
+        """한 업종의 입찰공고목록 한 페이지를 조회합니다. (공고 목록, 전체 건수)를 반환합니다."""
+        return parse_bid_list(self.get_text(self.bid_list_url(biz_field), params))
+
+    def find_bid_notice(self, params, biz_fields=None):
+        """
+        공고번호 조회를 모든 업종(공사/용역/물품)에 동시에 보내고, 공고가 나온 첫 응답을 (업종, 공고 목록)으로 반환합니다.
+        나머지 요청은 기다리지 않습니다. 어느 업종에도 없으면 (None, [])를 반환하고,
+        공고를 못 찾은 채 요청이 실패한 업종이 있으면 그 오류를 다시 발생시킵니다.
+        """
+        biz_fields = list(biz_fields or BID_LIST_OPERATIONS)
+        executor = ThreadPoolExecutor(max_workers=len(biz_fields))
+        try:
+            futures = {executor.submit(self.get_bid_list, biz_field, params): biz_field for biz_field in biz_fields}
+            pending, first_error = set(futures), None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        items, _ = future.result()
+                    except Exception as e:
+                        first_error = first_error or e
+                        continue
+                    if items:
+                        return futures[future], items
+            if first_error:
+                raise first_error
+            return None, []
+        finally:
+            # 아직 시작하지 않은 요청은 취소하고, 진행 중인 요청은 끝나는 대로 버립니다.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_all_pages(self, biz_field, params, page_size=PAGE_SIZE, max_pages=MAX_PAGES):
+        """
+        기간 조회처럼 결과가 한 페이지(numOfRows)를 넘는 조회를 모두 가져옵니다.
+        첫 페이지에서 전체 건수를 확인한 뒤 나머지 페이지(pageNo)는 동시에 요청하고, 페이지 순서대로 이어 붙입니다.
+        (공고 목록, 전체 건수)를 반환합니다. 전체 건수가 max_pages 페이지를 넘으면 그만큼만 가져옵니다.
+        """
+        params = {**params, 'numOfRows': str(page_size)}
+        items, total_count = self.get_bid_list(biz_field, {**params, 'pageNo': '1'})
+        page_count = min(-(-total_count // page_size), max_pages)
+        if page_count > 1:
+            with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, page_count - 1)) as executor:
+                pages = executor.map(lambda page_no: self.get_bid_list(biz_field, {**params, 'pageNo': str(page_no)}),
+                                     range(2, page_count + 1))
+                for page_items, _ in pages:
+                    items.extend(page_items)
+        return items, total_count
+
+    def list_bid_notices(self, params, biz_fields=None):
+        """여러 업종의 기간 조회를 동시에 실행하고 (업종 순서대로) 공고 목록을 이어 붙여 반환합니다."""
+        biz_fields = list(biz_fields or BID_LIST_OPERATIONS)
+        with ThreadPoolExecutor(max_workers=len(biz_fields)) as executor:
+            results = list(executor.map(lambda biz_field: self.fetch_all_pages(biz_field, params)[0], biz_fields))
+        return [item for items in results for item in items]
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 전체에서 공유하는 NaraApiClient를 반환합니다. 주소는 설정의 'api_base_url'로 바꿀 수 있습니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            base_url = config.load_config().get("api_base_url") or DEFAULT_BASE_URL
+            _client = NaraApiClient(base_url=base_url)
+        return _client
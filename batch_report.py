@@ -0,0 +1,141 @@
+# batch_report.py
+# 저장된 협정 파일(공고별 세션) 여러 개를 공고마다 엑셀 보고서 한 개씩으로 한꺼번에 만듭니다.
+# 보고서는 여러 프로세스에서 동시에 작성하고, 결과 목록을 출력 폴더의 manifest.json에 남깁니다.
+#
+# 사용 예)  python batch_report.py saved_data/행안부 -o reports
+#           python batch_report.py a.bidpack b.json -o reports -j 4
+import os
+import sys
+import json
+import argparse
+import logging
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import report_writer
+import session_store
+
+MANIFEST_FILENAME = "manifest.json"
+MIN_PARALLEL_JOBS = 2  # 보고서가 이보다 적으면 프로세스를 띄우지 않고 바로 작성합니다.
+
+
+def collect_session_paths(inputs):
+    """파일/폴더 목록을 저장 파일(.bidpack/.json) 경로 목록으로 펼칩니다. 폴더는 안의 저장 파일을 이름순으로 넣습니다."""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item))
+                         if session_store.is_session_file(name) and os.path.isfile(os.path.join(item, name)))
+        else:
+            paths.append(item)
+    return paths
+
+
+def session_header(session):
+    """저장 파일 내용에서 보고서 상단 정보를 만듭니다. (공고 정보는 첫 번째 협정에 저장된 값을 사용)"""
+    first = next(iter(session.get("consortiums", [])), {})
+    return {
+        "estimation_price": (first.get("price_data") or {}).get("estimation_price"),
+        "gongo_no": first.get("gongo_no", ""),
+        "gongo_title": first.get("gongo_title", ""),
+        "bid_opening": None,  # 개찰일시는 저장 파일에 없습니다.
+        "region_limit": session.get("region_limit", "전체"),
+    }
+
+
+def _output_paths(session_paths, output_dir):
+    """저장 파일 이름으로 보고서 파일명을 정하고, 이름이 겹치면 번호를 붙입니다."""
+    used, outputs = set(), []
+    for path in session_paths:
+        stem = "".join(c for c in os.path.splitext(os.path.basename(path))[0] if c not in r'<>:"/\|?*')
+        name, counter = f"{stem}.xlsx", 2
+        while name in used:
+            name, counter = f"{stem}_{counter}.xlsx", counter + 1
+        used.add(name)
+        outputs.append(os.path.join(output_dir, name))
+    return outputs
+
+
+def _render(job):
+    """작업 프로세스에서 실행됩니다: (저장 파일 경로, 보고서 경로, 템플릿 경로) -> manifest 항목"""
+    session_path, output_path, template = job
+    record = {"source": session_path, "output": output_path}
+    try:
+        session = session_store.read_session(os.path.dirname(session_path), os.path.basename(session_path))
+        header = session_header(session)
+        consortiums = [result_data for result_data in session.get("consortiums", []) if result_data]
+        report_writer.write_report(consortiums, header, output_path, template=template)
+        record.update({"status": "ok", "saved_name": session.get("saved_name"), "gongo_no": header["gongo_no"],
+                       "gongo_title": header["gongo_title"], "consortium_count": len(consortiums)})
+    except Exception as e:
+        record.update({"status": "error", "error": str(e)})
+    return record
+
+
+def export_reports(session_paths, output_dir, template=None, max_workers=None, on_result=None):
+    """
+    저장 파일마다 보고서를 작성하고 manifest.json을 씁니다. 입력 순서대로 정렬된 manifest 항목 목록을 반환합니다.
+    on_result(항목, 완료 개수, 전체 개수)는 보고서 하나가 끝날 때마다 호출됩니다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    template = os.path.abspath(template or report_writer.template_path())
+    jobs = list(zip(session_paths, _output_paths(session_paths, output_dir), [template] * len(session_paths)))
+    records = [None] * len(jobs)
+
+    def record(position, item):
+        records[position] = item
+        if on_result:
+            on_result(item, sum(r is not None for r in records), len(jobs))
+
+    if len(jobs) < MIN_PARALLEL_JOBS:
+        for position, job in enumerate(jobs):
+            record(position, _render(job))
+    else:
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_render, job): position for position, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                position = futures[future]
+                try:
+                    record(position, future.result())
+                except Exception as e:  # 작업 프로세스가 비정상 종료된 경우
+                    logging.error(f"보고서 작성 실패: {jobs[position][0]}, 오류: {e}")
+                    record(position, {"source": jobs[position][0], "output": jobs[position][1],
+                                      "status": "error", "error": str(e)})
+
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "template": template,
+                   "reports": records}, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 협정 파일들을 공고별 엑셀 보고서로 한꺼번에 만듭니다.")
+    parser.add_argument("inputs", nargs="+", help="저장 파일(.bidpack/.json) 또는 저장 폴더 (여러 개 가능)")
+    parser.add_argument("-o", "--output-dir", required=True, help="보고서와 manifest.json을 저장할 폴더")
+    parser.add_argument("-t", "--template", default=None, help=f"보고서 양식 파일 (기본: {report_writer.TEMPLATE_FILENAME})")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="동시에 작성할 프로세스 수 (기본: CPU 개수)")
+    args = parser.parse_args(argv)
+
+    session_paths = collect_session_paths(args.inputs)
+    if not session_paths:
+        print("보고서를 만들 저장 파일이 없습니다.")
+        return 1
+
+    def report(item, done, total):
+        status = "완료" if item["status"] == "ok" else f"실패 ({item['error']})"
+        print(f"[{done}/{total}] {os.path.basename(item['source'])} -> {status}")
+
+    records = export_reports(session_paths, args.output_dir, template=args.template, max_workers=args.jobs,
+                             on_result=report)
+    failed = sum(item["status"] != "ok" for item in records)
+    print(f"\n보고서 {len(records) - failed}개 작성, {failed}개 실패. "
+          f"목록: {os.path.join(args.output_dir, MANIFEST_FILENAME)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
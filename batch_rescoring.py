@@ -0,0 +1,73 @@
+# batch_rescoring.py
+# 저장된 협정 여러 개를 새 공고 조건으로 다시 계산합니다.
+# 협정마다 calculate_consortium을 여러 프로세스에서 동시에 실행하고, 끝나는 대로 결과를 알려 줍니다.
+# 최종 결과 목록은 입력 순서 그대로이므로 한 개씩 차례로 계산한 것과 같습니다.
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import calculation_logic
+
+# 협정 수가 이보다 적으면 프로세스를 띄우는 비용이 더 크므로 현재 스레드에서 바로 계산합니다.
+MIN_PARALLEL_JOBS = 8
+
+
+def collect_consortiums(saved_sessions):
+    """불러온 저장 파일들에서 업체가 있는 협정의 company_details 목록을 순서대로 꺼냅니다."""
+    consortiums = []
+    for saved_session_data in saved_sessions:
+        for result_data in saved_session_data.get("consortiums", []):
+            companies = result_data.get("company_details", [])
+            if companies:
+                consortiums.append(companies)
+    return consortiums
+
+
+def _rescore(job):
+    """작업 프로세스에서 실행됩니다: (순번, 업체 목록, 공고 조건) -> (순번, 계산 결과)"""
+    position, companies, context = job
+    return position, calculation_logic.calculate_consortium(companies, **context)
+
+
+def rescore_consortiums(consortiums, context, on_result=None, should_cancel=None, max_workers=None):
+    """
+    협정 목록을 같은 공고 조건(context: calculate_consortium의 나머지 인자)으로 다시 계산합니다.
+
+    on_result(순번, 결과, 완료 개수, 전체 개수)는 협정 하나가 끝날 때마다 호출되고,
+    should_cancel()이 True를 반환하면 아직 시작하지 않은 작업을 취소하고 멈춥니다.
+    입력 순서대로 정렬된 결과 목록을 반환합니다. (계산 실패는 None, 취소되어 계산하지 못한 협정은 빠짐)
+    """
+    total = len(consortiums)
+    results = {}
+
+    def record(position, result):
+        results[position] = result
+        if on_result:
+            on_result(position, result, len(results), total)
+
+    jobs = [(position, companies, context) for position, companies in enumerate(consortiums)]
+    if total < MIN_PARALLEL_JOBS:
+        for job in jobs:
+            if should_cancel and should_cancel():
+                break
+            record(*_rescore(job))
+    else:
+        workers = max_workers or min(total, os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(_rescore, job): job[0] for job in jobs}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        record(*future.result())
+                    except Exception as e:
+                        logging.error(f"협정 재계산 실패: {e}")
+                        record(futures[future], None)
+                if should_cancel and should_cancel():
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return [results[position] for position in range(total) if position in results]
@@ -0,0 +1,149 @@
+# batch_scoring.py
+# 여러 업체의 경영상태 점수를 한 번에 계산합니다.
+# calculation_logic.calculate_business_score와 결과가 같도록 만들었고,
+# 부채/유동/영업기간 점수표 조회는 NumPy 배열 연산(np.searchsorted)으로 한꺼번에 처리합니다.
+import json
+import re
+
+import numpy as np
+
+import calculation_logic
+from config import INDUSTRY_AVERAGES, BUSINESS_SCORE_TABLES, DURATION_SCORE_TABLES
+
+
+def ruleset_cache_key(ruleset):
+    """규칙(ruleset) dict를 캐시 키로 쓸 수 있는 문자열로 바꿉니다."""
+    return json.dumps(ruleset, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def lookup_scores(values, table, lower_is_better):
+    """점수표(table)의 calculation_logic._get_score_from_table을 값 배열 전체에 적용한 결과를 돌려줍니다."""
+    if not table:
+        return np.zeros(len(values))
+    thresholds = np.array([threshold for threshold, _ in table], dtype=float)
+    scores = np.array([score for _, score in table], dtype=float)
+    fallback = scores[-1]  # 어느 구간에도 해당하지 않으면 마지막 점수
+
+    if lower_is_better and np.all(np.diff(thresholds) >= 0):
+        # 오름차순 기준값: value < threshold 를 처음 만족하는 위치 = value 이하인 기준값의 개수
+        positions = np.searchsorted(thresholds, values, side='right')
+    elif not lower_is_better and np.all(np.diff(thresholds) <= 0):
+        # 내림차순 기준값: value >= threshold 를 처음 만족하는 위치 = value보다 큰 기준값의 개수
+        ascending = thresholds[::-1]
+        positions = len(thresholds) - np.searchsorted(ascending, values, side='right')
+        positions = np.where(np.isnan(values), len(thresholds), positions)
+    else:
+        # 정렬되지 않은 점수표는 모든 기준값과 비교해 처음 만족하는 위치를 찾습니다.
+        matches = values[:, None] < thresholds[None, :] if lower_is_better else values[:, None] >= thresholds[None, :]
+        positions = np.where(matches.any(axis=1), matches.argmax(axis=1), len(thresholds))
+
+    found = positions < len(thresholds)
+    return np.where(found, scores[np.minimum(positions, len(thresholds) - 1)], fallback)
+
+
+def _parse_ratio(value):
+    try:
+        return float(str(value).replace('%', '').strip())
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_duration(value):
+    try:
+        return float(re.sub(r'[^0-9.]', '', str(value)))
+    except (ValueError, TypeError):
+        return None
+
+
+def calculate_business_scores(companies, industry_type, announcement_date, ruleset):
+    """
+    업체 목록 전체의 경영상태 점수를 계산해 같은 순서의 결과 목록으로 돌려줍니다.
+    각 결과는 calculate_business_score가 돌려주는 dict와 같습니다.
+    """
+    default_result = {'total': 0.0, 'debt_score': 0.0, 'current_score': 0.0,
+                      'credit_score': 0.0, 'basis': "오류", 'credit_valid': "자료없음", 'duration_score': 0.0}
+    if not industry_type or industry_type not in INDUSTRY_AVERAGES:
+        return [dict(default_result) for _ in companies]
+
+    results = [None] * len(companies)
+    scored_ids, debt_ratios, current_ratios = [], [], []
+
+    # 1. 점수를 매길 수 없는 업체(자료 없음/만료/형식 오류)를 먼저 걸러냅니다.
+    for idx, company_data in enumerate(companies):
+        if not company_data:
+            results[idx] = dict(default_result)
+            continue
+        data_status = company_data.get('데이터상태', {})
+        if data_status.get('부채비율', '미지정') != "최신" or data_status.get('유동비율', '미지정') != "최신":
+            results[idx] = {**default_result, 'basis': "만료된 재무 데이터",
+                            'credit_valid': calculation_logic._is_credit_rating_valid(
+                                company_data.get("신용평가"), announcement_date)}
+            continue
+        debt_ratio = _parse_ratio(company_data.get("부채비율", "0"))
+        current_ratio = _parse_ratio(company_data.get("유동비율", "0"))
+        if debt_ratio is None or current_ratio is None:
+            results[idx] = {**default_result, 'basis': "데이터 오류"}
+            continue
+        scored_ids.append(idx)
+        debt_ratios.append(debt_ratio)
+        current_ratios.append(current_ratio)
+
+    if not scored_ids:
+        return results
+
+    # 2. 부채/유동비율 점수를 배열 연산으로 한 번에 계산합니다.
+    industry_avgs = INDUSTRY_AVERAGES[industry_type]
+    avg_debt_ratio = industry_avgs.get("부채비율", 100.0)
+    avg_current_ratio = industry_avgs.get("유동비율", 100.0)
+    debt_vs_industry = (np.array(debt_ratios) * 100) / avg_debt_ratio if avg_debt_ratio else np.zeros(len(scored_ids))
+    current_vs_industry = ((np.array(current_ratios) * 100) / avg_current_ratio if avg_current_ratio
+                           else np.zeros(len(scored_ids)))
+
+    debt_table = BUSINESS_SCORE_TABLES.get(ruleset.get("debt_score_table_id", "default_debt"), [])
+    current_table = BUSINESS_SCORE_TABLES.get(ruleset.get("current_score_table_id", "default_current"), [])
+    debt_scores = lookup_scores(debt_vs_industry, debt_table, lower_is_better=True)
+    debt_scores = np.where(debt_scores > 0, debt_scores, ruleset.get("debt_base_score", 0.0))
+    current_scores = lookup_scores(current_vs_industry, current_table, lower_is_better=False)
+    current_scores = np.where(current_scores > 0, current_scores, ruleset.get("current_base_score", 0.0))
+
+    # 3. 영업기간 점수 (숫자로 읽을 수 없는 업체는 0점)
+    duration_scores = np.zeros(len(scored_ids))
+    if ruleset.get("use_duration_score"):
+        durations = [_parse_duration(companies[idx].get("영업기간", "0")) for idx in scored_ids]
+        valid = np.array([duration is not None for duration in durations])
+        if valid.any():
+            duration_table = DURATION_SCORE_TABLES.get(ruleset.get("duration_score_table_id"), [])
+            duration_values = np.array([duration if duration is not None else 0.0 for duration in durations])
+            duration_scores = np.where(valid, lookup_scores(duration_values, duration_table, lower_is_better=False), 0.0)
+
+    ratio_based_scores = debt_scores + current_scores + duration_scores
+
+    # 4. 신용평가 점수와 비교해 최종 점수를 정합니다.
+    debt_list, current_list = debt_scores.tolist(), current_scores.tolist()
+    duration_list, ratio_list = duration_scores.tolist(), ratio_based_scores.tolist()
+    for pos, idx in enumerate(scored_ids):
+        credit_rating_str = companies[idx].get("신용평가")
+        credit_based_score = calculation_logic._get_score_from_credit_rating(credit_rating_str, ruleset)
+        credit_status = calculation_logic._is_credit_rating_valid(credit_rating_str, announcement_date)
+        if credit_status == '유효' and credit_based_score > ratio_list[pos]:
+            final_score, basis = credit_based_score, "신용평가"
+        else:
+            final_score, basis = ratio_list[pos], "재무비율"
+        results[idx] = {
+            'debt_score': debt_list[pos],
+            'current_score': current_list[pos],
+            'credit_score': credit_based_score,
+            'duration_score': duration_list[pos],
+            'credit_valid': credit_status,
+            'total': final_score,
+            'basis': basis
+        }
+    return results
+
+
+def rank_by_business_score(companies, industry_type, announcement_date, ruleset, scores=None):
+    """경영상태 점수가 높은 순서로 (업체, 점수 상세) 목록을 돌려줍니다."""
+    if scores is None:
+        scores = calculate_business_scores(companies, industry_type, announcement_date, ruleset)
+    order = np.argsort([-score['total'] for score in scores], kind='stable')
+    return [(companies[idx], scores[idx]) for idx in order]
@@ -0,0 +1,3 @@
+# benchmarks
+# 업체 파일 파싱, 검색 조건 적용, 협정 점수 계산, 보고서 작성 속도를 재는 벤치마크 모음입니다.
+# 실행: python -m benchmarks.run_benchmarks  (자세한 옵션은 --help)
@@ -0,0 +1,215 @@
+# benchmarks/run_benchmarks.py
+# 가짜 업체 파일(synthetic_workbook)을 크기별로 만들어 파싱/검색/점수 계산/보고서 작성 시간을 재고,
+# 결과를 JSON 파일로 남깁니다. 이전 결과 파일을 --compare로 주면 항목별로 몇 배 빨라졌는지(느려졌는지) 보여줍니다.
+#
+# 사용 예)  python -m benchmarks.run_benchmarks
+#           python -m benchmarks.run_benchmarks --sizes 100 1000 -r 3 --compare benchmarks/results/이전.json
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import date, datetime
+
+import search_logic
+import calculation_logic
+import batch_scoring
+import report_writer
+from company_index import CompanyIndex
+from company_repository import CompanyRepository
+from config import CONSORTIUM_RULES
+from benchmarks.synthetic_workbook import generate_workbook
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_DIR, "benchmarks", "results")
+RESULT_FORMAT = 1
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000]
+DEFAULT_REPEAT = 5
+CONSORTIUM_COUNT = 200  # 크기마다 점수를 계산할 협정 수
+REPORT_CONSORTIUM_COUNT = 50  # 보고서 한 개에 넣을 협정 수
+RULE_INFO = ("행안부", "30억미만")
+ESTIMATION_PRICE = 2_500_000_000
+
+# 검색 화면에서 조건을 하나씩 더해 가는 순서 (앞 조건을 포함해 누적)
+FILTER_CHAIN = [
+    ("name", {"name": "건설"}),
+    ("name+region", {"region": "서울"}),
+    ("name+region+sipyung", {"min_sipyung": 1_000_000_000, "max_sipyung": 100_000_000_000}),
+    ("name+region+sipyung+perf_5y", {"min_perf_5y": 500_000_000}),
+]
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행해 걸린 시간(초)의 최소/중앙/평균값을 반환합니다."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {"runs": repeat, "min_s": min(durations), "median_s": statistics.median(durations),
+            "mean_s": statistics.fmean(durations)}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _sample_consortiums(companies, count, seed):
+    """업체 목록에서 2~3개 업체로 된 협정(companies_data)을 count개 뽑습니다. 지분은 대표사 50% 이상."""
+    rnd = random.Random(seed)
+    consortiums = []
+    for _ in range(count):
+        members = rnd.sample(companies, rnd.randint(2, 3))
+        lead_share = rnd.choice([0.5, 0.6, 0.7])
+        rest = [(1 - lead_share) / (len(members) - 1)] * (len(members) - 1)
+        consortiums.append([
+            {"role": "대표사" if position == 0 else f"구성사 {position}", "data": comp, "share": share,
+             "source_type": "전기"}
+            for position, (comp, share) in enumerate(zip(members, [lead_share] + rest))
+        ])
+    return consortiums
+
+
+def run_size(company_count, work_dir, repeat, seed):
+    """업체 company_count개 파일 하나에 대한 벤치마크 결과 목록을 반환합니다."""
+    results = []
+
+    def record(case, timing, **extra):
+        results.append({"case": case, "companies": company_count, **timing, **extra})
+        print(f"  {case:<50} median {timing['median_s'] * 1000:10.2f} ms")
+
+    workbook_path = os.path.join(work_dir, f"companies_{company_count}.xlsx")
+    started = time.perf_counter()
+    generate_workbook(workbook_path, company_count, seed=seed)
+    print(f"[업체 {company_count}개] 파일 생성 {time.perf_counter() - started:.1f}초")
+
+    # 1. 파싱: 캐시 없이 엑셀을 직접 읽는 시간과, 디스크 캐시에서 읽는 시간
+    parse_repeat = max(1, min(repeat, 3)) if company_count > 5000 else repeat
+    record("parse_workbook_streaming", measure(lambda: search_logic._parse_workbook(workbook_path), parse_repeat))
+    search_logic.load_companies(workbook_path)  # 캐시 만들기
+    record("load_companies_cached", measure(lambda: search_logic.load_companies(workbook_path), repeat))
+    companies = search_logic.load_companies(workbook_path)
+
+    # 2. 검색: 기존 경로(find_and_filter_companies, 매번 전체 목록을 걸러냄)와 색인 경로(CompanyRepository)
+    record("find_and_filter_companies", measure(
+        lambda: search_logic.find_and_filter_companies(workbook_path, dict(FILTER_CHAIN[0][1])), repeat))
+    record("company_index_build", measure(lambda: CompanyIndex(companies), repeat))
+    repository = CompanyRepository()
+    repository.get_index(workbook_path)
+    filters = {}
+    for label, extra_filters in FILTER_CHAIN:
+        filters = {**filters, **extra_filters}
+        matched = len([comp for comp in search_logic.filter_companies(companies, filters) if "오류" not in comp])
+        record(f"filter_chain_linear[{label}]",
+               measure(lambda f=filters: search_logic.filter_companies(companies, f), repeat), matched=matched)
+        record(f"filter_chain_indexed[{label}]",
+               measure(lambda f=filters: repository.search(workbook_path, f), repeat), matched=matched)
+
+    # 3. 협정 점수 계산: 경영상태 점수 캐시가 빈 상태와 채워진 상태
+    ruleset = CONSORTIUM_RULES[RULE_INFO[0]][RULE_INFO[1]]
+    announcement_date = date.today()
+    consortiums = _sample_consortiums(companies, CONSORTIUM_COUNT, seed)
+    price_data = {"estimation_price": ESTIMATION_PRICE, "notice_base_amount": ESTIMATION_PRICE * 1.1,
+                  "tuchal_amount": ESTIMATION_PRICE * 0.88}
+    sipyung_info = {"is_limited": True, "limit_amount": ESTIMATION_PRICE, "method": "비율제",
+                    "tuchal_amount": price_data["tuchal_amount"]}
+
+    def score_all():
+        return [calculation_logic.calculate_consortium(companies_data, price_data, announcement_date, RULE_INFO,
+                                                       sipyung_info, "서울") for companies_data in consortiums]
+
+    def score_all_cold():
+        calculation_logic.clear_business_score_cache()
+        return score_all()
+
+    record("calculate_consortium_cold", measure(score_all_cold, repeat), consortiums=len(consortiums))
+    record("calculate_consortium_warm", measure(score_all, repeat), consortiums=len(consortiums))
+
+    record("batch_business_scores", measure(
+        lambda: batch_scoring.calculate_business_scores(companies, "전기", announcement_date, ruleset), repeat))
+
+    # 4. 보고서 작성 (report_writer.write_report, 예전 generate_excel_report)
+    scored = [result for result in score_all()[:REPORT_CONSORTIUM_COUNT] if result]
+    header = {"estimation_price": ESTIMATION_PRICE, "gongo_no": "BENCH-0001", "gongo_title": "벤치마크 공고",
+              "bid_opening": None, "region_limit": "서울"}
+    report_path = os.path.join(work_dir, f"report_{company_count}.xlsx")
+    template = os.path.join(REPO_DIR, report_writer.TEMPLATE_FILENAME)
+    record("write_report", measure(lambda: report_writer.write_report(scored, header, report_path, template=template),
+                                   repeat), consortiums=len(scored))
+    return results
+
+
+def compare(results, baseline_path):
+    """이전 결과 파일과 (항목, 업체 수)가 같은 측정끼리 중앙값을 비교해 출력합니다."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(item["case"], item["companies"]): item for item in json.load(f).get("results", [])}
+    print(f"\n비교 기준: {baseline_path}  (비율 = 이전 / 이번, 1보다 크면 빨라짐)")
+    for item in results:
+        previous = baseline.get((item["case"], item["companies"]))
+        if previous and item["median_s"] > 0:
+            ratio = previous["median_s"] / item["median_s"]
+            print(f"  {item['case']:<50} {item['companies']:>6}개  {ratio:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파싱/검색/점수 계산/보고서 작성 벤치마크를 실행합니다.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="업체 수 목록")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 반복 횟수")
+    parser.add_argument("-o", "--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/날짜시각.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep-files", action="store_true", help="생성한 엑셀 파일을 지우지 않음")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="bidding_bench_")
+    # 파싱 캐시는 작업 폴더에 따로 두어 실제 프로그램의 cache 폴더를 건드리지 않습니다.
+    search_logic.CACHE_DIR = os.path.join(work_dir, "cache")
+    started_at = datetime.now()
+    results = []
+    try:
+        for company_count in args.sizes:
+            results.extend(run_size(company_count, work_dir, args.repeat, args.seed))
+    finally:
+        if args.keep_files:
+            print(f"생성한 파일: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output_path = args.output or os.path.join(RESULTS_DIR, f"{started_at:%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    report = {
+        "format": RESULT_FORMAT,
+        "generated_at": started_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sizes": args.sizes,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": results,
+    }
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, output_path)
+    print(f"\n결과 저장: {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# benchmarks/synthetic_workbook.py
+# 실제 협력업체요약 엑셀과 같은 배치(회사명 행 + RELATIVE_OFFSETS 항목 행)로 가짜 업체 파일을 만듭니다.
+# 지역별 시트에 업체를 나눠 넣고, 항목 셀마다 '최신'/'1년 경과'/'1년 이상 경과' 색(테마 색, RGB 색)을 칠합니다.
+#
+# 사용 예)  python -m benchmarks.synthetic_workbook 5000 -o bench_5000.xlsx
+import sys
+import random
+import argparse
+from datetime import date, timedelta
+
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
+from openpyxl.styles.colors import Color
+
+from config import RELATIVE_OFFSETS
+
+REGIONS = ["서울", "경기", "인천", "강원", "충북", "충남", "대전", "세종", "전북", "전남", "광주", "경북", "경남",
+           "대구", "울산", "부산", "제주"]
+COMPANIES_PER_BLOCK = 10  # 회사명 행 하나에 들어가는 업체 수 (B열부터)
+BLOCK_HEIGHT = max(RELATIVE_OFFSETS.values()) + 2  # 회사명 행 + 항목 행 + 빈 행
+
+# search_logic.get_status_from_color가 읽는 색: 테마 6/3, RGB E2EFDA/DDEBF7 -> 최신/1년 경과, 흰색 -> 1년 이상 경과
+STATUS_FILLS = {
+    "최신": [PatternFill(fill_type='solid', fgColor=Color(theme=6, tint=0.7999816888943144)),
+             PatternFill(fill_type='solid', fgColor='FFE2EFDA')],
+    "1년 경과": [PatternFill(fill_type='solid', fgColor=Color(theme=3, tint=0.7999816888943144)),
+               PatternFill(fill_type='solid', fgColor='FFDDEBF7')],
+    "1년 이상 경과": [PatternFill(fill_type='solid', fgColor='FFFFFFFF')],
+}
+STATUS_WEIGHTS = {"최신": 0.7, "1년 경과": 0.2, "1년 이상 경과": 0.1}
+
+_NAME_SYLLABLES = "가나다라마바사아자차카타파하한대성진영동신우미현정태광명일"
+_NAME_ENDINGS = ["건설", "전기", "통신", "전력", "산업", "엔지니어링", "이앤씨", "기술"]
+_CORPORATE_FORMS = ["(주)", "㈜", "주식회사 ", ""]
+_MANAGERS = ["김민수", "이영희", "박지훈", "최수진", "정우성", "강다은"]
+_MANAGER_TITLES = ["", "팀장", "과장", "님"]
+_CREDIT_GRADES = ["AA-", "A+", "A0", "A-", "BBB+", "BBB0", "BBB-", "BB+", "BB0", "B+", "B0", "CCC+"]
+
+
+def _company_name(rnd, number):
+    stem = "".join(rnd.choice(_NAME_SYLLABLES) for _ in range(rnd.randint(2, 3)))
+    return f"{rnd.choice(_CORPORATE_FORMS)}{stem}{rnd.choice(_NAME_ENDINGS)}{number}"
+
+
+def _amount(rnd, low, high):
+    """대부분은 숫자 셀, 일부는 '12억 3,000만' 같은 문자열이나 빈 칸으로 만듭니다."""
+    value = rnd.randint(low, high)
+    roll = rnd.random()
+    if roll < 0.1:
+        return f"{value // 100000000}억 {value % 100000000 // 10000:,}만"
+    if roll < 0.15:
+        return None
+    return value
+
+
+def _credit_rating(rnd, today):
+    if rnd.random() < 0.2:
+        return None
+    start = today - timedelta(days=rnd.randint(0, 540))
+    end = start + timedelta(days=364)
+    return f"{rnd.choice(_CREDIT_GRADES)} ({start:%y.%m.%d}~{end:%y.%m.%d})"
+
+
+def company_values(rnd, number, region, today):
+    """RELATIVE_OFFSETS 항목별 셀 값 (엑셀에 들어가는 원래 형태)"""
+    return {
+        "대표자": f"대표{number}",
+        "사업자번호": f"{rnd.randint(100, 999)}-{rnd.randint(10, 99)}-{number:05d}",
+        "지역": region,
+        "시평": _amount(rnd, 300_000_000, 200_000_000_000),
+        "3년 실적": _amount(rnd, 0, 100_000_000_000),
+        "5년 실적": _amount(rnd, 0, 150_000_000_000),
+        # 비율은 대부분 엑셀 백분율 서식 숫자(0.85 = 85%), 일부는 '85.2%' 문자열
+        "부채비율": round(rnd.uniform(0.05, 4.0), 4) if rnd.random() < 0.9 else f"{rnd.uniform(5, 400):.1f}%",
+        "유동비율": round(rnd.uniform(0.3, 6.0), 4) if rnd.random() < 0.9 else f"{rnd.uniform(30, 600):.1f}%",
+        "영업기간": f"{rnd.randint(1, 40)}년",
+        "신용평가": _credit_rating(rnd, today),
+        "여성기업": "여성기업" if rnd.random() < 0.1 else None,
+        "고용자수": rnd.randint(1, 300),
+        "일자리창출": "O" if rnd.random() < 0.3 else None,
+        "품질평가": round(rnd.uniform(80, 100), 1) if rnd.random() < 0.3 else None,
+        "비고": f"{rnd.choice(_MANAGERS)}{rnd.choice(_MANAGER_TITLES)}" if rnd.random() < 0.6 else None,
+    }
+
+
+def _status_fill(rnd):
+    status = rnd.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    return rnd.choice(STATUS_FILLS[status])
+
+
+def generate_workbook(path, company_count, regions=None, seed=0, today=None):
+    """
+    업체 company_count개를 지역 시트에 골고루 나눈 엑셀 파일을 path에 저장합니다.
+    같은 seed면 같은 파일 내용이 만들어집니다. 저장한 업체 수를 반환합니다.
+    """
+    rnd = random.Random(seed)
+    regions = regions or REGIONS
+    today = today or date.today()
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+
+    per_region, remainder = divmod(company_count, len(regions))
+    number = 0
+    for region_no, region in enumerate(regions):
+        sheet = workbook.create_sheet(region)
+        region_count = per_region + (1 if region_no < remainder else 0)
+        header_row = 1
+        for block_start in range(0, region_count, COMPANIES_PER_BLOCK):
+            sheet.cell(header_row, 1, "회사명")
+            for item, offset in RELATIVE_OFFSETS.items():
+                sheet.cell(header_row + offset, 1, item)
+            for column in range(2, 2 + min(COMPANIES_PER_BLOCK, region_count - block_start)):
+                number += 1
+                sheet.cell(header_row, column, _company_name(rnd, number))
+                for item, value in company_values(rnd, number, region, today).items():
+                    cell = sheet.cell(header_row + RELATIVE_OFFSETS[item], column, value)
+                    cell.fill = _status_fill(rnd)
+            header_row += BLOCK_HEIGHT
+
+    workbook.save(path)
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 협력업체요약 엑셀 파일을 만듭니다.")
+    parser.add_argument("company_count", type=int, help="업체 수")
+    parser.add_argument("-o", "--output", required=True, help="저장할 엑셀 파일 경로")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    count = generate_workbook(args.output, args.company_count, seed=args.seed)
+    print(f"업체 {count}개 -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
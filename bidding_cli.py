@@ -0,0 +1,124 @@
+# bidding_cli.py
+# 화면 없이 업체 검색, 협정 점수 계산, 보고서 일괄 작성을 실행하는 명령줄 도구입니다. (GUI 모듈을 불러오지 않음)
+#
+# 사용 예)
+#   python bidding_cli.py search 전기 --name 가나 --region 서울 --min-sipyung 10억 -o 결과.xlsx
+#   python bidding_cli.py score 공고조건.json --saved saved_data/행안부/협정.bidpack -o 결과.json --xlsx 보고서.xlsx
+#   python bidding_cli.py report saved_data/행안부 -o reports
+#
+# score 명세(JSON) 예)
+#   {"mode": "행안부", "rule": "30억미만", "announcement_date": "2025-03-01", "estimation_price": "25억",
+#    "base_amount": "27억", "region_limit": "서울", "sipyung_limit": true, "source": "전기",
+#    "consortiums": [[{"company": "가나전기", "share": 60}, {"company": "123-45-67890", "share": 40}]]}
+import sys
+import json
+import argparse
+
+import engine
+import batch_report
+import report_writer
+
+# 명령줄 옵션 -> 검색 조건 키
+SEARCH_OPTIONS = [
+    ("--name", "name", "회사명 (일부)"), ("--manager", "manager", "담당자(비고) (일부)"),
+    ("--region", "region", "대표지역 (시트 이름)"),
+    ("--min-sipyung", "min_sipyung", "시평 최소 (예: 10억)"), ("--max-sipyung", "max_sipyung", "시평 최대"),
+    ("--min-perf-3y", "min_perf_3y", "3년 실적 최소"), ("--max-perf-3y", "max_perf_3y", "3년 실적 최대"),
+    ("--min-perf-5y", "min_perf_5y", "5년 실적 최소"), ("--max-perf-5y", "max_perf_5y", "5년 실적 최대"),
+]
+
+
+def run_search(args):
+    filters = {key: getattr(args, key) for _, key, _ in SEARCH_OPTIONS}
+    companies = engine.search_companies(args.source, filters)
+    print(f"검색 결과: {len(companies)}개 업체")
+    for comp in companies[:args.limit]:
+        print(f"  {comp.get('검색된 회사', '')}  [{comp.get('대표지역', '')}]  시평: {comp.get('시평', '')}")
+    if len(companies) > args.limit:
+        print(f"  ... 외 {len(companies) - args.limit}개")
+
+    if args.output:
+        if args.output.lower().endswith(".xlsx"):
+            engine.write_companies_xlsx(companies, args.output)
+        else:
+            engine.write_json({"source": args.source, "filters": engine.normalize_filters(filters),
+                               "count": len(companies), "companies": companies}, args.output)
+        print(f"저장: {args.output}")
+    return 0
+
+
+def run_score(args):
+    with open(args.spec, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    results, conditions = engine.score_spec(spec, saved_files=args.saved, max_workers=args.jobs)
+
+    failed = 0
+    for number, result in enumerate(results, start=1):
+        if not result:
+            failed += 1
+            print(f"[{number}] 계산 실패")
+            continue
+        summary = engine.summarize_result(result)
+        members = ", ".join(f"{m['name']}({m['share'] * 100:.2f}%)" for m in summary["members"])
+        print(f"[{number}] 예상점수 {summary['expected_score']:.4f}  "
+              f"(경영 {summary['final_business_score']:.4f}, 실적 {summary['final_performance_score']:.4f})  {members}")
+
+    if args.output:
+        engine.write_json({"spec": spec, "conditions": conditions, "results": results}, args.output)
+        print(f"결과 저장: {args.output}")
+    if args.xlsx:
+        engine.write_score_report(results, spec, conditions, args.xlsx, template=args.template)
+        print(f"보고서 저장: {args.xlsx}")
+    return 1 if failed else 0
+
+
+def run_report(args):
+    argv = [*args.inputs, "-o", args.output_dir]
+    if args.template:
+        argv += ["-t", args.template]
+    if args.jobs:
+        argv += ["-j", str(args.jobs)]
+    return batch_report.main(argv)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="입찰 프로그램의 업체 검색/협정 점수 계산/보고서 작성을 화면 없이 실행합니다.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="업체 파일에서 조건에 맞는 업체를 찾습니다.")
+    search.add_argument("source", help="전기/통신/소방 (config.json에 등록된 파일) 또는 업체 엑셀 파일 경로")
+    for option, key, help_text in SEARCH_OPTIONS:
+        search.add_argument(option, dest=key, default=None, help=help_text)
+    search.add_argument("-o", "--output", default=None, help="결과 저장 파일 (.json 또는 .xlsx)")
+    search.add_argument("--limit", type=int, default=20, help="화면에 출력할 업체 수 (기본: 20)")
+    search.set_defaults(func=run_search)
+
+    score = commands.add_parser("score", help="공고 조건 명세(JSON)로 협정 점수를 계산합니다.")
+    score.add_argument("spec", help="공고 조건과 협정 구성을 담은 JSON 파일")
+    score.add_argument("--saved", nargs="+", default=[], help="함께 계산할 저장된 협정 파일 (saved_data의 .bidpack/.json)")
+    score.add_argument("-o", "--output", default=None, help="계산 결과 JSON 파일")
+    score.add_argument("--xlsx", default=None, help="행안부 보고서 양식으로 저장할 엑셀 파일")
+    score.add_argument("-t", "--template", default=None, help=f"보고서 양식 파일 (기본: {report_writer.TEMPLATE_FILENAME})")
+    score.add_argument("-j", "--jobs", type=int, default=None, help="동시에 계산할 프로세스 수 (기본: CPU 개수)")
+    score.set_defaults(func=run_score)
+
+    report = commands.add_parser("report", help="저장된 협정 파일들을 공고별 엑셀 보고서로 만듭니다. (batch_report)")
+    report.add_argument("inputs", nargs="+", help="저장 파일(.bidpack/.json) 또는 저장 폴더 (여러 개 가능)")
+    report.add_argument("-o", "--output-dir", required=True, help="보고서와 manifest.json을 저장할 폴더")
+    report.add_argument("-t", "--template", default=None, help=f"보고서 양식 파일 (기본: {report_writer.TEMPLATE_FILENAME})")
+    report.add_argument("-j", "--jobs", type=int, default=None, help="동시에 작성할 프로세스 수 (기본: CPU 개수)")
+    report.set_defaults(func=run_report)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (ValueError, OSError, KeyError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
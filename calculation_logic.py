@@ -1,45 +1,21 @@
 # calculation_logic.py
 import utils
+import perf
+import credit_rating
 # calculation_logic.py
 
 from config import INDUSTRY_AVERAGES, CREDIT_RATING_SCORES, CONSORTIUM_RULES, BUSINESS_SCORE_TABLES, PERFORMANCE_SCORE_TABLE, DURATION_SCORE_TABLES
 import re
-from datetime import datetime
+import threading
+from collections import OrderedDict
 
 
 def _is_credit_rating_valid(rating_str, announcement_date):
     """
     신용평가 문자열을 검증하여 상세 상태('유효', '기간만료' 등)를 반환합니다.
+    문자열 해석은 credit_rating에서 한 번만 하고, 여기서는 기간만 비교합니다.
     """
-    if not rating_str or not isinstance(rating_str, str) or rating_str.strip() == "":
-        return "자료없음"
-    
-    match = re.search(r'\((\d{2,4}[./-]\d{1,2}[./-]\d{1,2})~(\d{2,4}[./-]\d{1,2}[./-]\d{1,2})\)', rating_str.replace(" ", ""))
-    if not match:
-        return "형식오류"
-
-    try:
-        start_date_str, end_date_str = match.groups()
-        
-        # 날짜 구분자(., /, -)에 상관없이 파싱
-        def parse_date(date_str):
-            for fmt in ('%Y.%m.%d', '%y.%m.%d', '%Y/%m/%d', '%y/%m/%d', '%Y-%m-%d', '%y-%m-%d'):
-                try:
-                    return datetime.strptime(date_str, fmt).date()
-                except ValueError:
-                    continue
-            raise ValueError("날짜 형식이 올바르지 않습니다.")
-
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-        
-        if start_date <= announcement_date <= end_date:
-            return "유효"
-        else:
-            return "기간만료"
-        
-    except (ValueError, TypeError):
-        return "형식오류"
+    return credit_rating.credit_rating_status(rating_str, announcement_date)
 
 
 def _get_score_from_table(value, table, lower_is_better=True):
@@ -78,17 +54,15 @@ def _get_score_from_credit_rating(rating_str, ruleset):
     # 2. config의 CREDIT_RATING_SCORES에서 해당 점수표를 찾습니다.
     score_table = CREDIT_RATING_SCORES.get(table_id, {})
 
-    try:
-        # .split()은 띄어쓰기, 줄바꿈, 탭 등 모든 공백을 기준으로 문자열을 나눕니다.
-        rating = rating_str.split()[0].strip().upper()
-    except IndexError:
-        # 혹시 모를 예외 처리 (빈 문자열 등)
+    # 등급은 문자열의 첫 단어(공백/줄바꿈 기준)이며, 해석 결과를 재사용합니다.
+    rating = credit_rating.parse_credit_rating(rating_str).grade
+    if not rating:
         return 0.0
 
     return score_table.get(rating, 0.0)
 
 # [calculate_business_score 함수를 이 코드로 통째로 교체하세요]
-def calculate_business_score(company_data, industry_type, announcement_date, ruleset):
+def _compute_business_score(company_data, industry_type, announcement_date, ruleset):
     """
     [최종 수정] 개별 회사의 경영상태 점수를 계산합니다. (항목별 데이터 상태 우선 검증)
     """
@@ -127,9 +101,6 @@ def calculate_business_score(company_data, industry_type, announcement_date, rul
     debt_score = _calculate_debt_ratio_score(debt_ratio_vs_industry, ruleset)
     current_score = _calculate_current_ratio_score(current_ratio_vs_industry, ruleset)
 
-    # ▼▼▼▼▼ 디버깅용 print문 추가 ▼▼▼▼▼
-    print(f"[디버깅] 경영상태 점수 -> 부채: {debt_score}, 유동: {current_score}")
-
     # --- [핵심 추가] 영업기간 점수 계산 ---
     duration_score = 0.0
     if ruleset.get("use_duration_score"):
@@ -176,6 +147,94 @@ def calculate_business_score(company_data, industry_type, announcement_date, rul
     }
 
 
+# --- 경영상태 점수 캐시 ---
+# 점수는 업체의 재무 항목, 업종, 공고일, 규칙에만 좌우되므로 최근 결과를 정해진 개수만큼 보관해 재사용합니다.
+BUSINESS_SCORE_CACHE_SIZE = 4096
+# 점수 계산에 실제로 쓰이는 업체 항목과 규칙 항목 (캐시 키)
+_BUSINESS_DATA_KEYS = ("부채비율", "유동비율", "영업기간", "신용평가")
+_BUSINESS_RULE_KEYS = ("debt_score_table_id", "debt_base_score", "current_score_table_id", "current_base_score",
+                       "use_duration_score", "duration_score_table_id", "credit_score_table_id")
+
+
+class _BusinessScoreCache:
+    """스레드에서 함께 써도 안전한 LRU 캐시 (적중/미적중 횟수 기록)"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_business_score_cache = _BusinessScoreCache(BUSINESS_SCORE_CACHE_SIZE)
+
+
+def _business_score_key(company_data, industry_type, announcement_date, ruleset):
+    data_status = company_data.get('데이터상태', {})
+    return (tuple(company_data.get(key) for key in _BUSINESS_DATA_KEYS),
+            data_status.get('부채비율', '미지정'), data_status.get('유동비율', '미지정'),
+            industry_type, announcement_date,
+            tuple(ruleset.get(key) for key in _BUSINESS_RULE_KEYS))
+
+
+@perf.timed("calc.business_score")
+def calculate_business_score(company_data, industry_type, announcement_date, ruleset):
+    """
+    개별 회사의 경영상태 점수를 계산합니다.
+    같은 조건으로 계산한 적이 있으면 캐시에 보관된 결과(복사본)를 돌려줍니다.
+    """
+    if not company_data:
+        return _compute_business_score(company_data, industry_type, announcement_date, ruleset)
+    try:
+        key = _business_score_key(company_data, industry_type, announcement_date, ruleset)
+        hash(key)
+    except TypeError:  # 캐시 키로 쓸 수 없는 값이 들어 있으면 그냥 계산
+        return _compute_business_score(company_data, industry_type, announcement_date, ruleset)
+
+    result = _business_score_cache.get(key)
+    if result is None:
+        result = _compute_business_score(company_data, industry_type, announcement_date, ruleset)
+        _business_score_cache.put(key, result)
+    return dict(result)
+
+
+def clear_business_score_cache():
+    """경영상태 점수 캐시를 비웁니다. (업체 엑셀 파일을 다시 읽을 때 호출)"""
+    _business_score_cache.clear()
+
+
+def business_score_cache_stats():
+    """경영상태 점수 캐시의 적중/미적중 횟수와 크기를 반환합니다."""
+    return _business_score_cache.stats()
+
+
 def _calculate_performance_score(ruleset, total_performance, base_amount):
     """
     규칙(ruleset)에 명시된 계산 방식에 따라 시공경험 점수와 비율을 함께 반환합니다.
@@ -206,7 +265,6 @@ def _calculate_performance_score(ruleset, total_performance, base_amount):
 
         # [수정] 화면 표시를 위한 역산된 비율과 함께 점수 반환
         equivalent_ratio = (final_score / max_score) * 100 if max_score > 0 else 0
-        print(f"[디버깅] 시공경험 점수 -> {final_score}")
         return final_score, equivalent_ratio
 
 
@@ -214,7 +272,21 @@ def _calculate_performance_score(ruleset, total_performance, base_amount):
     return 0.0, 0.0
 
 
-def calculate_consortium(companies_data, price_data, announcement_date, rule_info, sipyung_info, region_limit):
+@perf.timed("calc.calculate_consortium")
+def sipyung_totals(company_details):
+    """
+    협정 업체들의 (시평액 합계, 지분 반영 시평액)을 반환합니다. (합산제/비율제 평가액, 지분 share는 0~1 사이의 소수)
+    """
+    amounts = [(utils.parse_amount(str(comp['data'].get("시평", 0))) or 0, comp.get('share', 0))
+               for comp in company_details]
+    return sum(amount for amount, _ in amounts), sum(amount * share for amount, share in amounts)
+
+
+def calculate_consortium(companies_data, price_data, announcement_date, rule_info, sipyung_info, region_limit,
+                         business_score_cache=None):
+    """
+    business_score_cache: 같은 공고 조건으로 여러 번 계산할 때 업체별 경영상태 점수를 재사용하기 위한 dict (선택)
+    """
     try:
         ruleset = CONSORTIUM_RULES[rule_info[0]][rule_info[1]]
     except KeyError:
@@ -232,7 +304,16 @@ def calculate_consortium(companies_data, price_data, announcement_date, rule_inf
         company_info = comp.get('data', {})
         share = comp.get('share', 0)
         industry_type = comp.get('source_type', '전기')
-        business_score_details = calculate_business_score(company_info, industry_type, announcement_date, ruleset)
+        if business_score_cache is not None:
+            cache_key = (company_info.get("검색된 회사", ""), company_info.get("사업자번호", ""), industry_type)
+            business_score_details = business_score_cache.get(cache_key)
+            if business_score_details is None:
+                business_score_details = calculate_business_score(company_info, industry_type, announcement_date, ruleset)
+                business_score_cache[cache_key] = business_score_details
+            # 결과마다 별도 사본을 넣어, 한 협정 결과를 고쳐도 같은 업체가 있는 다른 협정에 번지지 않게 합니다.
+            business_score_details = dict(business_score_details)
+        else:
+            business_score_details = calculate_business_score(company_info, industry_type, announcement_date, ruleset)
         detailed_results.append({
             "role": comp.get('role'),
             "name": company_info.get("검색된 회사", ""),
@@ -299,13 +380,13 @@ def calculate_consortium(companies_data, price_data, announcement_date, rule_inf
 
         solo_bid_results.append({"name": company_name, "role": comp_detail.get('role'), "possible": is_possible, "reason": reason})
 
-    # 2. 시평액 제한 (컨소시엄 전체) 검증 (기존과 동일)
+    # 2. 시평액 제한 (컨소시엄 전체) 검증 (지분 share는 0~1 사이의 소수)
     sipyung_check_result = {"passed": True, "message": "시평액 제한 없음"}
     if sipyung_info.get("is_limited"):
         limit_amount = sipyung_info.get("limit_amount", 0)
         method = sipyung_info.get("method", "비율제")
-        if method == "비율제": eval_sipyung = sum((utils.parse_amount(str(r['data'].get("시평", 0))) or 0) * (r.get('share', 0) / 100.0) for r in detailed_results)
-        else: eval_sipyung = sum(utils.parse_amount(str(r['data'].get("시평", 0))) or 0 for r in detailed_results)
+        sipyung_sum, sipyung_ratio = sipyung_totals(detailed_results)
+        eval_sipyung = sipyung_ratio if method == "비율제" else sipyung_sum
         if eval_sipyung < limit_amount:
             sipyung_check_result["passed"] = False; sipyung_check_result["message"] = f"시평액 미충족 ({method}) - 필요: {limit_amount:,.0f}원, 평가액: {eval_sipyung:,.0f}원"
         else:
@@ -319,7 +400,7 @@ def calculate_consortium(companies_data, price_data, announcement_date, rule_inf
             for comp_detail in detailed_results:
                 sipyung_amount = utils.parse_amount(str(comp_detail['data'].get("시평", 0))) or 0
                 share = comp_detail.get('share', 0)
-                required_amount = tuchal_amount * (share / 100.0)
+                required_amount = tuchal_amount * share
                 passed = sipyung_amount >= required_amount
                 individual_sipyung_results.append({
                     "name": comp_detail.get('name', ''), "passed": passed,
@@ -349,7 +430,8 @@ def check_share_limit(companies_data, tuchal_amount):
     results = []
     for comp_detail in companies_data:
         sipyung_amount = utils.parse_amount(str(comp_detail['data'].get("시평", 0))) or 0
-        input_share = comp_detail.get('share', 0)
+        # 입력 지분(0~1 소수)을 최대 지분율과 같은 % 단위로 맞춤
+        input_share = comp_detail.get('share', 0) * 100
 
         # 최대 참여 가능 지분율 (%) 계산
         max_possible_share = (sipyung_amount / tuchal_amount) * 100 if tuchal_amount > 0 else 0
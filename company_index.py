@@ -0,0 +1,153 @@
+# company_index.py
+# 업체 목록을 한 번 읽어 둔 뒤 반복 검색을 빠르게 처리하기 위한 색인입니다.
+# 시평/3년 실적/5년 실적은 불러올 때 숫자로 한 번만 변환하고, 정렬된 배열에서 이진 탐색으로 범위를 찾습니다.
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from credit_rating import CreditRatingIndex
+from utils import parse_amounts, normalize_company_name
+
+# 검색 조건 키 -> 업체 데이터 항목명
+NUMERIC_FILTER_FIELDS = {'sipyung': '시평', 'perf_3y': '3년 실적', 'perf_5y': '5년 실적'}
+
+
+class NgramIndex:
+    """
+    문자열 부분 일치 검색용 2-gram 역색인입니다.
+    검색어의 2글자 조각이 모두 들어 있는 후보만 골라 실제 포함 여부를 확인하므로, 전체 목록을 훑지 않습니다.
+    """
+
+    def __init__(self, texts, normalize):
+        self._normalize = normalize
+        self._texts = []
+        self._postings = {}  # 2글자(또는 1글자) 조각 -> 업체 번호 집합
+        for text in texts:
+            self.add(text)
+
+    def add(self, text):
+        """문자열 하나를 색인에 추가하고 부여한 번호를 반환합니다."""
+        idx = len(self._texts)
+        text = self._normalize(text)
+        self._texts.append(text)
+        for gram in self._grams(text):
+            self._postings.setdefault(gram, set()).add(idx)
+        return idx
+
+    @staticmethod
+    def _grams(text):
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def search_ids(self, query):
+        """정규화한 검색어가 포함된 업체 번호 집합을 반환합니다. 검색어가 비면 None을 반환합니다."""
+        query = self._normalize(query)
+        if not query:
+            return None
+        if len(query) == 1:
+            return set(self._postings.get(query, ()))
+
+        grams = sorted((query[i:i + 2] for i in range(len(query) - 1)),
+                       key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set(self._postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._postings.get(gram, set())
+        if len(query) == 2:
+            return candidates
+        return {idx for idx in candidates if query in self._texts[idx]}
+
+    def prefix_ids(self, query):
+        """정규화한 문자열이 검색어로 시작하는 업체 번호 집합을 반환합니다."""
+        query = self._normalize(query)
+        matches = self.search_ids(query)
+        if matches is None:
+            return None
+        return {idx for idx in matches if self._texts[idx].startswith(query)}
+
+
+def _normalize_remarks(text):
+    return str(text).lower() if text is not None else ""
+
+
+class CompanyIndex:
+    def __init__(self, companies):
+        self.companies = companies
+        # 항목명 -> 업체 순서대로 변환된 숫자 배열 (변환 불가 시 NaN)
+        self.numeric_columns = {}
+        # 항목명 -> (정렬된 값 목록, 같은 순서의 업체 번호 목록)
+        self._sorted_columns = {}
+
+        for field_name in NUMERIC_FILTER_FIELDS.values():
+            column = parse_amounts(comp.get(field_name) for comp in companies)
+            self.numeric_columns[field_name] = column
+            ids = np.flatnonzero(~np.isnan(column))
+            ids = ids[np.argsort(column[ids], kind='stable')]
+            self._sorted_columns[field_name] = (column[ids].tolist(), ids.tolist())
+
+        # 회사명은 법인 형태 표기/공백을 뺀 형태로, 담당자(비고)는 원래 방식대로 소문자로만 색인합니다.
+        self.name_index = NgramIndex([comp.get("검색된 회사", "") for comp in companies], normalize_company_name)
+        self.manager_index = NgramIndex([comp.get("비고", "") for comp in companies], _normalize_remarks)
+        # 신용평가는 불러올 때 (등급, 시작일, 종료일)로 한 번만 해석합니다.
+        self.credit_index = CreditRatingIndex([comp.get("신용평가") for comp in companies])
+
+    def range_ids(self, field_name, min_val=None, max_val=None):
+        """min_val <= 값 <= max_val 인 업체 번호의 집합을 반환합니다. (O(log n + k))"""
+        values, ids = self._sorted_columns[field_name]
+        start = bisect_left(values, min_val) if min_val is not None else 0
+        end = bisect_right(values, max_val) if max_val is not None else len(values)
+        return set(ids[start:end])
+
+    def _substring_ids(self, field_name, query):
+        """항목 값(소문자)에 검색어(소문자)가 들어 있는 업체 번호의 집합을 전체 목록을 훑어 구합니다."""
+        query = str(query).lower()
+        return {idx for idx, comp in enumerate(self.companies) if query in str(comp.get(field_name, "")).lower()}
+
+    def valid_credit_ids(self, announcement_date):
+        """공고일에 유효한 신용평가를 가진 업체 번호의 집합을 반환합니다."""
+        return self.credit_index.valid_ids(announcement_date)
+
+    def candidate_ids(self, filters):
+        """회사명/담당자/범위 조건을 모두 만족하는 업체 번호 집합을 구합니다. 해당 조건이 없으면 None을 반환합니다."""
+        candidates = None
+        for key, field_name, text_index in (('name', "검색된 회사", self.name_index),
+                                            ('manager', "비고", self.manager_index)):
+            if not filters.get(key):
+                continue
+            ids = text_index.search_ids(filters[key])
+            if ids is None:
+                # '(주)', '주식회사'처럼 정규화하면 비는 검색어는 원래 방식(소문자 부분 일치)으로 찾습니다.
+                ids = self._substring_ids(field_name, filters[key])
+            candidates = ids if candidates is None else candidates & ids
+
+        for key, field_name in NUMERIC_FILTER_FIELDS.items():
+            min_val, max_val = filters.get(f'min_{key}'), filters.get(f'max_{key}')
+            if min_val is None and max_val is None:
+                continue
+            ids = self.range_ids(field_name, min_val, max_val)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates
+
+    def filter(self, filters):
+        """search_logic.filter_companies와 같은 결과(원래 순서 유지)를 색인을 이용해 돌려줍니다."""
+        if not self.companies:
+            return [{"오류": "엑셀 파일에서 업체 정보를 찾을 수 없습니다."}]
+
+        candidates = self.candidate_ids(filters)
+        if candidates is None:
+            results = self.companies
+        else:
+            results = [self.companies[idx] for idx in sorted(candidates)]
+
+        if filters.get('region') and filters['region'] != "전체":
+            search_region = filters['region'].strip().replace('[', '').replace(']', '')
+            results = [comp for comp in results if search_region == comp.get('대표지역')]
+
+        if not results:
+            return [{"오류": "주어진 조건에 맞는 업체를 찾을 수 없습니다."}]
+
+        return results
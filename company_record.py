@@ -0,0 +1,124 @@
+# company_record.py
+# 엑셀에서 읽은 업체 한 곳의 정보를 적은 메모리로 보관하는 레코드 타입입니다.
+# 항목마다 고정 슬롯(__slots__)에 값을 두고, 데이터상태는 작은 정수 코드로 바꿔 같은 조합끼리 공유합니다.
+# 기존 코드가 dict처럼 쓰던 방식(record.get("시평"), record["데이터상태"]["부채비율"])은 그대로 동작합니다.
+from collections.abc import Mapping
+
+from config import RELATIVE_OFFSETS
+
+# 데이터상태 값 목록 (코드 = 목록 순서)
+STATUS_LABELS = ("미지정", "최신", "1년 경과", "1년 이상 경과", "범위 초과")
+_STATUS_CODES = {label: code for code, label in enumerate(STATUS_LABELS)}
+
+STATUS_KEYS = tuple(RELATIVE_OFFSETS.keys())
+_STATUS_POSITIONS = {key: pos for pos, key in enumerate(STATUS_KEYS)}
+
+# dict 키 -> 슬롯 이름 (순서는 파싱 결과 dict의 키 순서와 동일)
+FIELD_SLOTS = {
+    "검색된 회사": "name", "대표지역": "main_region",
+    "대표자": "ceo", "사업자번호": "biz_no", "지역": "region", "시평": "sipyung",
+    "3년 실적": "perf_3y", "5년 실적": "perf_5y", "부채비율": "debt_ratio", "유동비율": "current_ratio",
+    "영업기간": "duration", "신용평가": "credit_rating", "여성기업": "women_owned", "고용자수": "employees",
+    "일자리창출": "job_creation", "품질평가": "quality", "비고": "remarks",
+}
+STATUS_KEY = "데이터상태"
+_SLOT_NAMES = tuple(FIELD_SLOTS.values())
+
+
+class CompanyStatus(Mapping):
+    """항목별 데이터상태('최신', '1년 경과' 등)를 읽기 전용 dict처럼 제공합니다."""
+    __slots__ = ('_codes',)
+    _pool = {}  # 같은 상태 조합은 하나의 객체를 함께 씁니다.
+
+    def __new__(cls, codes):
+        codes = bytes(codes)
+        instance = cls._pool.get(codes)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._codes = codes
+            cls._pool[codes] = instance
+        return instance
+
+    @classmethod
+    def from_dict(cls, statuses):
+        return cls(_STATUS_CODES.get(statuses.get(key, "미지정"), 0) for key in STATUS_KEYS)
+
+    def __getitem__(self, key):
+        return STATUS_LABELS[self._codes[_STATUS_POSITIONS[key]]]
+
+    def __iter__(self):
+        return iter(STATUS_KEYS)
+
+    def __len__(self):
+        return len(STATUS_KEYS)
+
+    def __reduce__(self):
+        return (CompanyStatus, (self._codes,))
+
+    def __repr__(self):
+        return f"CompanyStatus({self.to_dict()!r})"
+
+    def to_dict(self):
+        return {key: STATUS_LABELS[code] for key, code in zip(STATUS_KEYS, self._codes)}
+
+
+class CompanyRecord(Mapping):
+    """업체 한 곳의 정보. 값은 슬롯에, 데이터상태는 공유되는 CompanyStatus에 보관합니다."""
+    __slots__ = _SLOT_NAMES + ('statuses',)
+
+    def __init__(self, values, statuses):
+        for slot, value in zip(_SLOT_NAMES, values):
+            object.__setattr__(self, slot, value)
+        object.__setattr__(self, 'statuses', statuses)
+
+    @classmethod
+    def from_dict(cls, company_data):
+        """파싱 결과 dict(데이터상태 포함)를 레코드로 바꿉니다."""
+        values = [company_data.get(key, "") for key in FIELD_SLOTS]
+        statuses = company_data.get(STATUS_KEY)
+        if not isinstance(statuses, CompanyStatus):
+            statuses = CompanyStatus.from_dict(statuses or {})
+        return cls(values, statuses)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompanyRecord는 수정할 수 없습니다. to_dict()로 복사해서 사용하세요.")
+
+    def __getitem__(self, key):
+        if key == STATUS_KEY:
+            return self.statuses
+        try:
+            return getattr(self, FIELD_SLOTS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        yield from FIELD_SLOTS
+        yield STATUS_KEY
+
+    def __len__(self):
+        return len(FIELD_SLOTS) + 1
+
+    def __contains__(self, key):
+        return key in FIELD_SLOTS or key == STATUS_KEY
+
+    def __reduce__(self):
+        return (CompanyRecord, (tuple(getattr(self, slot) for slot in _SLOT_NAMES), self.statuses))
+
+    def __repr__(self):
+        return f"CompanyRecord({self.name!r})"
+
+    def to_dict(self):
+        """일반 dict(데이터상태도 dict)로 변환합니다. 저장이나 수정이 필요할 때 사용합니다."""
+        data = {key: getattr(self, slot) for key, slot in FIELD_SLOTS.items()}
+        data[STATUS_KEY] = self.statuses.to_dict()
+        return data
+
+    def copy(self):
+        return self.to_dict()
+
+
+def json_default(obj):
+    """json.dump(default=...)용: 레코드를 일반 dict로 바꿔 저장할 수 있게 합니다."""
+    if isinstance(obj, (CompanyRecord, CompanyStatus)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
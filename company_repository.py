@@ -0,0 +1,211 @@
+# company_repository.py
+# 프로그램 전체가 함께 쓰는 업체 데이터 저장소입니다.
+# 각 엑셀 파일은 한 번만 읽어서 메모리에 보관하고, 모든 화면의 검색 요청은 이 저장소를 통해 처리합니다.
+import os
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+import search_logic
+import calculation_logic
+import batch_scoring
+import perf
+from company_index import CompanyIndex
+
+
+def _load_source(file_path):
+    """엑셀 파일 하나를 읽고 색인까지 만들어 돌려줍니다. (사전 로딩 시 작업 프로세스에서도 실행됩니다)"""
+    fingerprint = search_logic.file_fingerprint(file_path)
+    companies = search_logic.load_companies(file_path)
+    return fingerprint, CompanyIndex(companies)
+
+
+class CompanyRepository:
+    def __init__(self):
+        self._lock = threading.RLock()
+        # 절대경로 -> {"fingerprint": ..., "companies": [...], "index": CompanyIndex, "business_scores": {...}}
+        self._entries = {}
+
+    def _load_entry(self, file_path):
+        fingerprint, index = _load_source(file_path)
+        return self._install_entry(file_path, fingerprint, index)
+
+    def _install_entry(self, file_path, fingerprint, index):
+        entry = {"fingerprint": fingerprint, "companies": index.companies, "index": index, "business_scores": {}}
+        with self._lock:
+            self._entries[os.path.abspath(file_path)] = entry
+        # 업체 데이터가 새로 들어왔으므로 이전 경영상태 점수는 버립니다.
+        calculation_logic.clear_business_score_cache()
+        return entry
+
+    def _is_fresh(self, file_path):
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(file_path))
+        try:
+            return entry is not None and entry["fingerprint"] == search_logic.file_fingerprint(file_path)
+        except OSError:
+            return False
+
+    def _get_entry(self, file_path):
+        """메모리에 없거나 파일이 바뀌었으면 다시 읽은 뒤 항목을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(file_path))
+            if entry is None or entry["fingerprint"] != search_logic.file_fingerprint(file_path):
+                entry = self._load_entry(file_path)
+            return entry
+
+    def get_companies(self, file_path):
+        """파일의 전체 업체 목록을 반환합니다."""
+        return self._get_entry(file_path)["companies"]
+
+    def get_index(self, file_path):
+        """파일의 검색 색인(CompanyIndex)을 반환합니다."""
+        return self._get_entry(file_path)["index"]
+
+    def search(self, file_path, filters):
+        """find_and_filter_companies와 같은 형식으로 검색 결과를 돌려줍니다."""
+        try:
+            index = self.get_index(file_path)
+        except Exception as e:
+            logging.error(f"엑셀 파일 열기 실패: {file_path}, 오류: {e}")
+            return [{"오류": f"파일 열기 오류: {e}"}]
+        with perf.span("repository.search"):
+            return index.filter(filters)
+
+    def search_sources(self, sources, filters):
+        """
+        여러 파일([(분야, 파일 경로), ...], 전체 검색)을 차례로 검색합니다.
+        (결과, 결과마다의 분야, 실패 목록 [(분야, 오류 메시지)])를 반환합니다. 조건에 맞는 업체가 없는 것은 실패가 아닙니다.
+        결과가 하나도 없으면 결과는 search와 같이 {"오류": 메시지} 하나짜리 목록입니다. (파일 오류가 있으면 그 메시지)
+        """
+        all_results, result_sources, failures, no_match = [], [], [], None
+        for source_key, file_path in sources:
+            try:
+                index = self.get_index(file_path)
+            except Exception as e:
+                logging.error(f"'{source_key}' 엑셀 파일 열기 실패: {file_path}, 오류: {e}")
+                failures.append((source_key, f"파일 열기 오류: {e}"))
+                continue
+            with perf.span("repository.search"):
+                results = index.filter(filters)
+            if results and "오류" in results[0]:
+                no_match = no_match or results[0]
+                continue
+            all_results.extend(results)
+            result_sources.extend([source_key] * len(results))
+        if not all_results:
+            if failures:
+                all_results = [{"오류": "\n".join(f"[{source_key}] {message}" for source_key, message in failures)}]
+            else:
+                all_results = [no_match or {"오류": "주어진 조건에 맞는 업체를 찾을 수 없습니다."}]
+        return all_results, result_sources, failures
+
+    def get_business_scores(self, file_path, industry_type, announcement_date, ruleset):
+        """
+        파일의 전체 업체 경영상태 점수를 업체 순서대로 반환합니다.
+        (업종, 규칙, 공고일) 조합별로 한 번만 계산하며, 파일을 다시 읽으면 함께 버려집니다.
+        """
+        entry = self._get_entry(file_path)
+        key = (industry_type, batch_scoring.ruleset_cache_key(ruleset), str(announcement_date))
+        with self._lock:
+            scores = entry["business_scores"].get(key)
+        if scores is None:
+            with perf.span("repository.business_scores"):
+                scores = batch_scoring.calculate_business_scores(
+                    entry["companies"], industry_type, announcement_date, ruleset)
+            with self._lock:
+                entry["business_scores"][key] = scores
+        return scores
+
+    def load_configured_sources(self, config_data=None):
+        """설정 파일에 등록된 전기/통신/소방 파일을 모두 미리 읽어 둡니다."""
+        config_data = config_data if config_data is not None else config.load_config()
+        loaded = {}
+        for source_type in config.SOURCE_TYPES:
+            file_path = config_data.get(source_type)
+            if not file_path or not os.path.exists(file_path):
+                continue
+            try:
+                loaded[source_type] = len(self.get_companies(file_path))
+            except Exception as e:
+                logging.error(f"'{source_type}' 파일 사전 로딩 실패: {file_path}, 오류: {e}")
+        return loaded
+
+    def preload_sources(self, source_files=None, on_loaded=None, max_workers=None):
+        """
+        설정된 전기/통신/소방 파일을 여러 프로세스에서 동시에 읽습니다.
+        (openpyxl 파싱은 CPU 작업이라 스레드로는 GIL 때문에 동시에 돌지 않습니다)
+        파일 하나가 끝날 때마다 on_loaded(분야, 업체 수, 오류 메시지 또는 None)를 호출하고,
+        읽지 못한 파일을 {분야: 오류 메시지}로 반환합니다. (경로가 설정되지 않은 분야는 건너뜀)
+        """
+        source_files = source_files if source_files is not None else config.load_config()
+        errors = {}
+
+        def report(source_type, count, error=None):
+            if error:
+                errors[source_type] = error
+            if on_loaded:
+                on_loaded(source_type, count, error)
+
+        targets = []
+        for source_type in config.SOURCE_TYPES:
+            file_path = source_files.get(source_type)
+            if not file_path:
+                continue
+            if not os.path.exists(file_path):
+                report(source_type, 0, f"파일을 찾을 수 없습니다: {file_path}")
+                continue
+            if self._is_fresh(file_path):
+                try:
+                    report(source_type, len(self.get_companies(file_path)))
+                except Exception as e:
+                    logging.error(f"'{source_type}' 파일 사전 로딩 실패: {file_path}, 오류: {e}")
+                    report(source_type, 0, str(e))
+                continue
+            targets.append((source_type, file_path))
+
+        if not targets:
+            return errors
+
+        workers = max_workers or min(len(targets), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_load_source, file_path): (source_type, file_path)
+                       for source_type, file_path in targets}
+            for future in as_completed(futures):
+                source_type, file_path = futures[future]
+                try:
+                    fingerprint, index = future.result()
+                except Exception as e:
+                    logging.error(f"'{source_type}' 파일 사전 로딩 실패: {file_path}, 오류: {e}")
+                    report(source_type, 0, str(e))
+                    continue
+                self._install_entry(file_path, fingerprint, index)
+                report(source_type, len(index.companies))
+        return errors
+
+    def refresh(self, file_path=None):
+        """메모리에 보관한 데이터를 버립니다. file_path가 없으면 전체를 비웁니다."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(file_path), None)
+        calculation_logic.clear_business_score_cache()
+
+    def is_loaded(self, file_path):
+        with self._lock:
+            return os.path.abspath(file_path) in self._entries
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_repository():
+    """프로세스 전체에서 공유하는 CompanyRepository 인스턴스를 반환합니다."""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = CompanyRepository()
+        return _repository
@@ -5,6 +5,9 @@ import os
 CONFIG_FILE = "config.json"
 STATUS_FILE = "data_status.json"
 
+# 업체 자료 엑셀 파일의 종류 (config.json의 키와 동일)
+SOURCE_TYPES = ["전기", "통신", "소방"]
+
 RELATIVE_OFFSETS = {
     "대표자": 1, "사업자번호": 2, "지역": 3, "시평": 4, 
     "3년 실적": 5, "5년 실적": 6, "부채비율": 7, "유동비율": 8, 
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QSize, QMimeData, QTimer, QEvent
 from PySide6.QtGui import QDrag, QDoubleValidator, QPixmap, QFont
 import calculation_logic
+import consortium_optimizer
 from ui_pyside.company_select_popup import CompanySelectPopupPyside
 from ui_pyside.enter_key_guard import EnterToFinishFilter
 
@@ -103,7 +104,8 @@ class CompanyItemWidget(QWidget):
         drag = QDrag(self); mime_data = QMimeData(); encoded_data = pickle.dumps(self.company_data)
         mime_data.setData('application/x-company-data', encoded_data); drag.setMimeData(mime_data)
         pixmap = self.grab(); drag.setPixmap(pixmap); drag.setHotSpot(event.position().toPoint())
-        if drag.exec(Qt.DropAction.MoveAction) == Qt.DropAction.MoveAction: self.deleteLater()
+        # 옮겨진 경우 삭제 요청으로 처리해야 원래 협정도 바로 다시 계산됩니다.
+        if drag.exec(Qt.DropAction.MoveAction) == Qt.DropAction.MoveAction: self.delete_requested.emit(self)
 
     def _set_view_mode(self):
         share_value = self.company_data.get('share', 0) * 100
@@ -210,6 +212,10 @@ class ConsortiumManagerDialog(QDialog):
         """)
         self.calculation_context = calculation_context
         self.scoreboard_labels = []
+        # 협정별 마지막 계산 시점의 (업체, 지분) 구성 - 바뀐 협정만 다시 계산하기 위해 보관
+        self._consortium_signatures = {}
+        # 업체별 경영상태 점수 (공고 조건이 고정이므로 모든 협정이 함께 사용)
+        self._business_score_cache = {}
 
         container_widget = QWidget()
         container_widget.setStyleSheet("background: transparent;")
@@ -234,10 +240,15 @@ class ConsortiumManagerDialog(QDialog):
             scoreboard_label.setStyleSheet("font-size: 8pt; color: #555; padding: 2px 5px; border-top: 1px solid #eee;")
             self.scoreboard_labels.append(scoreboard_label)
 
+            optimize_button = QPushButton("지분 최적화")
+            optimize_button.setToolTip("업체 구성은 그대로 두고 예상점수가 가장 높은 지분 배분을 찾습니다.")
+            optimize_button.clicked.connect(lambda checked=False, index=i: self.optimize_consortium_shares(index))
+
             group_main_layout = QVBoxLayout(group_box)
             group_main_layout.setContentsMargins(1, 15, 1, 1)
             group_main_layout.addWidget(list_scroll_area)
             group_main_layout.addWidget(scoreboard_label)
+            group_main_layout.addWidget(optimize_button)
             consortiums_area_layout.addWidget(group_box)
 
             for company_data in details_list:
@@ -347,7 +358,9 @@ class ConsortiumManagerDialog(QDialog):
             if deleted_from_layout:
                 break
 
-        # 2. 위젯을 화면에서 제거합니다.
+        # 2. 위젯을 화면에서 제거합니다. (재계산이 삭제된 업체를 보지 않도록 레이아웃에서 먼저 뺍니다)
+        if deleted_from_layout:
+            deleted_from_layout.removeWidget(widget_to_delete)
         widget_to_delete.deleteLater()
 
         # ▼▼▼ [버그 수정 2] '대기열'이 아닌, 실제 협정 레이아웃에서 삭제됐을 때만 재계산 ▼▼▼
@@ -357,7 +370,6 @@ class ConsortiumManagerDialog(QDialog):
     def _handle_data_update(self, widget, new_data):
         # 1. 위젯이 가지고 있는 내부 데이터를 먼저 업데이트합니다.
         widget.company_data = new_data
-        print(f"데이터 업데이트: {new_data['name']}의 지분이 {new_data['share']:.2%}로 변경됨")
 
         # 2. 변경이 일어난 위젯이 어느 레이아웃에 속해있는지 찾습니다.
         updated_layout = None
@@ -369,15 +381,9 @@ class ConsortiumManagerDialog(QDialog):
             if updated_layout:
                 break
 
-        # ▼▼▼ [진단 코드] 어느 목록에서 업데이트가 발생했는지 출력 ▼▼▼
+        # '협정' 목록에서 바뀐 경우에만 재계산합니다. ('대기중인 업체' 목록은 점수와 무관)
         if updated_layout in self.consortium_layouts:
-            print(" -> [진단] '협정' 목록에서 변경이 감지되었습니다. 재계산을 실행합니다.")
             self.recalculate_and_refresh_all()
-        elif updated_layout == self.standby_layout:
-            print(" -> [진단] '대기중인 업체' 목록에서 변경이 감지되었습니다. 재계산을 실행하지 않습니다.")
-        else:
-            print(" -> [진단] 변경이 발생한 목록을 찾을 수 없습니다.")
-        # ▲▲▲▲▲ [진단 코드] 여기까지 ▲▲▲▲▲
 
     def get_results(self):
         final_consortiums_details = []
@@ -390,13 +396,23 @@ class ConsortiumManagerDialog(QDialog):
             final_consortiums_details.append(consortium_details)
         return final_consortiums_details
 
-    def recalculate_single_consortium(self, index):
+    def _consortium_companies(self, index):
         layout = self.consortium_layouts[index]
         companies_data = []
         for j in range(layout.count()):
             widget = layout.itemAt(j).widget()
             if isinstance(widget, CompanyItemWidget):
                 companies_data.append(widget.company_data)
+        return companies_data
+
+    @staticmethod
+    def _consortium_signature(companies_data):
+        return tuple((comp.get('role'), comp.get('name'), comp.get('source_type'), comp.get('share', 0))
+                     for comp in companies_data)
+
+    def recalculate_single_consortium(self, index):
+        companies_data = self._consortium_companies(index)
+        self._consortium_signatures[index] = self._consortium_signature(companies_data)
 
         if not companies_data:
             self.scoreboard_labels[index].setText("구성된 업체가 없습니다.")
@@ -405,9 +421,10 @@ class ConsortiumManagerDialog(QDialog):
         try:
             context_for_calc = self.calculation_context.copy()
             context_for_calc.pop('field_to_search', None)
+            context_for_calc.pop('duty_ratio', None)
 
             new_result = calculation_logic.calculate_consortium(
-                companies_data, **context_for_calc
+                companies_data, business_score_cache=self._business_score_cache, **context_for_calc
             )
             if new_result:
                 biz_score = new_result.get('final_business_score', 0)
@@ -424,8 +441,46 @@ class ConsortiumManagerDialog(QDialog):
         return {}
 
     def recalculate_and_refresh_all(self):
+        """업체 구성이나 지분이 바뀐 협정만 다시 계산합니다."""
         for i in range(len(self.consortium_layouts)):
-            self.recalculate_single_consortium(i)
+            signature = self._consortium_signature(self._consortium_companies(i))
+            if self._consortium_signatures.get(i) != signature:
+                self.recalculate_single_consortium(i)
+
+    def optimize_consortium_shares(self, index):
+        """협정의 업체 구성은 그대로 두고, 예상점수가 가장 높은 지분 배분을 찾아 적용합니다."""
+        layout = self.consortium_layouts[index]
+        widgets = [layout.itemAt(j).widget() for j in range(layout.count())
+                   if isinstance(layout.itemAt(j).widget(), CompanyItemWidget)]
+        if not widgets:
+            QMessageBox.warning(self, "지분 최적화", "구성된 업체가 없습니다.")
+            return
+
+        context_for_calc = self.calculation_context.copy()
+        context_for_calc.pop('field_to_search', None)
+        duty_ratio = context_for_calc.pop('duty_ratio', None)
+        optimized = consortium_optimizer.optimize_shares(
+            [widget.company_data for widget in widgets], duty_ratio=duty_ratio,
+            min_share=consortium_optimizer.MIN_MEMBER_SHARE, **context_for_calc
+        )
+        if "오류" in optimized:
+            QMessageBox.warning(self, "지분 최적화", optimized["오류"])
+            return
+
+        lines = [f"{widget.company_data.get('name', '')}: {widget.company_data.get('share', 0):.2%} → {share:.2%}"
+                 for widget, share in zip(widgets, optimized['shares'])]
+        reply = QMessageBox.question(self, "지분 최적화",
+                                     "예상점수가 가장 높은 지분 배분입니다.\n\n" + "\n".join(lines) +
+                                     f"\n\n예상점수: {optimized['expected_score']:.4f}\n이 지분으로 변경하시겠습니까?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.Yes)
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        for widget, share in zip(widgets, optimized['shares']):
+            widget.company_data['share'] = share
+            widget._set_view_mode()
+        self.recalculate_single_consortium(index)
 
     def _on_company_selected_from_popup(self, selected_data):
         import utils
@@ -0,0 +1,246 @@
+# consortium_optimizer.py
+# 정해진 업체 구성과 공고 조건에서 예상점수(expected_score)가 가장 높은 지분 배분을 찾습니다.
+#
+# 예상점수 = Σ(경영점수 × 지분) + 시공경험 점수(Σ(5년 실적 × 지분)) + 65 이고,
+# 시공경험 점수표는 계단 함수이므로 점수 구간(breakpoint)마다 나누어 보면 목표식이 지분에 대한 1차식이 됩니다.
+# 각 구간에서 선형계획 문제를 꼭짓점 열거로 풀고, 가장 좋은 구간의 해를 화면 입력 단위(0.01%)로 맞춘 뒤
+# calculate_consortium으로 다시 계산해 최종 결과를 돌려줍니다.
+from itertools import combinations, product
+
+import numpy as np
+
+import utils
+import batch_scoring
+import calculation_logic
+from config import CONSORTIUM_RULES, PERFORMANCE_SCORE_TABLE
+
+_EPS = 1e-9
+MIN_MEMBER_SHARE = 0.01  # 화면의 지분 최적화에서 구성 업체마다 보장하는 최소 지분 (1%)
+
+
+def member_arrays(companies_data, announcement_date, ruleset):
+    """업체별 경영점수, 5년 실적, 시평액을 배열로 만듭니다. (calculate_consortium과 같은 방식으로 읽음)"""
+    business_scores = []
+    for comp in companies_data:
+        industry_type = comp.get('source_type', '전기')
+        details = batch_scoring.calculate_business_scores([comp.get('data', {})], industry_type,
+                                                          announcement_date, ruleset)[0]
+        business_scores.append(details.get('total', 0))
+    performances = utils.parse_amounts(comp.get('data', {}).get("5년 실적", 0) for comp in companies_data)
+    sipyungs = utils.parse_amounts(comp.get('data', {}).get("시평", 0) for comp in companies_data)
+    return (np.array(business_scores, dtype=float), np.nan_to_num(performances, nan=0.0),
+            np.nan_to_num(sipyungs, nan=0.0))
+
+
+def performance_scores(ruleset, totals, base_amount):
+    """_calculate_performance_score의 점수를 실적 합계 배열 전체에 대해 계산합니다."""
+    totals = np.asarray(totals, dtype=float)
+    method = ruleset.get("performance_method")
+    if method == "ratio_table":
+        ratios = totals / base_amount * 100 if base_amount > 0 else np.zeros_like(totals)
+        table = PERFORMANCE_SCORE_TABLE.get(ruleset.get("performance_score_table_id"), [])
+        scores = batch_scoring.lookup_scores(ratios, table, lower_is_better=False)
+        return np.where(scores > 0, scores, ruleset.get("performance_base_score", 0.0))
+    if method == "direct_formula_v1":
+        params = ruleset.get("performance_params", {})
+        max_score = params.get("max_score", 15.0)
+        scores = totals / (base_amount * params.get("base_multiplier", 1.0)) * max_score
+        return np.minimum(scores, max_score)
+    return np.zeros_like(totals)
+
+
+def performance_breakpoints(ruleset, base_amount):
+    """시공경험 점수 계산식이 바뀌는 실적 합계(원)를 오름차순으로 반환합니다."""
+    method = ruleset.get("performance_method")
+    if method == "direct_formula_v1":
+        return [base_amount * ruleset.get("performance_params", {}).get("base_multiplier", 1.0)]
+    if method == "ratio_table" and base_amount > 0:
+        table = PERFORMANCE_SCORE_TABLE.get(ruleset.get("performance_score_table_id"), [])
+        # (float('inf'), 점수) 같은 마지막 등급 표시는 경계가 아니므로 제외합니다.
+        return sorted({threshold * base_amount / 100 for threshold, _ in table if np.isfinite(threshold)})
+    return []
+
+
+def _performance_pieces(ruleset, business_scores, performances, base_amount):
+    """
+    실적 합계 구간별로 (하한, 상한, 지분 계수, 상수) 조각을 만듭니다.
+    각 조각 안에서 예상점수(입찰점수 제외) = 계수 · 지분 + 상수 입니다.
+    """
+    breakpoints = performance_breakpoints(ruleset, base_amount)
+    if ruleset.get("performance_method") == "direct_formula_v1":
+        max_score = ruleset.get("performance_params", {}).get("max_score", 15.0)
+        cap = breakpoints[0]
+        # 만점 기준 실적까지는 실적에 비례, 그 이후는 만점
+        return [(None, cap, business_scores + performances * (max_score / cap), 0.0),
+                (cap, None, business_scores, max_score)]
+
+    bounds = [None] + breakpoints + [None]
+    pieces = []
+    for lower, upper in zip(bounds[:-1], bounds[1:]):
+        sample = lower if lower is not None else (upper - 1 if upper is not None else 0.0)
+        score = float(performance_scores(ruleset, [sample], base_amount)[0])
+        pieces.append((lower, upper, business_scores, score))
+    return pieces
+
+
+def _best_vertex(objective, inequalities, bounds_rhs):
+    """
+    Σ지분 = 1, A·x <= c 조건에서 objective·x가 최대인 꼭짓점을 찾습니다. (가능한 해가 없으면 None)
+    업체 수(n)가 작으므로 n-1개의 제약을 등호로 두는 조합을 한꺼번에 풀어 비교합니다.
+    """
+    n = len(objective)
+    A, c = np.array(inequalities, dtype=float), np.array(bounds_rhs, dtype=float)
+    if n == 1:
+        x = np.ones(1)
+        return x if np.all(A @ x <= c + _EPS * (1 + np.abs(c))) else None
+
+    combos = np.array(list(combinations(range(len(A)), n - 1)))
+    matrices = np.empty((len(combos), n, n))
+    matrices[:, 0, :] = 1.0
+    matrices[:, 1:, :] = A[combos]
+    rhs = np.empty((len(combos), n))
+    rhs[:, 0] = 1.0
+    rhs[:, 1:] = c[combos]
+
+    # 금액 단위 제약과 지분 단위 제약이 섞여 있으므로 행마다 크기를 맞춘 뒤 특이 행렬을 걸러냅니다.
+    scale = np.abs(matrices).max(axis=2, keepdims=True)
+    scale[scale == 0] = 1.0
+    regular = np.abs(np.linalg.det(matrices / scale)) > 1e-12
+    if not regular.any():
+        return None
+    vertices = np.linalg.solve(matrices[regular], rhs[regular][..., None])[..., 0]
+
+    slack = vertices @ A.T - c
+    feasible = np.all(slack <= _EPS * (1 + np.abs(c)), axis=1)
+    if not feasible.any():
+        return None
+    candidates = vertices[feasible]
+    return candidates[np.argmax(candidates @ objective)]
+
+
+def solve_shares(ruleset, business_scores, performances, sipyungs, price_data, sipyung_info, is_regional=None,
+                 duty_ratio=None, min_share=0.0, share_step=0.0001, fixed_shares=None):
+    """
+    배열로 준비된 업체 정보(경영점수, 5년 실적, 시평액)로 최적 지분을 구합니다.
+    is_regional은 업체별 지역업체 여부(bool 배열)이고, fixed_shares는 {업체 순번: 고정 지분}입니다.
+    (지분 배열, 입찰점수를 뺀 점수)를, 조건을 만족하는 배분이 없으면 (None, 오류 메시지)를 반환합니다.
+    """
+    n = len(business_scores)
+    base_amount = price_data.get(ruleset.get("performance_base_key", "estimation_price"), 0)
+    if ruleset.get("performance_method") == "direct_formula_v1" and not base_amount:
+        return None, "시공경험 점수 계산에 필요한 기준금액이 없습니다."
+
+    # --- 1. 지분과 관계된 조건을 A·x <= c 형태로 정리 ---
+    inequalities, rhs = [], []
+    tuchal_amount = sipyung_info.get("tuchal_amount") or price_data.get("tuchal_amount", 0)
+    upper_bounds = np.minimum(sipyungs / tuchal_amount, 1.0) if tuchal_amount > 0 else np.ones(n)
+    fixed_shares = fixed_shares or {}
+    for i in range(n):
+        row = np.zeros(n)
+        row[i] = -1.0
+        inequalities.append(row)
+        rhs.append(-fixed_shares.get(i, min_share))
+        row = np.zeros(n)
+        row[i] = 1.0
+        inequalities.append(row)
+        rhs.append(min(fixed_shares[i], upper_bounds[i]) if i in fixed_shares else upper_bounds[i])
+
+    if is_regional is not None and duty_ratio:
+        inequalities.append(-np.asarray(is_regional, dtype=float))
+        rhs.append(-duty_ratio / 100.0)
+
+    if sipyung_info.get("is_limited") and sipyung_info.get("method", "비율제") == "비율제":
+        inequalities.append(-sipyungs)
+        rhs.append(-sipyung_info.get("limit_amount", 0))
+
+    # --- 2. 시공경험 점수 구간별로 최적 꼭짓점을 찾고, 높은 구간부터 살펴 가망 없는 구간은 건너뜀 ---
+    pieces = _performance_pieces(ruleset, business_scores, performances, base_amount)
+    pieces.sort(key=lambda piece: piece[3] + piece[2].max(), reverse=True)
+    best_score, best_vertices = -np.inf, []
+    for lower, upper, coefficients, constant in pieces:
+        if constant + coefficients.max() < best_score - _EPS:
+            continue
+        piece_rows, piece_rhs = list(inequalities), list(rhs)
+        if lower is not None:
+            piece_rows.append(-performances)
+            piece_rhs.append(-lower)
+        if upper is not None:
+            piece_rows.append(performances)
+            piece_rhs.append(upper)
+        vertex = _best_vertex(coefficients, piece_rows, piece_rhs)
+        if vertex is None:
+            continue
+        best_vertices.append(vertex)
+        best_score = max(best_score, float(vertex @ coefficients) + constant)
+
+    if not best_vertices:
+        return None, "시평액/의무비율 조건을 모두 만족하는 지분 배분이 없습니다."
+
+    # --- 3. 입력 단위(기본 0.01%)로 맞추기: 내림한 값 주변 조합 중 조건을 지키는 최고점 선택 ---
+    A, c = np.array(inequalities), np.array(rhs)
+    units = int(round(1 / share_step))
+    offsets = np.array(list(product((-1, 0, 1, 2), repeat=n)))
+    best_shares, best_total = None, -np.inf
+    for vertex in best_vertices:
+        candidates = np.floor(vertex * units + _EPS) + offsets
+        candidates = candidates[(candidates.sum(axis=1) == units) & np.all(candidates >= 0, axis=1)] / units
+        candidates = candidates[np.all(candidates @ A.T <= c + _EPS * (1 + np.abs(c)), axis=1)]
+        if not len(candidates):
+            continue
+        totals = candidates @ business_scores + performance_scores(ruleset, candidates @ performances, base_amount)
+        pick = int(np.argmax(totals))
+        if totals[pick] > best_total:
+            best_total, best_shares = float(totals[pick]), candidates[pick]
+
+    if best_shares is None:
+        return None, f"지분을 {share_step * 100:g}% 단위로 맞추면 조건을 만족하는 배분이 없습니다."
+    return best_shares, best_total
+
+
+def optimize_shares(companies_data, price_data, announcement_date, rule_info, sipyung_info, region_limit,
+                    duty_ratio=None, min_share=0.0, share_step=0.0001):
+    """
+    예상점수가 가장 높은 지분 배분을 찾습니다.
+    companies_data는 calculate_consortium과 같은 형식이며, 지분(share)은 0~1 사이의 소수입니다.
+
+    지켜야 할 조건:
+      - 업체별 지분 >= min_share (0이면 지분 0%인 업체가 나올 수 있으므로 화면에서는 MIN_MEMBER_SHARE를 넘김)
+      - 업체별 지분 <= 시평액 / 투찰금액 (check_share_limit, 30억이상 개별 시평액 검증)
+      - 지역업체 지분 합계 >= 의무비율(%) (check_regional_requirements, 지역제한이 있을 때)
+      - 비율제 시평액 제한: Σ(시평액 × 지분) >= 제한금액 (calculate_consortium의 시평액 검증과 같은 식)
+    합산제 시평액 제한처럼 지분과 무관한 조건은 결과(calculate_consortium)의 검증 항목으로만 표시됩니다.
+
+    성공하면 {"shares": [...], "expected_score": ..., "result": calculate_consortium 결과}를,
+    실패하면 {"오류": 메시지}를 반환합니다.
+    """
+    try:
+        ruleset = CONSORTIUM_RULES[rule_info[0]][rule_info[1]]
+    except KeyError:
+        return {"오류": f"{rule_info}에 해당하는 규칙을 찾을 수 없습니다."}
+    if not companies_data or not price_data:
+        return {"오류": "지분을 배분할 업체가 없습니다."}
+
+    business_scores, performances, sipyungs = member_arrays(companies_data, announcement_date, ruleset)
+    is_regional = None
+    if region_limit != "전체":
+        is_regional = np.array([region_limit in comp.get('data', {}).get('지역', '') for comp in companies_data])
+
+    shares, score_or_error = solve_shares(ruleset, business_scores, performances, sipyungs, price_data, sipyung_info,
+                                          is_regional=is_regional, duty_ratio=duty_ratio, min_share=min_share,
+                                          share_step=share_step)
+    if shares is None:
+        return {"오류": score_or_error}
+
+    # 실제 계산 함수로 최종 결과 확인
+    optimized = [{**comp, 'share': round(float(share), 10)} for comp, share in zip(companies_data, shares)]
+    result = calculation_logic.calculate_consortium(optimized, price_data, announcement_date, rule_info,
+                                                    sipyung_info, region_limit)
+    if not result:
+        return {"오류": "최적 지분으로 점수를 계산하지 못했습니다."}
+
+    return {
+        "shares": [comp['share'] for comp in optimized],
+        "expected_score": result["expected_score"],
+        "regional_share": float(shares[is_regional].sum()) if is_regional is not None else None,
+        "result": result,
+    }
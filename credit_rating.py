@@ -0,0 +1,95 @@
+# credit_rating.py
+# 신용평가 문자열(예: 'A0\n(24.06.30~25.06.29)')을 (등급, 시작일, 종료일)로 한 번만 해석해 두고,
+# 공고일 기준 유효 여부를 바로 판정합니다.
+# 업체 목록 전체는 CreditRatingIndex로 색인해 "공고일에 유효한 신용평가를 가진 업체"를 한 번의 범위 조회로 찾습니다.
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# 등급 뒤 괄호 안의 평가 기간. 구분자는 . / - 중 하나이며, 한 날짜 안에서는 같은 구분자를 써야 합니다.
+_PERIOD_PATTERN = re.compile(r'\((\d{2,4}[./-]\d{1,2}[./-]\d{1,2})~(\d{2,4}[./-]\d{1,2}[./-]\d{1,2})\)')
+_DATE_PATTERN = re.compile(r'(\d{2,4})([./-])(\d{1,2})\2(\d{1,2})')
+
+PARSE_CACHE_SIZE = 65536
+
+
+class CreditRating(NamedTuple):
+    grade: Optional[str]  # 'A0', 'BBB+' 등 (점수표 조회용, 대문자)
+    start: Optional[date]
+    end: Optional[date]
+    error: Optional[str]  # None, '자료없음', '형식오류'
+
+
+def _parse_date(text):
+    """'2024.06.30', '24/6/30' 같은 날짜를 해석합니다. 두 자리 연도는 68 이하면 2000년대, 69 이상이면 1900년대입니다."""
+    match = _DATE_PATTERN.fullmatch(text)
+    if not match:
+        raise ValueError("날짜 형식이 올바르지 않습니다.")
+    year_text, _, month_text, day_text = match.groups()
+    if len(year_text) == 4:
+        year = int(year_text)
+    elif len(year_text) == 2:
+        year = int(year_text)
+        year += 2000 if year <= 68 else 1900
+    else:
+        raise ValueError("날짜 형식이 올바르지 않습니다.")
+    return date(year, int(month_text), int(day_text))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_credit_rating(rating_str):
+    """신용평가 문자열을 CreditRating으로 해석합니다. 같은 문자열은 한 번만 해석합니다."""
+    if not rating_str or not isinstance(rating_str, str) or rating_str.strip() == "":
+        return CreditRating(None, None, None, "자료없음")
+    grade = rating_str.split()[0].strip().upper()
+
+    match = _PERIOD_PATTERN.search(rating_str.replace(" ", ""))
+    if not match:
+        return CreditRating(grade, None, None, "형식오류")
+    try:
+        start, end = _parse_date(match.group(1)), _parse_date(match.group(2))
+    except ValueError:
+        return CreditRating(grade, None, None, "형식오류")
+    return CreditRating(grade, start, end, None)
+
+
+def rating_status(rating, announcement_date):
+    """해석한 신용평가의 공고일 기준 상태('유효', '기간만료', '자료없음', '형식오류')를 반환합니다."""
+    if rating.error:
+        return rating.error
+    try:
+        return "유효" if rating.start <= announcement_date <= rating.end else "기간만료"
+    except TypeError:
+        return "형식오류"
+
+
+def credit_rating_status(rating_str, announcement_date):
+    return rating_status(parse_credit_rating(rating_str), announcement_date)
+
+
+class CreditRatingIndex:
+    """
+    업체별 신용평가 기간 색인입니다.
+    시작일/종료일 순으로 정렬해 두고, 공고일에 유효한 업체를 (시작일 <= 공고일) ∩ (종료일 >= 공고일)로 찾습니다.
+    """
+
+    def __init__(self, rating_strings):
+        self.ratings = [parse_credit_rating(text) for text in rating_strings]
+        by_start = sorted((rating.start, idx) for idx, rating in enumerate(self.ratings) if rating.error is None)
+        by_end = sorted((rating.end, idx) for idx, rating in enumerate(self.ratings) if rating.error is None)
+        self._starts, self._start_ids = [d for d, _ in by_start], [idx for _, idx in by_start]
+        self._ends, self._end_ids = [d for d, _ in by_end], [idx for _, idx in by_end]
+
+    def status(self, idx, announcement_date):
+        """업체 번호의 공고일 기준 신용평가 상태 (O(1))"""
+        return rating_status(self.ratings[idx], announcement_date)
+
+    def valid_ids(self, announcement_date):
+        """공고일에 유효한 신용평가를 가진 업체 번호 집합을 반환합니다."""
+        started = self._start_ids[:bisect_right(self._starts, announcement_date)]
+        not_ended = self._end_ids[bisect_left(self._ends, announcement_date):]
+        if len(started) > len(not_ended):
+            started, not_ended = not_ended, started
+        return set(started).intersection(not_ended)
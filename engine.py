@@ -0,0 +1,242 @@
+# engine.py
+# 화면(Qt) 없이 업체 검색, 협정 점수 계산, 결과 저장을 실행하는 함수 모음입니다.
+# 화면에서는 입력칸 글자를 읽어 계산 인자를 만들지만, 여기서는 같은 인자를 명세(dict/JSON)에서 만듭니다.
+# bidding_cli.py와 야간 일괄 작업, 벤치마크에서 사용하며 GUI 모듈은 import하지 않습니다.
+import os
+import json
+from datetime import date, datetime
+
+from openpyxl import Workbook
+
+import config
+import utils
+import session_store
+import batch_rescoring
+import report_writer
+from company_record import json_default
+from company_repository import get_repository
+
+# 행안부 화면의 투찰율/사정율 기본값 (예상 투찰금액 = 기초금액 × 투찰율 × 사정율)
+DEFAULT_TUCHAL_RATE = 88.745
+DEFAULT_SAJUNG_RATE = 101.8
+SIPYUNG_METHODS = ("비율제", "합산제")
+
+# 검색 조건 키 (search_logic.filter_companies / CompanyIndex.filter와 같음)
+AMOUNT_FILTER_KEYS = ("min_sipyung", "max_sipyung", "min_perf_3y", "max_perf_3y", "min_perf_5y", "max_perf_5y")
+TEXT_FILTER_KEYS = ("name", "manager", "region")
+
+COMPANY_COLUMNS = ["검색된 회사", "대표지역", *config.RELATIVE_OFFSETS.keys()]
+
+
+def source_path(source, config_data=None):
+    """'전기'/'통신'/'소방'이면 설정에 등록된 업체 파일 경로를, 그 밖에는 source를 파일 경로로 보고 반환합니다."""
+    if source in config.SOURCE_TYPES:
+        config_data = config_data if config_data is not None else config.load_config()
+        path = config_data.get(source)
+        if not path:
+            raise ValueError(f"'{source}' 업체 파일이 설정되어 있지 않습니다. (config.json)")
+    else:
+        path = source
+    if not os.path.exists(path):
+        raise ValueError(f"업체 파일을 찾을 수 없습니다: {path}")
+    return path
+
+
+def normalize_filters(filters):
+    """검색 조건의 금액('10억', '5,000만' 등)을 숫자로 바꾸고 빈 조건은 뺍니다."""
+    normalized = {}
+    for key in TEXT_FILTER_KEYS:
+        if filters.get(key):
+            normalized[key] = str(filters[key])
+    for key in AMOUNT_FILTER_KEYS:
+        value = filters.get(key)
+        if value is None or value == "":
+            continue
+        amount = value if isinstance(value, (int, float)) else utils.parse_amount(value)
+        if amount is None:
+            raise ValueError(f"검색 조건 '{key}'의 금액을 해석할 수 없습니다: {value}")
+        normalized[key] = amount
+    return normalized
+
+
+def search_companies(source, filters):
+    """
+    업체 파일에서 조건에 맞는 업체 목록을 반환합니다. (화면의 업체 검색과 같은 결과, 맞는 업체가 없으면 빈 목록)
+    파일을 읽을 수 없으면 예외를 그대로 발생시킵니다.
+    """
+    results = get_repository().get_index(source_path(source)).filter(normalize_filters(filters))
+    return [] if results and "오류" in results[0] else results
+
+
+def find_company(source, query):
+    """사업자번호 또는 회사명(법인 표기/공백 무시)이 정확히 같은 업체 하나를 찾습니다."""
+    companies = get_repository().get_companies(source_path(source))
+    query = str(query).strip()
+    matches = [comp for comp in companies if str(comp.get("사업자번호", "")).strip() == query]
+    if not matches:
+        name = utils.normalize_company_name(query)
+        matches = [comp for comp in companies if utils.normalize_company_name(comp.get("검색된 회사", "")) == name]
+    if not matches:
+        raise ValueError(f"'{source}' 업체 파일에서 '{query}' 업체를 찾을 수 없습니다.")
+    if len(matches) > 1:
+        raise ValueError(f"'{query}'와 같은 이름의 업체가 {len(matches)}곳 있습니다. 사업자번호로 지정하세요.")
+    return matches[0]
+
+
+def _amount(spec, key, required=False):
+    value = spec.get(key)
+    if value is None or value == "":
+        if required:
+            raise ValueError(f"'{key}' 값이 필요합니다.")
+        return 0
+    amount = value if isinstance(value, (int, float)) else utils.parse_amount(value)
+    if amount is None:
+        raise ValueError(f"'{key}' 금액을 해석할 수 없습니다: {value}")
+    return amount
+
+
+def tuchal_amount(base_amount, tuchal_rate=DEFAULT_TUCHAL_RATE, sajung_rate=DEFAULT_SAJUNG_RATE):
+    """예상 투찰금액 = 기초금액 × 투찰율(%) × 사정율(%). 값이 하나라도 0 이하면 0."""
+    if base_amount > 0 and tuchal_rate > 0 and sajung_rate > 0:
+        return base_amount * (tuchal_rate / 100.0) * (sajung_rate / 100.0)
+    return 0
+
+
+def bid_conditions(spec):
+    """
+    공고 조건 명세를 calculate_consortium의 인자(price_data, announcement_date, rule_info, sipyung_info,
+    region_limit)로 바꿉니다. 화면의 validate_inputs와 같은 값을 만듭니다.
+
+    spec 예) {"mode": "행안부", "rule": "30억미만", "announcement_date": "2025-03-01",
+              "estimation_price": "25억", "base_amount": "27억 5,000만", "tuchal_rate": 88.745, "sajung_rate": 101.8,
+              "region_limit": "서울", "sipyung_limit": {"method": "비율제", "amount": "25억"}}
+    sipyung_limit이 true이면 화면처럼 추정가격을 제한 금액으로 씁니다. 투찰금액(tuchal_amount)을 직접 줄 수도 있습니다.
+    """
+    mode, rule = spec.get("mode"), spec.get("rule")
+    if mode not in config.CONSORTIUM_RULES or rule not in config.CONSORTIUM_RULES[mode]:
+        raise ValueError(f"심사 기준을 찾을 수 없습니다: {mode} / {rule}")
+    try:
+        announcement_date = date.fromisoformat(str(spec.get("announcement_date")))
+    except ValueError:
+        raise ValueError(f"공고일은 YYYY-MM-DD 형식이어야 합니다: {spec.get('announcement_date')}")
+
+    estimation_price = _amount(spec, "estimation_price", required=True)
+    base_amount = _amount(spec, "base_amount")
+    if spec.get("tuchal_amount") not in (None, ""):
+        tuchal = _amount(spec, "tuchal_amount")
+    else:
+        tuchal = tuchal_amount(base_amount, float(spec.get("tuchal_rate", DEFAULT_TUCHAL_RATE)),
+                               float(spec.get("sajung_rate", DEFAULT_SAJUNG_RATE)))
+    price_data = {"estimation_price": estimation_price, "notice_base_amount": base_amount, "tuchal_amount": tuchal}
+
+    sipyung_limit = spec.get("sipyung_limit") or False
+    if sipyung_limit is True:
+        sipyung_limit = {}
+    sipyung_info = {"is_limited": sipyung_limit is not False, "limit_amount": 0, "method": "비율제",
+                    "tuchal_amount": tuchal}
+    if sipyung_info["is_limited"]:
+        method = sipyung_limit.get("method", "비율제")
+        if method not in SIPYUNG_METHODS:
+            raise ValueError(f"시평액 제한 방식은 {'/'.join(SIPYUNG_METHODS)} 중 하나여야 합니다: {method}")
+        sipyung_info["method"] = method
+        sipyung_info["limit_amount"] = _amount(sipyung_limit, "amount") or estimation_price
+
+    return {"price_data": price_data, "announcement_date": announcement_date, "rule_info": (mode, rule),
+            "sipyung_info": sipyung_info, "region_limit": spec.get("region_limit") or "전체"}
+
+
+def build_consortium(members, default_source=None):
+    """
+    업체 명세 목록을 calculate_consortium의 companies_data로 바꿉니다.
+    members 예) [{"company": "가나전기", "source": "전기", "share": 60}, {"company": "123-45-67890", "share": 40}]
+    share는 화면과 같이 지분율(%)이며, role을 생략하면 첫 업체가 대표사, 나머지가 구성사 1, 2...가 됩니다.
+    """
+    companies_data = []
+    for position, member in enumerate(members):
+        source = member.get("source") or default_source
+        if not source:
+            raise ValueError(f"업체 '{member.get('company')}'의 업체 파일(source)이 지정되지 않았습니다.")
+        companies_data.append({
+            "role": member.get("role") or ("대표사" if position == 0 else f"구성사 {position}"),
+            "data": find_company(source, member["company"]),
+            "share": float(member.get("share", 0)) / 100.0,
+            "source_type": member.get("source_type") or (source if source in config.SOURCE_TYPES else "전기"),
+        })
+    return companies_data
+
+
+def load_saved_consortiums(path):
+    """저장된 협정 파일 하나의 (저장 내용, 협정별 companies_data 목록)을 반환합니다."""
+    session = session_store.read_session(os.path.dirname(path) or ".", os.path.basename(path))
+    return session, batch_rescoring.collect_consortiums([session])
+
+
+def score_consortiums(consortiums, conditions, max_workers=None, on_result=None):
+    """협정 목록을 같은 공고 조건으로 계산합니다. 협정이 많으면 여러 프로세스에서 동시에 계산합니다."""
+    return batch_rescoring.rescore_consortiums(consortiums, conditions, on_result=on_result, max_workers=max_workers)
+
+
+def score_spec(spec, saved_files=(), max_workers=None):
+    """
+    명세의 공고 조건으로 명세의 협정(consortiums)과 저장된 협정 파일(saved_files)의 협정을 모두 계산합니다.
+    (계산 결과 목록, 공고 조건)을 반환합니다. 계산에 실패한 협정은 결과가 None입니다.
+    """
+    conditions = bid_conditions(spec)
+    consortiums = [build_consortium(members, spec.get("source")) for members in spec.get("consortiums", [])]
+    for path in saved_files:
+        consortiums.extend(load_saved_consortiums(path)[1])
+    if not consortiums:
+        raise ValueError("계산할 협정이 없습니다. (consortiums 또는 저장 파일을 지정하세요)")
+    return score_consortiums(consortiums, conditions, max_workers=max_workers), conditions
+
+
+def report_header(spec, conditions):
+    """보고서 상단 정보 (report_writer.write_report의 header)"""
+    return {"estimation_price": conditions["price_data"]["estimation_price"], "gongo_no": spec.get("gongo_no", ""),
+            "gongo_title": spec.get("gongo_title", ""), "bid_opening": spec.get("bid_opening"),
+            "region_limit": conditions["region_limit"]}
+
+
+def _json_default(obj):
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return json_default(obj)
+
+
+def write_json(data, path):
+    """결과를 JSON으로 저장합니다. (업체 레코드, 날짜 포함 가능)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False, default=_json_default)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_companies_xlsx(companies, path):
+    """검색 결과 업체 목록을 한 업체 한 행의 엑셀 표로 저장합니다."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("검색 결과")
+    ws.append(COMPANY_COLUMNS)
+    for comp in companies:
+        ws.append([comp.get(column, "") for column in COMPANY_COLUMNS])
+    wb.save(path)
+    return path
+
+
+def write_score_report(results, spec, conditions, path, template=None):
+    """계산 결과를 행안부 보고서 양식 엑셀로 저장합니다."""
+    return report_writer.write_report([result for result in results if result], report_header(spec, conditions),
+                                      path, template=template)
+
+
+def summarize_result(result):
+    """협정 계산 결과에서 명령줄 출력/요약용 값만 꺼냅니다."""
+    return {
+        "members": [{"role": detail.get("role"), "name": detail.get("name"), "share": detail.get("share")}
+                    for detail in result.get("company_details", [])],
+        "final_business_score": result.get("final_business_score"),
+        "final_performance_score": result.get("final_performance_score"),
+        "expected_score": result.get("expected_score"),
+        "solo_bid_possible": [item["name"] for item in result.get("solo_bid_results", []) if item.get("possible")],
+        "sipyung_check": result.get("sipyung_check_result", {}).get("message"),
+    }
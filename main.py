@@ -1,5 +1,6 @@
 # main.py
 import sys
+import multiprocessing
 from PySide6.QtWidgets import QApplication
 import config
 from ui_pyside.main_window import MainWindow
@@ -26,4 +27,5 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # 업체 자료 병렬 로딩(프로세스 풀)을 exe 빌드에서도 쓰기 위해 필요
     main()
\ No newline at end of file
@@ -0,0 +1,160 @@
+# partner_recommender.py
+# 대표사와 공고 조건이 정해졌을 때, 업체 파일의 모든 업체를 구성사 후보로 두고 협정 예상점수가 높은 순으로 추천합니다.
+# 후보마다 최적 지분(consortium_optimizer)으로 점수를 계산하되, 점수 상한을 먼저 구해
+# 현재 상위 k개를 넘을 수 없는 후보는 계산하지 않고 건너뜁니다.
+import heapq
+
+import numpy as np
+
+import calculation_logic
+import consortium_optimizer
+from company_repository import get_repository
+from config import CONSORTIUM_RULES
+
+_EPS = 1e-9
+
+
+def _performance_upper_bounds(ruleset, lows, highs, base_amount):
+    """실적 합계가 [lows, highs] 범위일 때 받을 수 있는 시공경험 점수의 최댓값을 후보별로 구합니다."""
+    bounds = [consortium_optimizer.performance_scores(ruleset, lows, base_amount),
+              consortium_optimizer.performance_scores(ruleset, highs, base_amount)]
+    # 점수는 경계 사이에서 일정하므로 양 끝과 범위 안의 경계값만 보면 됩니다.
+    for breakpoint in consortium_optimizer.performance_breakpoints(ruleset, base_amount):
+        inside = (lows <= breakpoint) & (breakpoint <= highs)
+        if inside.any():
+            score = consortium_optimizer.performance_scores(ruleset, [breakpoint], base_amount)[0]
+            bounds.append(np.where(inside, score, -np.inf))
+    return np.max(bounds, axis=0)
+
+
+def _feasible_candidates(leader_value, candidate_values, required):
+    """
+    대표사 지분 s에 대해 leader_value·s + candidate_value·(1-s) >= required 를 만족하는 s의 범위를 후보별로 구합니다.
+    (하한 배열, 상한 배열)을 반환합니다.
+    """
+    slope = leader_value - candidate_values
+    needed = required - candidate_values
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bound = needed / slope
+    lows = np.where(slope > 0, bound, np.where((slope == 0) & (needed > _EPS), np.inf, -np.inf))
+    highs = np.where(slope < 0, bound, np.inf)
+    return lows, highs
+
+
+def recommend_partners(leader, source_type, file_path, price_data, announcement_date, rule_info, sipyung_info,
+                       region_limit, duty_ratio=None, leader_share=None, top_k=10, exclude_names=(),
+                       min_share=consortium_optimizer.MIN_MEMBER_SHARE):
+    """
+    대표사(leader, calculate_consortium의 업체 항목 형식)와 짝을 이룰 구성사를 추천합니다.
+    leader_share를 주면 대표사 지분을 고정하고, 없으면 두 업체의 지분까지 함께 최적화합니다.
+    두 업체 모두 지분이 min_share 이상이 되도록 나눕니다. (대표사 혼자 점수가 가장 높아도 구성사 지분이 0이 되지 않음)
+
+    예상점수 내림차순으로 [{"company": 업체, "shares": [대표사, 구성사], "expected_score": ..., "result": ...}]를,
+    오류가 있으면 [{"오류": 메시지}]를 반환합니다.
+    """
+    try:
+        ruleset = CONSORTIUM_RULES[rule_info[0]][rule_info[1]]
+    except KeyError:
+        return [{"오류": f"{rule_info}에 해당하는 규칙을 찾을 수 없습니다."}]
+    if not leader or not leader.get('data'):
+        return [{"오류": "대표사를 먼저 선택해주세요."}]
+    if leader_share is not None and not min_share - _EPS <= leader_share <= 1 - min_share + _EPS:
+        return [{"오류": f"대표사 지분은 {min_share:.0%} 이상 {1 - min_share:.0%} 이하여야 구성사를 추천할 수 있습니다."}]
+
+    base_amount = price_data.get(ruleset.get("performance_base_key", "estimation_price"), 0)
+    if ruleset.get("performance_method") == "direct_formula_v1" and not base_amount:
+        return [{"오류": "시공경험 점수 계산에 필요한 기준금액이 없습니다."}]
+
+    repository = get_repository()
+    try:
+        index = repository.get_index(file_path)
+        business_details = repository.get_business_scores(file_path, source_type, announcement_date, ruleset)
+    except Exception as e:
+        return [{"오류": f"파일 열기 오류: {e}"}]
+
+    # --- 1. 후보 전체를 배열로 준비 (경영점수는 저장소에 미리 계산된 값을 사용) ---
+    companies = index.companies
+    leader_scores, leader_perfs, leader_sipyungs = consortium_optimizer.member_arrays(
+        [leader], announcement_date, ruleset)
+    leader_business, leader_perf = leader_scores[0], leader_perfs[0]
+    business_scores = np.array([details.get('total', 0) for details in business_details], dtype=float)
+    performances = np.nan_to_num(index.numeric_columns["5년 실적"], nan=0.0)
+    sipyungs = np.nan_to_num(index.numeric_columns["시평"], nan=0.0)
+
+    excluded = {leader['data'].get("검색된 회사")} | set(exclude_names)
+    candidate_ids = [idx for idx, comp in enumerate(companies)
+                     if comp.get("검색된 회사") and comp.get("검색된 회사") not in excluded]
+    if not candidate_ids:
+        return [{"오류": "추천할 후보 업체가 없습니다."}]
+
+    leader_regional, candidate_regional = None, None
+    if region_limit != "전체":
+        leader_regional = region_limit in leader['data'].get('지역', '')
+        candidate_regional = [region_limit in comp.get('지역', '') for comp in companies]
+
+    # --- 2. 지분을 어떻게 나누어도 조건을 못 맞추는 후보는 미리 제외 (두 업체면 조건이 모두 s의 구간으로 표현됨) ---
+    share_lows = np.full(len(companies), min_share if leader_share is None else leader_share)
+    share_highs = np.full(len(companies), 1 - min_share if leader_share is None else leader_share)
+    tuchal_amount = sipyung_info.get("tuchal_amount") or price_data.get("tuchal_amount", 0)
+    conditions = []
+    if tuchal_amount > 0:
+        # 업체별 지분 <= 시평액 / 투찰금액  (대표사: -s >= -한도, 구성사: -(1-s) >= -한도)
+        conditions.append((-1.0, np.zeros(len(companies)), -leader_sipyungs[0] / tuchal_amount))
+        conditions.append((0.0, np.full(len(companies), -1.0), -sipyungs / tuchal_amount))
+    if candidate_regional is not None and duty_ratio:
+        conditions.append((float(leader_regional), np.array(candidate_regional, dtype=float), duty_ratio / 100.0))
+    if sipyung_info.get("is_limited") and sipyung_info.get("method", "비율제") == "비율제":
+        conditions.append((leader_sipyungs[0], sipyungs, sipyung_info.get("limit_amount", 0)))
+    for leader_value, candidate_values, required in conditions:
+        lows, highs = _feasible_candidates(leader_value, candidate_values, required)
+        share_lows, share_highs = np.maximum(share_lows, lows), np.minimum(share_highs, highs)
+    feasible = share_lows <= share_highs + _EPS
+    candidate_ids = [idx for idx in candidate_ids if feasible[idx]]
+
+    # --- 3. 후보별 점수 상한: 지분을 어떻게 나누어도 넘을 수 없는 값 ---
+    if leader_share is not None:
+        business_upper = leader_share * leader_business + (1 - leader_share) * business_scores
+        lows = highs = leader_share * leader_perf + (1 - leader_share) * performances
+    else:
+        business_upper = np.maximum(leader_business, business_scores)
+        lows, highs = np.minimum(leader_perf, performances), np.maximum(leader_perf, performances)
+    upper_bounds = business_upper + _performance_upper_bounds(ruleset, lows, highs, base_amount)
+
+    # --- 4. 상한이 높은 후보부터 실제 최적 점수를 계산하고, 상위 k개를 넘을 수 없으면 중단 ---
+    fixed_shares = {0: leader_share} if leader_share is not None else None
+    top = []  # (점수, -업체 번호, 지분) 최소 힙
+    for idx in sorted(candidate_ids, key=lambda i: -upper_bounds[i]):
+        if len(top) >= top_k and upper_bounds[idx] <= top[0][0] + _EPS:
+            break
+        is_regional = np.array([leader_regional, candidate_regional[idx]]) if candidate_regional else None
+        shares, score = consortium_optimizer.solve_shares(
+            ruleset, np.array([leader_business, business_scores[idx]]), np.array([leader_perf, performances[idx]]),
+            np.array([leader_sipyungs[0], sipyungs[idx]]), price_data, sipyung_info, is_regional=is_regional,
+            duty_ratio=duty_ratio, min_share=min_share, fixed_shares=fixed_shares)
+        if shares is None:
+            continue
+        item = (score, -idx, shares)
+        if len(top) < top_k:
+            heapq.heappush(top, item)
+        else:
+            heapq.heappushpop(top, item)
+
+    # --- 5. 최종 후보만 calculate_consortium으로 다시 계산해 결과를 만듭니다 ---
+    recommendations = []
+    for score, neg_idx, shares in sorted(top, reverse=True):
+        company = companies[-neg_idx]
+        members = [{**leader, 'share': float(shares[0])},
+                   {'role': '구성사 1', 'name': company.get("검색된 회사", ""), 'data': company,
+                    'source_type': source_type, 'share': float(shares[1])}]
+        result = calculation_logic.calculate_consortium(members, price_data, announcement_date, rule_info,
+                                                        sipyung_info, region_limit)
+        recommendations.append({
+            "company": company,
+            "shares": [float(shares[0]), float(shares[1])],
+            "expected_score": result["expected_score"] if result else score + 65,
+            "result": result,
+        })
+
+    if not recommendations:
+        return [{"오류": "시평액/의무비율 조건을 만족하는 구성사 후보가 없습니다."}]
+    return recommendations
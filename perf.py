@@ -0,0 +1,168 @@
+# perf.py
+# 검색, 점수 계산, 보고서 작성, API 조회처럼 시간이 걸리는 구간의 실행 시간을 재서 구간별로 모읍니다.
+# 모은 값(횟수/합계/평균/최대)은 주기적으로, 그리고 프로그램이 끝날 때 logs/perf.log에 기록합니다.
+#
+# 기본은 꺼져 있습니다. 환경변수 BIDDING_PERF=1 또는 config.json의 "perf_logging": true로 켭니다.
+# 꺼져 있으면 span()은 아무 일도 하지 않는 공용 객체를 돌려주고, @timed 함수는 원래 함수를 바로 호출합니다.
+#
+# 사용 예)
+#     with perf.span("report.save"):
+#         wb.save(path)
+#
+#     @perf.timed("search.filter_companies")
+#     def filter_companies(...): ...
+import os
+import time
+import atexit
+import functools
+import threading
+from datetime import datetime
+
+import config
+
+ENV_VAR = "BIDDING_PERF"
+CONFIG_KEY = "perf_logging"
+LOG_DIR = "logs"
+LOG_FILENAME = "perf.log"
+FLUSH_INTERVAL = 60  # 초: 켜져 있을 때 이 간격마다 모은 값을 기록하고 새로 모읍니다.
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+_lock = threading.Lock()
+_stats = {}  # 구간 이름 -> [횟수, 합계(초), 최대(초)]
+_window_started = time.monotonic()
+
+
+def _initial_state():
+    """환경변수가 있으면 환경변수를, 없으면 설정 파일 값을 따릅니다."""
+    value = os.environ.get(ENV_VAR, "").strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    try:
+        return bool(config.load_config().get(CONFIG_KEY, False))
+    except Exception:
+        return False
+
+
+_enabled = _initial_state()
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable(flag=True):
+    """실행 중에 시간 측정을 켜거나 끕니다."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+def record(name, seconds):
+    """구간 name에 걸린 시간(초) 하나를 더합니다."""
+    flush_needed = False
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            _stats[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+        flush_needed = time.monotonic() - _window_started >= FLUSH_INTERVAL
+    if flush_needed:
+        flush()
+
+
+class _Span:
+    __slots__ = ('name', 'started')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """with 문으로 감싼 구간의 실행 시간을 name으로 모읍니다. (꺼져 있으면 아무 일도 하지 않음)"""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name=None):
+    """함수 전체를 하나의 구간으로 재는 데코레이터입니다. 이름을 생략하면 '모듈.함수'를 씁니다."""
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(span_name, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def stats():
+    """지금까지 모은 값을 {구간 이름: {"count", "total_s", "mean_s", "max_s"}}로 반환합니다."""
+    with _lock:
+        return {name: {"count": count, "total_s": total, "mean_s": total / count, "max_s": maximum}
+                for name, (count, total, maximum) in _stats.items()}
+
+
+def reset():
+    global _window_started
+    with _lock:
+        _stats.clear()
+        _window_started = time.monotonic()
+
+
+def flush():
+    """모은 값을 logs/perf.log에 구간별 한 줄씩(합계 시간이 큰 순서) 기록하고 비웁니다."""
+    global _window_started
+    with _lock:
+        snapshot = dict(_stats)
+        _stats.clear()
+        window = time.monotonic() - _window_started
+        _window_started = time.monotonic()
+    if not snapshot:
+        return
+
+    lines = [f"{datetime.now():%Y-%m-%d %H:%M:%S} [pid {os.getpid()}] 측정 구간 {window:.1f}초"]
+    for name, (count, total, maximum) in sorted(snapshot.items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {name:<40} 횟수 {count:>8}  합계 {total:10.3f}초  "
+                     f"평균 {total / count * 1000:10.3f}ms  최대 {maximum * 1000:10.3f}ms")
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        with open(os.path.join(LOG_DIR, LOG_FILENAME), 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError:
+        pass  # 기록 실패로 프로그램이 멈추지 않도록 무시합니다.
+
+
+atexit.register(flush)
@@ -0,0 +1,176 @@
+# report_writer.py
+# 협정 결과 목록을 행안부 엑셀 보고서 양식(haeng_template.xlsx)에 채워 저장합니다.
+# 화면(Qt)과 무관한 함수들이라 백그라운드 스레드나 다른 프로세스에서도 그대로 호출할 수 있습니다.
+import io
+import os
+import re
+import sys
+from copy import copy
+
+from openpyxl import load_workbook
+from openpyxl.formula.translate import Translator
+from openpyxl.styles import PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+import perf
+import utils
+
+TEMPLATE_FILENAME = "haeng_template.xlsx"
+FIRST_DATA_ROW = 5  # 협정 1번이 들어가는 행
+
+# 항목별 대표사 열 번호 (구성사 N은 여기에 N을 더한 열)
+NAME_COLUMN = 3  # C: 업체명(+담당자)
+SHARE_COLUMN = 9  # I: 지분율
+BUSINESS_SCORE_COLUMN = 16  # P: 경영상태 점수
+PERFORMANCE_COLUMN = 23  # W: 5년 실적
+SHARE_SUM_COLUMN = 14  # N: 합산 지분 수식(=SUM(I:M)), 템플릿에 준비된 협정 행을 찾을 때 사용
+
+# '김OO', '김OO팀장' 등 2~4글자의 한글 이름을 찾는 정규표현식
+MANAGER_NAME_PATTERN = re.compile(r'([가-힣]{2,4})(님|팀장|실장|부장|과장|대리|주임|사원)?')
+
+YELLOW_FILL = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+WRAP_ALIGNMENT = Alignment(vertical='center', wrap_text=True)
+
+_template_cache = {}  # 템플릿 경로 -> (수정 시각, 파일 내용)
+
+
+def template_path():
+    """개발 환경과 PyInstaller 실행 파일 모두에서 템플릿 경로를 찾습니다."""
+    base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
+    return os.path.join(base_path, TEMPLATE_FILENAME)
+
+
+def _load_template(path):
+    """템플릿 파일은 한 번만 읽어 두고(파일이 바뀌면 다시 읽음), 보고서마다 메모리에서 새 통합문서로 엽니다."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _template_cache.get(path)
+    if not cached or cached[0] != mtime_ns:
+        with open(path, 'rb') as f:
+            cached = _template_cache[path] = (mtime_ns, f.read())
+    return load_workbook(io.BytesIO(cached[1]))
+
+
+def _role_offset(role):
+    """'대표사' -> 0, '구성사 N' -> N, 알 수 없는 역할은 None"""
+    if role == "대표사":
+        return 0
+    if role and role.startswith("구성사"):
+        try:
+            return int(role.split(' ')[1])
+        except (IndexError, ValueError):
+            return None
+    return None
+
+
+def _manager_name(remarks):
+    """비고란에서 담당자 이름을 추출합니다."""
+    if not remarks:
+        return None
+    match = MANAGER_NAME_PATTERN.search(remarks)
+    return match.group(1) if match else None
+
+
+def report_row(result_data, region_limit):
+    """
+    협정 결과 하나를 보고서 한 행의 셀 목록으로 바꿉니다.
+    [(열 번호, 값, 셀 서식 또는 None, 지역 강조 여부)]를 반환합니다. (업체명 셀만 강조 대상)
+    """
+    cells = []
+    for comp_detail in result_data.get("company_details", []):
+        offset = _role_offset(comp_detail.get('role'))
+        if offset is None:
+            continue
+        data = comp_detail.get('data', {})
+
+        cell_text = utils.strip_corporate_suffix(comp_detail.get('name') or '')
+        manager_name = _manager_name(data.get('비고', ''))
+        if manager_name:
+            cell_text += f"\n{manager_name}"
+        highlight = region_limit != "전체" and region_limit in (data.get('지역', '') or '')
+
+        cells.append((NAME_COLUMN + offset, cell_text, None, highlight))
+        cells.append((SHARE_COLUMN + offset, comp_detail.get('share', 0), '0.00%', False))
+        cells.append((BUSINESS_SCORE_COLUMN + offset,
+                      comp_detail.get('business_score_details', {}).get('total', 0), None, False))
+        cells.append((PERFORMANCE_COLUMN + offset, comp_detail.get('performance_5y', 0), '#,##0', False))
+    return cells
+
+
+def _last_template_row(ws):
+    """
+    템플릿에 준비된 마지막 협정 행 번호를 찾습니다. (합산 지분 칸에 수식이 이어지는 마지막 행)
+    표 아래에 메모나 빈 서식 행이 있어도 ws.max_row 대신 실제 협정 행을 기준으로 삼습니다.
+    """
+    last_row = FIRST_DATA_ROW
+    for (value,) in ws.iter_rows(min_row=FIRST_DATA_ROW + 1, min_col=SHARE_SUM_COLUMN, max_col=SHARE_SUM_COLUMN,
+                                 values_only=True):
+        if not (isinstance(value, str) and value.startswith('=')):
+            break
+        last_row += 1
+    return last_row
+
+
+def _extend_data_rows(ws, last_row):
+    """
+    협정 수가 템플릿에 준비된 행보다 많으면 템플릿 마지막 협정 행의 서식과 수식을 아래로 복사합니다.
+    (수식은 행 번호에 맞게 바꿔서 복사)
+    """
+    template_row = _last_template_row(ws)
+    if last_row <= template_row:
+        return
+    if ws.max_row > template_row:
+        # 표 아래에 있는 행(메모 등)은 늘어난 협정 행 뒤로 옮깁니다.
+        ws.move_range(f"A{template_row + 1}:{get_column_letter(ws.max_column)}{ws.max_row}",
+                      rows=last_row - template_row)
+    source_cells = list(ws[template_row])
+    height = ws.row_dimensions[template_row].height
+    for row in range(template_row + 1, last_row + 1):
+        for source in source_cells:
+            target = ws.cell(row, source.column)
+            if source.has_style:
+                target._style = copy(source._style)
+            if isinstance(source.value, str) and source.value.startswith('='):
+                target.value = Translator(source.value, origin=source.coordinate).translate_formula(target.coordinate)
+        ws.row_dimensions[row].height = height
+    ws.print_area = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
+
+
+@perf.timed("report.write_report")
+def write_report(consortiums, header, save_path, template=None, progress=None):
+    """
+    협정 결과 목록(result_data)을 템플릿에 채워 save_path에 저장합니다.
+
+    header: {"estimation_price": 추정가격(숫자), "gongo_no": ..., "gongo_title": ...,
+             "bid_opening": 개찰일시 문자열 또는 None, "region_limit": 지역제한}
+    progress(완료 개수, 전체 개수)는 협정 한 행을 채울 때마다 호출됩니다.
+    템플릿의 서식/수식/병합 셀을 그대로 써야 하므로 write-only 통합문서 대신 템플릿을 열어 값만 채웁니다.
+    """
+    with perf.span("report.load_template"):
+        wb = _load_template(template or template_path())
+    ws = wb.active
+
+    ws['D2'] = header.get("estimation_price")
+    ws['M1'] = f"{header.get('gongo_no', '')} {header.get('gongo_title', '')}"
+    if header.get("bid_opening"):
+        ws['P2'] = header["bid_opening"]
+
+    region_limit = header.get("region_limit", "전체")
+    total = len(consortiums)
+    _extend_data_rows(ws, FIRST_DATA_ROW + total - 1)
+    with perf.span("report.fill_rows"):
+        for index, result_data in enumerate(consortiums):
+            row = FIRST_DATA_ROW + index
+            for column, value, number_format, highlight in report_row(result_data, region_limit):
+                cell = ws.cell(row, column, value=value)
+                if number_format:
+                    cell.number_format = number_format
+                if NAME_COLUMN <= column < SHARE_COLUMN:  # 업체명 칸: 담당자 이름 줄바꿈
+                    cell.alignment = WRAP_ALIGNMENT
+                if highlight:
+                    cell.fill = YELLOW_FILL
+            if progress:
+                progress(index + 1, total)
+
+    with perf.span("report.save"):
+        wb.save(save_path)
+    return save_path
@@ -0,0 +1,245 @@
+# saved_data_catalog.py
+# saved_data/<모드> 폴더의 협정 저장 파일 목록(카탈로그)을 관리합니다.
+# 불러오기 창은 목록과 필터에 필요한 요약 정보만 카탈로그에서 읽고,
+# 협정 본문 전체는 사용자가 파일을 선택했을 때만 읽습니다.
+# 카탈로그에는 협정별 참여 업체도 들어 있어, 업체명/사업자번호로 어느 파일의 몇 번째 협정에 있는지 바로 찾을 수 있습니다.
+import os
+import re
+import json
+import logging
+
+import session_store
+from company_index import NgramIndex
+from utils import normalize_company_name
+
+SAVED_DATA_DIR = "saved_data"
+CATALOG_FILENAME = "_catalog.idx"  # 저장 파일 확장자(.bidpack/.json)가 아니므로 저장 파일 목록에 섞이지 않습니다.
+CATALOG_VERSION = 2  # 2: 협정별 참여 업체(members) 추가
+
+SUMMARY_KEYS = ("saved_name", "saved_date", "region_limit", "project_type")
+
+
+def data_folder(mode):
+    """모드(행안부/조달청)별 저장 폴더 경로를 반환합니다."""
+    return os.path.join(SAVED_DATA_DIR, mode)
+
+
+def _summarize(filename, content, stat_result):
+    """저장 파일 내용에서 목록/필터에 필요한 정보만 뽑아 카탈로그 항목을 만듭니다."""
+    entry = {key: content.get(key) for key in SUMMARY_KEYS if key in content}
+    company_names = []
+    members = []  # [업체명, 사업자번호, 협정 번호(0부터), 역할]
+    for position, result_data in enumerate(content.get("consortiums", [])):
+        for comp in result_data.get("company_details", []):
+            data = comp.get("data") or {}
+            name = comp.get("name") or data.get("검색된 회사")
+            if not name:
+                continue
+            if name not in company_names:
+                company_names.append(name)
+            members.append([name, data.get("사업자번호") or "", position, comp.get("role", "")])
+    entry.update({
+        "filename": filename,
+        "company_names": company_names,
+        "members": members,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "size": stat_result.st_size,
+    })
+    return entry
+
+
+def _read_catalog(folder):
+    try:
+        with open(os.path.join(folder, CATALOG_FILENAME), 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_VERSION:
+        return {}
+    return catalog.get("files", {})
+
+
+def _write_catalog(folder, entries):
+    os.makedirs(folder, exist_ok=True)
+    catalog_path = os.path.join(folder, CATALOG_FILENAME)
+    tmp_path = catalog_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": CATALOG_VERSION, "files": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, catalog_path)
+    except OSError as e:
+        logging.error(f"협정 카탈로그 저장 실패: {catalog_path}, 오류: {e}")
+
+
+def load_catalog(folder):
+    """
+    폴더의 카탈로그 항목 목록을 반환합니다.
+    폴더를 훑으며 파일 크기/수정 시각만 확인하고, 새로 생기거나 바뀐 파일만 열어서 카탈로그를 갱신합니다.
+    """
+    if not os.path.isdir(folder):
+        return []
+    entries = _read_catalog(folder)
+    changed = False
+    current = {}
+    with os.scandir(folder) as it:
+        for dir_entry in it:
+            if not session_store.is_session_file(dir_entry.name) or not dir_entry.is_file():
+                continue
+            stat_result = dir_entry.stat()
+            entry = entries.get(dir_entry.name)
+            if entry and entry.get("mtime_ns") == stat_result.st_mtime_ns and entry.get("size") == stat_result.st_size:
+                current[dir_entry.name] = entry
+                continue
+            try:
+                content = session_store.read_session(folder, dir_entry.name)
+            except Exception:
+                continue
+            if isinstance(content, dict):
+                current[dir_entry.name] = _summarize(dir_entry.name, content, stat_result)
+                changed = True
+
+    if changed or set(current) != set(entries):
+        _write_catalog(folder, current)
+    return list(current.values())
+
+
+def update_entry(folder, filename, content):
+    """저장 직후 호출: 방금 저장한 내용으로 카탈로그 항목을 갱신합니다. (파일을 다시 읽지 않음)"""
+    entries = _read_catalog(folder)
+    try:
+        stat_result = os.stat(os.path.join(folder, filename))
+    except OSError:
+        return
+    entries[filename] = _summarize(filename, content, stat_result)
+    _write_catalog(folder, entries)
+    if folder in _company_indexes:
+        _company_indexes[folder].add_entry(entries[filename])
+
+
+def remove_entry(folder, filename):
+    """파일 삭제 후 호출: 카탈로그에서 항목을 뺍니다."""
+    entries = _read_catalog(folder)
+    if entries.pop(filename, None) is not None:
+        _write_catalog(folder, entries)
+    if folder in _company_indexes:
+        _company_indexes[folder].remove_entry(filename)
+
+
+def load_saved_file(folder, filename):
+    """저장 파일 하나의 전체 내용을 읽습니다. (불러올 협정을 선택했을 때만 사용)"""
+    content = session_store.read_session(folder, filename)
+    content['filename'] = filename
+    return content
+
+
+def _biz_key(value):
+    """사업자번호 비교용: 숫자만 남깁니다."""
+    return re.sub(r'\D', '', str(value or ""))
+
+
+class SavedCompanyIndex:
+    """
+    업체명/사업자번호 -> (저장 파일, 협정 번호, 역할) 역색인입니다.
+    카탈로그 항목 단위로 추가/삭제되므로 저장할 때마다 바뀐 파일만 반영합니다.
+    """
+
+    def __init__(self, entries=()):
+        self._name_index = NgramIndex([], normalize_company_name)
+        self._name_ids = {}  # 정규화한 업체명 -> 색인 번호
+        self._name_hits = []  # 색인 번호 -> {파일명: [(협정 번호, 역할, 업체명), ...]}
+        self._biz_hits = {}  # 숫자만 남긴 사업자번호 -> {파일명: [(협정 번호, 역할, 업체명), ...]}
+        self._file_keys = {}  # 파일명 -> (카탈로그 항목의 (mtime_ns, size), 업체명 색인 번호 집합, 사업자번호 집합)
+        for entry in entries:
+            self.add_entry(entry)
+
+    def add_entry(self, entry):
+        filename = entry["filename"]
+        self.remove_entry(filename)
+        name_ids, biz_keys = set(), set()
+        for name, biz_no, position, role in entry.get("members", []):
+            hit = (position, role, name)
+            normalized = normalize_company_name(name)
+            if normalized:
+                if normalized not in self._name_ids:
+                    self._name_ids[normalized] = self._name_index.add(name)
+                    self._name_hits.append({})
+                name_id = self._name_ids[normalized]
+                self._name_hits[name_id].setdefault(filename, []).append(hit)
+                name_ids.add(name_id)
+            biz_key = _biz_key(biz_no)
+            if biz_key:
+                self._biz_hits.setdefault(biz_key, {}).setdefault(filename, []).append(hit)
+                biz_keys.add(biz_key)
+        self._file_keys[filename] = ((entry.get("mtime_ns"), entry.get("size")), name_ids, biz_keys)
+
+    def remove_entry(self, filename):
+        stamp, name_ids, biz_keys = self._file_keys.pop(filename, (None, (), ()))
+        for name_id in name_ids:
+            self._name_hits[name_id].pop(filename, None)
+        for biz_key in biz_keys:
+            files = self._biz_hits.get(biz_key, {})
+            files.pop(filename, None)
+            if not files:
+                self._biz_hits.pop(biz_key, None)
+
+    def sync(self, entries):
+        """카탈로그 항목 목록과 비교해 새로 생기거나 바뀐 파일만 다시 색인하고, 없어진 파일은 뺍니다."""
+        current = set()
+        for entry in entries:
+            current.add(entry["filename"])
+            known = self._file_keys.get(entry["filename"])
+            if not known or known[0] != (entry.get("mtime_ns"), entry.get("size")):
+                self.add_entry(entry)
+        for filename in set(self._file_keys) - current:
+            self.remove_entry(filename)
+
+    def search(self, query):
+        """
+        업체명(부분 일치) 또는 사업자번호로 검색합니다.
+        {파일명: [(협정 번호, 역할, 업체명), ...]}을 반환하고, 검색어가 비면 None을 반환합니다.
+        """
+        query = str(query or "").strip()
+        if not query:
+            return None
+        results = {}
+
+        def merge(files):
+            for filename, hits in files.items():
+                results.setdefault(filename, []).extend(hits)
+
+        # 숫자와 '-'로만 된 검색어는 사업자번호로 봅니다. (완전 일치 우선, 없으면 부분 일치)
+        if re.fullmatch(r'[\d\-\s]+', query):
+            biz_key = _biz_key(query)
+            if biz_key in self._biz_hits:
+                merge(self._biz_hits[biz_key])
+            else:
+                for key, files in self._biz_hits.items():
+                    if biz_key in key:
+                        merge(files)
+        name_ids = self._name_index.search_ids(query)
+        if name_ids is None:
+            # '(주)', '주식회사'처럼 정규화하면 비는 검색어는 원래 업체명에서 소문자 부분 일치로 찾습니다.
+            lowered = query.lower()
+            for files in self._name_hits:
+                merge({filename: [hit for hit in hits if lowered in hit[2].lower()]
+                       for filename, hits in files.items()})
+            results = {filename: hits for filename, hits in results.items() if hits}
+        for name_id in name_ids or ():
+            merge(self._name_hits[name_id])
+
+        return {filename: sorted(set(hits)) for filename, hits in results.items()}
+
+
+_company_indexes = {}  # 폴더 -> SavedCompanyIndex (프로그램 실행 동안 유지)
+
+
+def get_company_index(folder, entries=None):
+    """폴더의 업체 역색인을 반환합니다. entries(load_catalog 결과)를 주면 바뀐 파일만 반영합니다."""
+    if entries is None:
+        entries = load_catalog(folder)
+    index = _company_indexes.get(folder)
+    if index is None:
+        index = _company_indexes[folder] = SavedCompanyIndex(entries)
+    else:
+        index.sync(entries)
+    return index
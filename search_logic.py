@@ -1,10 +1,16 @@
 # search_logic.py
 import re
 import logging
+import hashlib
+import pickle
 from openpyxl import load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.styles import PatternFill
 from openpyxl.styles.colors import Color
 from config import RELATIVE_OFFSETS
+from company_record import CompanyRecord
 from utils import parse_amount
+import perf
 
 # --- 로깅 설정 추가 ---
 # 프로그램 실행 위치에 'logs' 폴더를 만들고 그 안에 로그 파일을 기록합니다.
@@ -17,6 +23,13 @@ logging.basicConfig(filename=os.path.join(log_dir, 'search_errors.log'),
                     level=logging.ERROR,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# --- 파싱 결과 디스크 캐시 설정 ---
+# 엑셀 파일의 경로/수정시각/크기가 같으면 저장된 파싱 결과를 그대로 재사용합니다.
+CACHE_DIR = 'cache'
+CACHE_VERSION = 2  # 파싱 결과 형식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+
+# 읽기 전용 모드에서 값도 서식도 없는 셀은 fill이 없으므로, 전체 모드의 기본 채우기와 같게 취급합니다.
+_EMPTY_FILL = PatternFill()
 
 # --------------------
 
@@ -44,14 +57,77 @@ def get_status_from_color(color_obj) -> str:
     return "미지정"
 
 
-def find_and_filter_companies(file_path, filters):
+def _process_value(item, value):
+    """엑셀 셀 값을 항목 종류에 맞게 정리합니다."""
+    if item in ["부채비율", "유동비율"]:
+        if isinstance(value, (int, float)):
+            processed_value = value * 100
+        elif isinstance(value, str):
+            try:
+                processed_value = float(value.replace('%', '').strip())
+            except (ValueError, TypeError):
+                processed_value = clean_text(value)
+        else:
+            processed_value = value
+    elif item == "신용평가":
+        if isinstance(value, str):
+            cleaned_value = value.strip()
+            normalized_value = " ".join(cleaned_value.split())
+            processed_value = normalized_value.replace(' ', '\n', 1)
+        else:
+            processed_value = value
+    else:
+        processed_value = clean_text(value) if isinstance(value, str) else value
+    return processed_value if processed_value is not None else ""
+
+
+def _build_company(sheet_name, company_name, get_cell):
+    """
+    회사명 한 칸에 대한 업체 정보(CompanyRecord)를 만듭니다.
+    get_cell(offset)은 회사명 아래 offset번째 행의 셀을, 시트 범위를 넘으면 None을 돌려줘야 합니다.
+    값과 색상(데이터상태)은 셀 하나를 한 번만 읽어서 함께 채웁니다.
+    """
+    company_data = {"검색된 회사": clean_text(company_name)}
+    company_data['대표지역'] = sheet_name.strip().replace('[', '').replace(']', '')
+
+    company_statuses = {}
+    for item, offset in RELATIVE_OFFSETS.items():
+        cell = get_cell(offset)
+        if cell is None:
+            company_data[item] = "N/A"
+            company_statuses[item] = "범위 초과"
+            continue
+        company_data[item] = _process_value(item, cell.value)
+        fill = cell.fill if cell.fill is not None else _EMPTY_FILL
+        company_statuses[item] = get_status_from_color(fill.fgColor if fill else None)
+    company_data["데이터상태"] = company_statuses
+    return CompanyRecord.from_dict(company_data)
+
+
+def _log_company_error(sheet_name, row_num, col_num, company_name, error):
+    # 오류 발생 시 로그 파일에 기록하고 다음 회사로 넘어갑니다.
+    error_msg = (f"'{sheet_name}' 시트의 {row_num}행, {col_num}열 "
+                 f"데이터 처리 중 오류 발생. 회사명: '{company_name}'. 오류: {error}")
+    print(f"[경고] {error_msg}")
+    logging.error(error_msg)
+
+
+def _is_header_row(row_cells):
+    if not row_cells:
+        return False
+    first_cell_value = row_cells[0].value
+    return isinstance(first_cell_value, str) and "회사명" in first_cell_value.strip()
+
+
+def _parse_workbook_full(file_path):
+    """
+    [기존 방식] 전체 모드로 엑셀을 열고, 회사마다 필요한 셀을 직접 찾아 읽습니다.
+    읽기 전용 모드로 열 수 없는 파일용(load_companies(streaming=False))이자, 스트리밍 파서 결과를 비교하는 기준으로 남겨 둡니다.
+    (tests/test_search_logic.py)
+    """
     all_companies = []
 
-    try:
-        workbook = load_workbook(filename=file_path, data_only=False)
-    except Exception as e:
-        logging.error(f"엑셀 파일 열기 실패: {file_path}, 오류: {e}")
-        return [{"오류": f"파일 열기 오류: {e}"}]
+    workbook = load_workbook(filename=file_path, data_only=False)
 
     for sheet_name in workbook.sheetnames:
         sheet = workbook[sheet_name]
@@ -60,77 +136,150 @@ def find_and_filter_companies(file_path, filters):
 
         for r_idx, row_cells in enumerate(sheet.iter_rows(max_row=max_row, max_col=max_col)):
             excel_row_num = r_idx + 1
+            if not _is_header_row(row_cells):
+                continue
+
+            for company_header_cell in row_cells[1:]:
+                company_name = company_header_cell.value
+                if not isinstance(company_name, str) or not company_name.strip():
+                    continue
+                excel_col_num = company_header_cell.column
+
+                def get_cell(offset, col=excel_col_num):
+                    target_row = excel_row_num + offset
+                    if target_row > max_row:
+                        return None
+                    return sheet.cell(row=target_row, column=col)
+
+                try:
+                    all_companies.append(_build_company(sheet_name, company_name, get_cell))
+                except Exception as e:
+                    _log_company_error(sheet_name, excel_row_num, excel_col_num, company_name, e)
+
+    return all_companies
+
+
+def _finish_block(sheet_name, block, all_companies):
+    """버퍼에 모아 둔 회사명 행 하나(블록)의 업체들을 결과 목록에 추가합니다."""
+    buffered_rows = block["rows"]
+    for col_idx, company_name in block["companies"]:
+        def get_cell(offset, col_idx=col_idx):
+            row_cells = buffered_rows.get(offset)
+            if row_cells is None:
+                return None  # 시트가 먼저 끝난 경우 (범위 초과)
+            return row_cells[col_idx] if col_idx < len(row_cells) else EMPTY_CELL
+
+        try:
+            all_companies.append(_build_company(sheet_name, company_name, get_cell))
+        except Exception as e:
+            _log_company_error(sheet_name, block["row"], col_idx + 1, company_name, e)
+
+
+def _parse_workbook_streaming(file_path):
+    """
+    읽기 전용(read_only) 모드로 각 시트를 위에서 아래로 한 번만 훑습니다.
+    회사명 행을 만나면 그 아래 필요한 행들만 잠시 보관했다가, 다 모이면 바로 업체 정보로 만듭니다.
+    """
+    all_companies = []
+    needed_offsets = set(RELATIVE_OFFSETS.values())
+    last_offset = max(needed_offsets)
+
+    workbook = load_workbook(filename=file_path, read_only=True, data_only=False)
+    try:
+        for sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
+            pending_blocks = []
+
+            for excel_row_num, row_cells in enumerate(sheet.iter_rows(), start=1):
+                for block in pending_blocks:
+                    offset = excel_row_num - block["row"]
+                    if offset in needed_offsets:
+                        block["rows"][offset] = row_cells
 
-            first_cell_value = row_cells[0].value
-            if isinstance(first_cell_value, str) and "회사명" in first_cell_value.strip():
-
-                for c_idx, company_header_cell in enumerate(row_cells[1:], start=1):
-                    # ▼▼▼▼▼ [핵심 수정] 개별 회사 데이터를 읽는 부분을 try-except로 감쌉니다 ▼▼▼▼▼
-                    try:
-                        excel_col_num = company_header_cell.column
-                        company_name = company_header_cell.value
-
-                        if not isinstance(company_name, str) or not company_name.strip():
-                            continue
-
-                        cleaned_company_name = clean_text(company_name)
-                        company_data = {"검색된 회사": cleaned_company_name}
-
-                        clean_region_name = sheet_name.strip().replace('[', '').replace(']', '')
-                        company_data['대표지역'] = clean_region_name
-
-                        for item, offset in RELATIVE_OFFSETS.items():
-                            target_row = excel_row_num + offset
-                            if target_row <= max_row:
-                                cell = sheet.cell(row=target_row, column=excel_col_num)
-                                value = cell.value
-
-                                # 데이터 처리 로직 (기존과 동일)
-                                if item in ["부채비율", "유동비율"]:
-                                    if isinstance(value, (int, float)):
-                                        processed_value = value * 100
-                                    elif isinstance(value, str):
-                                        try:
-                                            processed_value = float(value.replace('%', '').strip())
-                                        except (ValueError, TypeError):
-                                            processed_value = clean_text(value)
-                                    else:
-                                        processed_value = value
-                                elif item == "신용평가":
-                                    if isinstance(value, str):
-                                        cleaned_value = value.strip()
-                                        normalized_value = " ".join(cleaned_value.split())
-                                        processed_value = normalized_value.replace(' ', '\n', 1)
-                                    else:
-                                        processed_value = value
-                                else:
-                                    processed_value = clean_text(value) if isinstance(value, str) else value
-
-                                company_data[item] = processed_value if processed_value is not None else ""
-                            else:
-                                company_data[item] = "N/A"
-
-                        company_statuses = {}
-                        for item, offset in RELATIVE_OFFSETS.items():
-                            target_row = excel_row_num + offset
-                            if target_row <= max_row:
-                                cell = sheet.cell(row=target_row, column=excel_col_num)
-                                company_statuses[item] = get_status_from_color(cell.fill.fgColor if cell.fill else None)
-                            else:
-                                company_statuses[item] = "범위 초과"
-                        company_data["데이터상태"] = company_statuses
-
-                        all_companies.append(company_data)
-
-                    except Exception as e:
-                        # 오류 발생 시 로그 파일에 기록하고 다음 회사로 넘어갑니다.
-                        error_msg = (f"'{sheet_name}' 시트의 {excel_row_num}행, {company_header_cell.column}열 "
-                                     f"데이터 처리 중 오류 발생. 회사명: '{company_name}'. 오류: {e}")
-                        print(f"[경고] {error_msg}")
-                        logging.error(error_msg)
-                        continue  # ★★★ 이 부분이 중요합니다 ★★★
-                    # ▲▲▲▲▲ [핵심 수정] 여기까지 ▲▲▲▲▲
+                while pending_blocks and excel_row_num - pending_blocks[0]["row"] >= last_offset:
+                    _finish_block(sheet_name, pending_blocks.pop(0), all_companies)
 
+                if _is_header_row(row_cells):
+                    companies = [(col_idx, cell.value) for col_idx, cell in enumerate(row_cells[1:], start=1)
+                                 if isinstance(cell.value, str) and cell.value.strip()]
+                    pending_blocks.append({"row": excel_row_num, "companies": companies, "rows": {}})
+
+            for block in pending_blocks:
+                _finish_block(sheet_name, block, all_companies)
+    finally:
+        workbook.close()
+
+    return all_companies
+
+
+@perf.timed("search.parse_workbook")
+def _parse_workbook(file_path, streaming=True):
+    """엑셀 파일의 모든 시트를 읽어 업체 목록(값 + 데이터상태)을 만듭니다."""
+    if streaming:
+        return _parse_workbook_streaming(file_path)
+    return _parse_workbook_full(file_path)
+
+
+def file_fingerprint(file_path):
+    """캐시 유효성 판단에 쓰는 (절대경로, 수정시각, 파일크기) 값을 돌려줍니다."""
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _cache_file_path(file_path):
+    """원본 파일 경로별로 고유한 캐시 파일 경로를 만듭니다."""
+    digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"companies_{digest}.pkl")
+
+
+def _read_cache(file_path, fingerprint):
+    cache_path = _cache_file_path(file_path)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get('version') != CACHE_VERSION or cached.get('fingerprint') != fingerprint:
+        return None
+    return cached.get('companies')
+
+
+def _write_cache(file_path, fingerprint, companies):
+    cache_path = _cache_file_path(file_path)
+    tmp_path = cache_path + '.tmp'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'fingerprint': fingerprint, 'companies': companies}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # 쓰는 도중 실패해도 기존 캐시가 깨지지 않도록 교체 방식으로 저장
+    except OSError as e:
+        logging.error(f"캐시 저장 실패: {file_path}, 오류: {e}")
+
+
+@perf.timed("search.load_companies")
+def load_companies(file_path, streaming=True):
+    """
+    엑셀 파일의 업체 목록을 반환합니다.
+    파일이 바뀌지 않았다면 디스크 캐시를 사용하고, 바뀌었을 때만 엑셀을 다시 파싱합니다.
+    streaming=False로 주면 예전 방식(전체 모드)으로 파싱합니다.
+    파일을 열 수 없으면 예외를 그대로 올립니다.
+    """
+    fingerprint = file_fingerprint(file_path)
+    companies = _read_cache(file_path, fingerprint)
+    if companies is not None:
+        return companies
+
+    companies = _parse_workbook(file_path, streaming=streaming)
+    _write_cache(file_path, fingerprint, companies)
+    return companies
+
+
+@perf.timed("search.filter_companies")
+def filter_companies(all_companies, filters):
+    """이미 읽어 둔 업체 목록에 검색 조건을 적용합니다."""
     if not all_companies:
         return [{"오류": "엑셀 파일에서 업체 정보를 찾을 수 없습니다."}]
 
@@ -161,3 +310,13 @@ def find_and_filter_companies(file_path, filters):
         return [{"오류": "주어진 조건에 맞는 업체를 찾을 수 없습니다."}]
 
     return filtered_results
+
+
+def find_and_filter_companies(file_path, filters):
+    try:
+        all_companies = load_companies(file_path)
+    except Exception as e:
+        logging.error(f"엑셀 파일 열기 실패: {file_path}, 오류: {e}")
+        return [{"오류": f"파일 열기 오류: {e}"}]
+
+    return filter_companies(all_companies, filters)
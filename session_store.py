@@ -0,0 +1,240 @@
+# session_store.py
+# 협정 저장 파일(saved_data/<모드>/*.bidpack, 예전 형식 *.json)을 읽고 씁니다.
+# 업체 데이터(data), 규칙(ruleset), 가격 정보(price_data)는 내용 해시를 키로 폴더의 객체 저장소(_objects.db)에 한 번만 넣고,
+# 저장 파일에는 해시만 남깁니다. 같은 업체/규칙이 여러 협정, 여러 파일에 나와도 한 번만 저장됩니다.
+# 압축 형식은 객체 저장소 없이는 열 수 없으므로 확장자를 .bidpack으로 달리 해서, .json만 읽는 이전 버전이나
+# 다른 프로그램이 내용이 빠진 파일을 정상 파일로 읽지 않게 합니다.
+# 예전 형식(내용 전체를 담은 .json)도 그대로 읽을 수 있고, 내보내기는 예전 형식으로 씁니다.
+import os
+import json
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import closing
+
+from company_record import json_default
+
+OBJECT_STORE_FILENAME = "_objects.db"
+PACKED_FORMAT = "packed-v1"
+PACKED_EXTENSION = ".bidpack"
+LEGACY_EXTENSION = ".json"
+SESSION_EXTENSIONS = (PACKED_EXTENSION, LEGACY_EXTENSION)
+REF_KEY = "$ref"
+
+# 해시로 바꿔 저장할 항목: 협정 결과(result_data)의 키, 업체 항목(company_details)의 키
+_RESULT_REF_KEYS = ("ruleset", "price_data")
+_COMPANY_REF_KEYS = ("data",)
+
+_SQL_BATCH = 500  # 한 번의 IN (...) 조회에 넣을 해시 개수 (SQLite 변수 개수 제한)
+
+# 해시 -> 압축을 푼 JSON 문자열. 내용이 바뀌면 해시도 바뀌므로 한 번 읽은 객체는 계속 재사용해도 됩니다.
+# 가장 오래 쓰지 않은 객체부터 버리는 LRU 캐시입니다.
+_OBJECT_CACHE_SIZE = 20000
+_object_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _canonical(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def _connect(folder):
+    conn = sqlite3.connect(os.path.join(folder, OBJECT_STORE_FILENAME))
+    conn.execute("CREATE TABLE IF NOT EXISTS objects (hash TEXT PRIMARY KEY, body BLOB NOT NULL)")
+    return conn
+
+
+def is_session_file(filename):
+    """협정 저장 파일(압축 형식 .bidpack 또는 예전 형식 .json)인지 확인합니다."""
+    return filename.endswith(SESSION_EXTENSIONS)
+
+
+def _stem(filename):
+    for extension in SESSION_EXTENSIONS:
+        if filename.endswith(extension):
+            return filename[:-len(extension)]
+    return filename
+
+
+def packed_filename(filename):
+    """'이름.json' 같은 저장 파일 이름을 압축 형식 파일 이름('이름.bidpack')으로 바꿉니다."""
+    return _stem(filename) + PACKED_EXTENSION
+
+
+def export_filename(filename):
+    """내보낼 때 쓰는 예전 형식 파일 이름('이름.json')"""
+    return _stem(filename) + LEGACY_EXTENSION
+
+
+def _is_ref(value):
+    return isinstance(value, dict) and len(value) == 1 and REF_KEY in value
+
+
+def _iter_ref_slots(content):
+    """(딕셔너리, 키) 쌍으로 해시로 바꿀 수 있는 위치를 모두 돌려줍니다."""
+    for result_data in content.get("consortiums", []):
+        for key in _RESULT_REF_KEYS:
+            yield result_data, key
+        for comp in result_data.get("company_details", []):
+            for key in _COMPANY_REF_KEYS:
+                yield comp, key
+
+
+def is_packed(content):
+    return isinstance(content, dict) and content.get("format") == PACKED_FORMAT
+
+
+def pack_session(content):
+    """
+    저장할 내용을 (압축 형식 문서, {해시: 정규화한 JSON 문자열}) 으로 나눕니다.
+    CompanyRecord 같은 객체는 json_default로 먼저 일반 딕셔너리로 바꿉니다.
+    """
+    packed = json.loads(json.dumps(content, default=json_default))
+    objects = {}
+    for holder, key in _iter_ref_slots(packed):
+        value = holder.get(key)
+        if not isinstance(value, dict) or _is_ref(value):
+            continue
+        text = _canonical(value)
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+        objects[digest] = text
+        holder[key] = {REF_KEY: digest}
+    packed["format"] = PACKED_FORMAT
+    packed["refs"] = sorted(objects)
+    return packed, objects
+
+
+def unpack_session(packed, object_texts):
+    """pack_session의 반대: 해시를 객체 저장소의 내용으로 되돌립니다. (같은 해시도 협정마다 별도 사본)"""
+    content = {key: value for key, value in packed.items() if key not in ("format", "refs")}
+    for holder, key in _iter_ref_slots(content):
+        value = holder.get(key)
+        if not _is_ref(value):
+            continue
+        text = object_texts.get(value[REF_KEY])
+        if text is None:
+            raise ValueError(f"객체 저장소({OBJECT_STORE_FILENAME})에 없는 항목입니다: {value[REF_KEY]}")
+        holder[key] = json.loads(text)
+    return content
+
+
+def _load_objects(folder, digests):
+    """해시 목록의 객체 문자열을 반환합니다. 캐시에 없는 것만 저장소에서 읽습니다."""
+    object_texts = {}
+    with _cache_lock:
+        for digest in digests:
+            if digest in _object_cache:
+                _object_cache.move_to_end(digest)
+                object_texts[digest] = _object_cache[digest]
+    missing = [digest for digest in digests if digest not in object_texts]
+    if not missing:
+        return object_texts
+    if not os.path.exists(os.path.join(folder, OBJECT_STORE_FILENAME)):
+        raise ValueError(f"객체 저장소({OBJECT_STORE_FILENAME})가 없어 압축 형식 저장 파일을 열 수 없습니다. "
+                         f"다른 곳으로 옮길 때는 내보내기(.json)를 사용하세요.")
+    with closing(_connect(folder)) as conn:
+        for start in range(0, len(missing), _SQL_BATCH):
+            batch = missing[start:start + _SQL_BATCH]
+            rows = conn.execute(f"SELECT hash, body FROM objects WHERE hash IN ({','.join('?' * len(batch))})", batch)
+            for digest, body in rows:
+                object_texts[digest] = zlib.decompress(body).decode('utf-8')
+    with _cache_lock:
+        for digest in missing:
+            if digest in object_texts:
+                _object_cache[digest] = object_texts[digest]
+        while len(_object_cache) > _OBJECT_CACHE_SIZE:
+            _object_cache.popitem(last=False)
+    return object_texts
+
+
+def _read_refs(file_path):
+    """압축 형식 저장 파일이 참조하는 객체 해시 집합을 반환합니다. (파일이 없거나 읽지 못하면 빈 집합)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return set(content.get("refs", [])) if is_packed(content) else set()
+
+
+def write_session(folder, filename, content):
+    """
+    협정 목록을 압축 형식('이름.bidpack')으로 저장하고 실제 파일 이름을 반환합니다.
+    같은 이름의 예전 형식 파일('이름.json')은 새 파일로 대체되므로 지웁니다.
+    객체를 먼저 넣고 파일을 쓰므로, 중간에 실패해도 없는 해시를 가리키지 않습니다.
+    같은 이름의 저장 파일을 덮어써서 예전 내용만 쓰던 객체가 생기면 저장소를 정리합니다.
+    """
+    os.makedirs(folder, exist_ok=True)
+    filename = packed_filename(filename)
+    packed, objects = pack_session(content)
+    file_path = os.path.join(folder, filename)
+    replaced_refs = _read_refs(file_path)
+    with closing(_connect(folder)) as conn, conn:
+        conn.executemany("INSERT OR IGNORE INTO objects (hash, body) VALUES (?, ?)",
+                         [(digest, zlib.compress(text.encode('utf-8'))) for digest, text in objects.items()])
+
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(packed, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, file_path)
+
+    legacy_path = os.path.join(folder, export_filename(filename))
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    if replaced_refs - set(packed["refs"]):
+        collect_garbage(folder)
+    return filename
+
+
+def read_session(folder, filename):
+    """저장 파일 하나를 읽어 예전 형식과 같은 딕셔너리로 반환합니다. (예전 형식 파일은 그대로 반환)"""
+    with open(os.path.join(folder, filename), 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    if not is_packed(content):
+        return content
+    return unpack_session(content, _load_objects(folder, content.get("refs", [])))
+
+
+def export_session(folder, filename, dest_path):
+    """저장 파일을 다른 곳에서도 열 수 있도록 내용 전체를 담은 예전 형식 JSON으로 내보냅니다."""
+    content = read_session(folder, filename)
+    with open(dest_path, 'w', encoding='utf-8') as f:
+        json.dump(content, f, indent=4, ensure_ascii=False)
+
+
+def import_session(src_path, folder):
+    """예전 형식 JSON 파일을 폴더로 가져와 압축 형식으로 저장합니다. (저장한 파일명, 내용)을 반환합니다."""
+    with open(src_path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    if not isinstance(content, dict) or is_packed(content):
+        raise ValueError("내보내기 한 협정 JSON 파일만 가져올 수 있습니다.")
+    return write_session(folder, os.path.basename(src_path), content), content
+
+
+def collect_garbage(folder):
+    """어느 저장 파일에서도 쓰지 않는 객체를 저장소에서 지웁니다. (파일 삭제/덮어쓰기 후 호출) 지운 개수를 반환합니다."""
+    if not os.path.exists(os.path.join(folder, OBJECT_STORE_FILENAME)):
+        return 0
+    referenced = set()
+    with os.scandir(folder) as it:
+        for dir_entry in it:
+            if not is_session_file(dir_entry.name) or not dir_entry.is_file():
+                continue
+            try:
+                with open(dir_entry.path, 'r', encoding='utf-8') as f:
+                    content = json.load(f)
+            except Exception:
+                # 읽지 못한 파일이 참조하는 객체를 지우지 않도록 이번 정리는 건너뜁니다.
+                logging.warning(f"협정 파일을 읽지 못해 객체 정리를 건너뜁니다: {dir_entry.path}")
+                return 0
+            if is_packed(content):
+                referenced.update(content.get("refs", []))
+
+    with closing(_connect(folder)) as conn, conn:
+        stored = {row[0] for row in conn.execute("SELECT hash FROM objects")}
+        unused = [(digest,) for digest in stored - referenced]
+        conn.executemany("DELETE FROM objects WHERE hash = ?", unused)
+    return len(unused)
@@ -0,0 +1,39 @@
+# 테스트에서 저장소 최상위 모듈(utils, calculation_logic 등)을 바로 import할 수 있도록 경로를 추가합니다.
+import os
+import sys
+import atexit
+import shutil
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# search_logic은 import할 때 실행 위치의 logs/search_errors.log로 오류 로그를 설정(logging.basicConfig)합니다.
+# 테스트에서 일부러 만든 오류가 저장소의 로그 파일에 쌓이지 않도록 임시 폴더에서 import합니다.
+_LOG_ROOT = tempfile.mkdtemp(prefix="bidding-tests-")
+atexit.register(shutil.rmtree, _LOG_ROOT, ignore_errors=True)
+_cwd = os.getcwd()
+os.chdir(_LOG_ROOT)
+try:
+    import search_logic  # noqa: E402
+finally:
+    os.chdir(_cwd)
+from benchmarks.synthetic_workbook import generate_workbook  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """파싱 캐시(pickle)를 테스트마다 임시 폴더에 씁니다."""
+    monkeypatch.setattr(search_logic, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture(scope="session")
+def company_workbook(tmp_path_factory):
+    """합성 협력업체요약 파일 (지역 시트 여러 개, 업체 60곳)"""
+    path = tmp_path_factory.mktemp("workbook") / "업체.xlsx"
+    generate_workbook(str(path), 60, seed=7)
+    return str(path)
@@ -0,0 +1,156 @@
+# api_client: 로컬 가짜 서버(http.server)로 재시도, 응답 보관(TTL), 페이지 조회, 업종 동시 조회를 확인합니다.
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+import requests
+
+import api_client
+
+
+class StubApi:
+    """입찰공고목록 API 흉내: 업종별 공고 목록을 pageNo/numOfRows로 나누어 돌려줍니다."""
+
+    def __init__(self):
+        self.notices = {operation: [] for operation in api_client.BID_LIST_OPERATIONS.values()}
+        self.failures = 0  # 앞으로 503으로 응답할 요청 수
+        self.result_code = "00"
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def respond(self, path, query):
+        operation = path.rsplit('/', 1)[-1]
+        params = {key: values[0] for key, values in parse_qs(query).items()}
+        with self._lock:
+            self.requests.append((operation, params))
+            if self.failures > 0:
+                self.failures -= 1
+                return 503, {}
+        items = self.notices.get(operation, [])
+        if "bidNtceNo" in params:
+            items = [item for item in items if item["bidNtceNo"] == params["bidNtceNo"]]
+        rows, page = int(params.get("numOfRows", 10)), int(params.get("pageNo", 1))
+        body = {"items": items[(page - 1) * rows:page * rows], "totalCount": len(items)}
+        return 200, {"response": {"header": {"resultCode": self.result_code, "resultMsg": "테스트"}, "body": body}}
+
+    def count(self, operation=None):
+        return sum(1 for name, _ in self.requests if operation in (None, name))
+
+
+@pytest.fixture
+def stub():
+    api = StubApi()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            status, payload = api.respond(url.path, url.query)
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    api.base_url = f"http://127.0.0.1:{server.server_address[1]}/1230000/ad/BidPublicInfoService"
+    yield api
+    server.shutdown()
+    server.server_close()
+
+
+def _client(stub, **kwargs):
+    client = api_client.NaraApiClient(base_url=stub.base_url, **kwargs)
+    client.session.trust_env = False  # 환경의 프록시 설정을 타지 않도록
+    return client
+
+
+def _notices(prefix, count):
+    return [{"bidNtceNo": f"{prefix}{number:05d}", "bidNtceOrd": "000", "bidNtceNm": f"공고 {number}"}
+            for number in range(count)]
+
+
+CNSTWK = api_client.BID_LIST_OPERATIONS["공사"]
+SERVC = api_client.BID_LIST_OPERATIONS["용역"]
+
+
+def test_retries_transient_errors(stub):
+    stub.notices[CNSTWK] = _notices("R", 3)
+    stub.failures = 1
+    items, total = _client(stub).get_bid_list("공사", {"numOfRows": "10", "pageNo": "1"})
+    assert total == 3 and len(items) == 3
+    assert stub.count() == 2
+
+
+def test_gives_up_after_max_retries(stub):
+    stub.failures = 10
+    with pytest.raises(requests.exceptions.RequestException):
+        _client(stub, max_retries=1).get_bid_list("공사", {"pageNo": "1"})
+    assert stub.count() == 2
+
+
+def test_caches_successful_responses_until_ttl(stub):
+    stub.notices[CNSTWK] = _notices("C", 2)
+    client = _client(stub, cache_ttl=0.3)
+    params = {"numOfRows": "10", "pageNo": "1"}
+    assert client.get_bid_list("공사", params) == client.get_bid_list("공사", dict(reversed(params.items())))
+    assert stub.count() == 1
+
+    client.get_bid_list("공사", {**params, "pageNo": "2"})  # 조건이 다르면 따로 요청
+    assert stub.count() == 2
+    time.sleep(0.35)
+    client.get_bid_list("공사", params)
+    assert stub.count() == 3
+
+    client.clear_cache()
+    client.get_bid_list("공사", params)
+    assert stub.count() == 4
+
+
+def test_error_responses_are_not_cached(stub):
+    stub.result_code = "99"
+    client = _client(stub)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            client.get_bid_list("공사", {"pageNo": "1"})
+    assert stub.count() == 2
+
+
+def test_fetch_all_pages_in_order(stub):
+    stub.notices[CNSTWK] = _notices("P", 250)
+    items, total = _client(stub).fetch_all_pages("공사", {"inqryDiv": "1"}, page_size=100)
+    assert total == 250
+    assert [item["bidNtceNo"] for item in items] == [item["bidNtceNo"] for item in stub.notices[CNSTWK]]
+    assert sorted(int(params["pageNo"]) for _, params in stub.requests) == [1, 2, 3]
+    assert {params["numOfRows"] for _, params in stub.requests} == {"100"}
+
+
+def test_fetch_all_pages_stops_at_max_pages(stub):
+    stub.notices[CNSTWK] = _notices("M", 250)
+    items, total = _client(stub).fetch_all_pages("공사", {}, page_size=50, max_pages=2)
+    assert total == 250 and len(items) == 100
+    assert stub.count() == 2
+
+
+def test_list_bid_notices_joins_fields_in_order(stub):
+    stub.notices[CNSTWK] = _notices("A", 120)
+    stub.notices[SERVC] = _notices("B", 5)
+    items = _client(stub).list_bid_notices({"inqryDiv": "1"}, ["용역", "공사", "물품"])
+    assert [item["bidNtceNo"] for item in items] == \
+        [item["bidNtceNo"] for item in stub.notices[SERVC] + stub.notices[CNSTWK]]
+
+
+def test_find_bid_notice_searches_every_field(stub):
+    stub.notices[SERVC] = _notices("F", 3)
+    client = _client(stub)
+    biz_field, items = client.find_bid_notice({"inqryDiv": "2", "bidNtceNo": "F00001"})
+    assert biz_field == "용역" and [item["bidNtceNo"] for item in items] == ["F00001"]
+    assert client.find_bid_notice({"inqryDiv": "2", "bidNtceNo": "없음"}) == (None, [])
@@ -0,0 +1,61 @@
+# batch_rescoring: 여러 프로세스로 계산한 결과가 한 개씩 차례로 계산한 결과와 같은지, 취소하면 끝난 것만 돌려주는지 확인합니다.
+import random
+from datetime import date
+
+import pytest
+
+import batch_rescoring
+import calculation_logic
+from company_repository import get_repository
+
+CONTEXT = {
+    "price_data": {"estimation_price": 2_500_000_000, "notice_base_amount": 2_750_000_000,
+                   "tuchal_amount": 2_400_000_000},
+    "announcement_date": date(2025, 3, 1), "rule_info": ("행안부", "30억미만"), "region_limit": "서울",
+    "sipyung_info": {"is_limited": True, "limit_amount": 2_500_000_000, "method": "비율제",
+                     "tuchal_amount": 2_400_000_000},
+}
+
+
+def _consortiums(company_workbook, count):
+    companies = [comp for comp in get_repository().get_companies(company_workbook) if comp.get("검색된 회사")]
+    rnd = random.Random(count)
+    consortiums = []
+    for _ in range(count):
+        members = rnd.sample(companies, rnd.choice([2, 3]))
+        shares = [0.6, 0.4] if len(members) == 2 else [0.5, 0.3, 0.2]
+        consortiums.append([{"role": "대표사" if i == 0 else f"구성사 {i}", "name": comp["검색된 회사"], "data": comp,
+                             "share": share, "source_type": "전기"} for i, (comp, share) in enumerate(zip(members, shares))])
+    return consortiums
+
+
+def _serial(consortiums):
+    return [calculation_logic.calculate_consortium(companies, **CONTEXT) for companies in consortiums]
+
+
+@pytest.mark.parametrize("count", [batch_rescoring.MIN_PARALLEL_JOBS - 1, batch_rescoring.MIN_PARALLEL_JOBS + 12])
+def test_matches_serial_path(company_workbook, count):
+    consortiums = _consortiums(company_workbook, count)
+    progress = []
+    results = batch_rescoring.rescore_consortiums(
+        consortiums, CONTEXT, max_workers=2,
+        on_result=lambda position, result, done, total: progress.append((position, done, total)))
+
+    assert results == _serial(consortiums)
+    assert sorted(position for position, _, _ in progress) == list(range(count))
+    assert [done for _, done, _ in progress] == list(range(1, count + 1))
+    assert {total for _, _, total in progress} == {count}
+
+
+@pytest.mark.parametrize("count", [batch_rescoring.MIN_PARALLEL_JOBS - 1, batch_rescoring.MIN_PARALLEL_JOBS * 5])
+def test_cancel_returns_finished_results_in_input_order(company_workbook, count):
+    consortiums = _consortiums(company_workbook, count)
+    finished = []
+    results = batch_rescoring.rescore_consortiums(
+        consortiums, CONTEXT, max_workers=2,
+        on_result=lambda position, result, done, total: finished.append(position),
+        should_cancel=lambda: bool(finished))
+
+    assert 1 <= len(results) == len(finished) < count
+    expected = _serial(consortiums)
+    assert results == [expected[position] for position in sorted(finished)]
@@ -0,0 +1,95 @@
+# batch_scoring: 배열로 한꺼번에 계산한 경영상태 점수가 업체별 계산(calculation_logic.calculate_business_score)과 같은지 확인합니다.
+import itertools
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+import batch_scoring
+import calculation_logic
+from config import BUSINESS_SCORE_TABLES, CONSORTIUM_RULES, DURATION_SCORE_TABLES, INDUSTRY_AVERAGES
+
+ANNOUNCEMENT_DATE = date(2025, 6, 1)
+RULES = [(mode, rule) for mode, rules in CONSORTIUM_RULES.items() for rule in rules]
+INDUSTRIES = [*INDUSTRY_AVERAGES, "기타", None]
+
+CREDIT_RATINGS = [None, "", "AA+ (25.01.01~25.12.31)", "BB- (25.03.01~26.02.28)", "B0 (24.01.01~24.12.31)",
+                  "CCC+ (25.05.31~26.05.30)", "XYZ (25.01.01~25.12.31)", "A0", "  "]
+ODD_RATIOS = [None, "", " ", "abc", "12.5%", " 80 % ", 0, "0", -5, "1e3", float("inf")]
+DURATIONS = [None, "", "3.5.1", "없음", "0년", 1, "4.99년", "20년 이상"]
+STATUSES = ["최신", "만료", None]
+
+
+def _boundary_ratios(table_id, average):
+    """점수표 기준값(업종 평균 대비 %)에 딱 맞는 재무비율과 그 바로 위/아래 값"""
+    values = []
+    for threshold, _ in BUSINESS_SCORE_TABLES.get(table_id, []):
+        if np.isfinite(threshold):
+            ratio = threshold * average / 100
+            values += [ratio, np.nextafter(ratio, -np.inf), np.nextafter(ratio, np.inf), round(ratio, 2)]
+    return values
+
+
+def _boundary_durations(ruleset):
+    values = []
+    for threshold, _ in DURATION_SCORE_TABLES.get(ruleset.get("duration_score_table_id"), []):
+        values += [threshold, f"{threshold}년", threshold - 0.01, f"{threshold + 0.5}년"]
+    return values
+
+
+def _company(debt, current, duration="10년", credit=None, debt_status="최신", current_status="최신"):
+    status = {key: value for key, value in (("부채비율", debt_status), ("유동비율", current_status)) if value}
+    return {"부채비율": debt, "유동비율": current, "영업기간": duration, "신용평가": credit, "데이터상태": status}
+
+
+def _companies(ruleset, industry):
+    averages = INDUSTRY_AVERAGES.get(industry, {"부채비율": 100.0, "유동비율": 100.0})
+    debts = _boundary_ratios(ruleset.get("debt_score_table_id"), averages["부채비율"]) + ODD_RATIOS
+    currents = _boundary_ratios(ruleset.get("current_score_table_id"), averages["유동비율"]) + ODD_RATIOS
+    companies = [_company(debt, current) for debt, current in itertools.product(debts, currents)]
+    companies += [_company(50.0, 150.0, duration=duration)
+                  for duration in _boundary_durations(ruleset) + DURATIONS]
+    companies += [_company(debt, 120.0, credit=credit)
+                  for debt, credit in itertools.product([10.0, 200.0, "abc"], CREDIT_RATINGS)]
+    companies += [_company(80.0, 120.0, credit="AA+ (25.01.01~25.12.31)", debt_status=debt_status,
+                           current_status=current_status)
+                  for debt_status, current_status in itertools.product(STATUSES, STATUSES)]
+    companies += [{}, None]
+    return companies
+
+
+def _assert_same(companies, industry, ruleset):
+    calculation_logic.clear_business_score_cache()
+    expected = [calculation_logic.calculate_business_score(company, industry, ANNOUNCEMENT_DATE, ruleset)
+                for company in companies]
+    actual = batch_scoring.calculate_business_scores(companies, industry, ANNOUNCEMENT_DATE, ruleset)
+    for company, scalar, vector in zip(companies, expected, actual):
+        assert vector == scalar, company
+
+
+@pytest.mark.parametrize("industry", INDUSTRIES)
+@pytest.mark.parametrize("rule_info", RULES, ids="/".join)
+def test_matches_scalar_on_boundaries(rule_info, industry):
+    ruleset = CONSORTIUM_RULES[rule_info[0]][rule_info[1]]
+    _assert_same(_companies(ruleset, industry), industry, ruleset)
+
+
+@pytest.mark.parametrize("rule_info", RULES, ids="/".join)
+def test_matches_scalar_on_random_companies(rule_info):
+    ruleset = CONSORTIUM_RULES[rule_info[0]][rule_info[1]]
+    rnd = random.Random(8)
+
+    def ratio():
+        choice = rnd.random()
+        if choice < 0.1:
+            return rnd.choice(ODD_RATIOS)
+        value = rnd.uniform(0, 400)
+        return f"{value:.1f}%" if choice < 0.3 else round(value, rnd.choice([0, 2, 4]))
+
+    companies = [_company(ratio(), ratio(), duration=rnd.choice(DURATIONS + [f"{rnd.randint(0, 40)}년"]),
+                          credit=rnd.choice(CREDIT_RATINGS), debt_status=rnd.choice(STATUSES + ["최신"] * 6),
+                          current_status=rnd.choice(STATUSES + ["최신"] * 6))
+                 for _ in range(2000)]
+    for industry in INDUSTRY_AVERAGES:
+        _assert_same(companies, industry, ruleset)
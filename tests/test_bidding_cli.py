@@ -0,0 +1,74 @@
+# bidding_cli: 합성 업체 파일로 search/score 명령을 끝까지 실행해 보고, engine이 화면(PySide6) 없이 동작하는지 확인합니다.
+import os
+import sys
+import json
+import subprocess
+
+from openpyxl import load_workbook
+
+import bidding_cli
+import engine
+import report_writer
+import utils
+from company_repository import get_repository
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_engine_does_not_import_pyside(tmp_path):
+    """새 프로세스에서 engine/bidding_cli만 불러왔을 때 PySide6가 함께 불려 오지 않아야 합니다."""
+    code = "import sys, engine, bidding_cli; print(sorted(m for m in sys.modules if m.split('.')[0] == 'PySide6'))"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=str(tmp_path), capture_output=True, text=True,
+                               env={**os.environ, "PYTHONPATH": ROOT}, check=True)
+    assert completed.stdout.strip() == "[]"
+
+
+def test_search_command(company_workbook, tmp_path, capsys):
+    output = tmp_path / "결과.json"
+    code = bidding_cli.main(["search", company_workbook, "--min-sipyung", "10억", "-o", str(output)])
+
+    assert code == 0
+    expected = [comp for comp in get_repository().get_companies(company_workbook)
+                if (utils.parse_amount(str(comp.get("시평", ""))) or 0) >= 1_000_000_000]
+    saved = json.loads(output.read_text(encoding='utf-8'))
+    assert saved["filters"] == {"min_sipyung": 1_000_000_000}
+    assert saved["count"] == len(expected) > 0
+    assert [comp["검색된 회사"] for comp in saved["companies"]] == [comp["검색된 회사"] for comp in expected]
+    assert f"검색 결과: {len(expected)}개 업체" in capsys.readouterr().out
+
+    xlsx = tmp_path / "결과.xlsx"
+    assert bidding_cli.main(["search", company_workbook, "--name", "", "-o", str(xlsx)]) == 0
+    rows = list(load_workbook(xlsx).active.iter_rows(values_only=True))
+    assert list(rows[0]) == engine.COMPANY_COLUMNS
+    assert len(rows) - 1 == len(get_repository().get_companies(company_workbook))
+
+
+def test_score_command(company_workbook, tmp_path, capsys):
+    companies = [comp for comp in get_repository().get_companies(company_workbook) if comp.get("사업자번호")]
+    spec = {"mode": "행안부", "rule": "30억미만", "announcement_date": "2025-03-01", "estimation_price": "25억",
+            "base_amount": "27억", "region_limit": "전체", "sipyung_limit": True, "source": company_workbook,
+            "consortiums": [[{"company": companies[0]["사업자번호"], "share": 60},
+                             {"company": companies[1]["사업자번호"], "share": 40}],
+                            [{"company": companies[2]["사업자번호"], "share": 100}]]}
+    spec_path, output, xlsx = tmp_path / "공고조건.json", tmp_path / "결과.json", tmp_path / "보고서.xlsx"
+    spec_path.write_text(json.dumps(spec, ensure_ascii=False), encoding='utf-8')
+
+    code = bidding_cli.main(["score", str(spec_path), "-o", str(output), "--xlsx", str(xlsx), "-j", "1",
+                             "-t", os.path.join(ROOT, report_writer.TEMPLATE_FILENAME)])
+
+    assert code == 0
+    results = json.loads(output.read_text(encoding='utf-8'))["results"]
+    assert [[detail["share"] for detail in result["company_details"]] for result in results] == [[0.6, 0.4], [1.0]]
+    printed = capsys.readouterr().out
+    for number, result in enumerate(results, start=1):
+        assert f"[{number}] 예상점수 {result['expected_score']:.4f}" in printed
+    ws = load_workbook(xlsx).active
+    assert ws.cell(report_writer.FIRST_DATA_ROW, report_writer.SHARE_COLUMN).value == 0.6
+    assert ws.cell(report_writer.FIRST_DATA_ROW + 1, report_writer.SHARE_COLUMN).value == 1.0
+
+
+def test_invalid_spec_reports_error(tmp_path, capsys):
+    spec_path = tmp_path / "공고조건.json"
+    spec_path.write_text(json.dumps({"mode": "행안부", "rule": "없는기준"}), encoding='utf-8')
+    assert bidding_cli.main(["score", str(spec_path)]) == 1
+    assert "심사 기준을 찾을 수 없습니다" in capsys.readouterr().err
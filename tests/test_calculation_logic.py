@@ -0,0 +1,60 @@
+# calculation_logic: 협정 계산 결과가 서로 값을 공유하지 않는지, 검토 창의 시평액 값이 점수 계산과 같은지 확인합니다.
+from datetime import date
+
+import calculation_logic
+
+CONTEXT = {
+    "price_data": {"estimation_price": 2_500_000_000, "notice_base_amount": 2_750_000_000,
+                   "tuchal_amount": 2_400_000_000},
+    "announcement_date": date(2025, 3, 1), "rule_info": ("행안부", "30억미만"), "region_limit": "전체",
+    "sipyung_info": {"is_limited": False, "limit_amount": 0, "method": "비율제", "tuchal_amount": 2_400_000_000},
+}
+
+
+def member(name, share, debt="80.00"):
+    return {"role": name, "name": name, "source_type": "전기", "share": share,
+            "data": {"검색된 회사": name, "사업자번호": f"{name}-번호", "지역": "서울", "부채비율": debt,
+                     "유동비율": "250.00", "영업기간": "12.0년", "신용평가": "", "5년 실적": 1_000_000_000,
+                     "시평": 3_000_000_000, "데이터상태": {"부채비율": "최신", "유동비율": "최신"}}}
+
+
+def test_business_score_cache_returns_copies():
+    cache = {}
+    first = calculation_logic.calculate_consortium([member("가나전기", 0.6), member("다라전기", 0.4, debt="200.00")],
+                                                   business_score_cache=cache, **CONTEXT)
+    second = calculation_logic.calculate_consortium([member("가나전기", 0.5), member("마바전기", 0.5)],
+                                                    business_score_cache=cache, **CONTEXT)
+
+    first_details = first["company_details"][0]["business_score_details"]
+    second_details = second["company_details"][0]["business_score_details"]
+    assert first_details == second_details and first_details is not second_details
+
+    first_details["total"] = -1
+    assert second_details["total"] != -1
+    assert cache[("가나전기", "가나전기-번호", "전기")]["total"] != -1
+    again = calculation_logic.calculate_consortium([member("가나전기", 1.0)], business_score_cache=cache, **CONTEXT)
+    assert again["company_details"][0]["business_score_details"] == second_details
+
+
+def test_cached_and_uncached_results_match():
+    companies = [member("가나전기", 0.6), member("다라전기", 0.4, debt="200.00")]
+    cached = calculation_logic.calculate_consortium(companies, business_score_cache={}, **CONTEXT)
+    assert cached == calculation_logic.calculate_consortium(companies, **CONTEXT)
+
+
+def test_sipyung_totals_match_consortium_check():
+    """검토 창(review_dialog)에 표시하는 평가액과 시평액 제한 검사의 평가액이 같아야 합니다."""
+    companies = [member("가나전기", 0.6), member("다라전기", 0.4)]
+    companies[1]["data"]["시평"] = "12억 5,000만"
+    result = calculation_logic.calculate_consortium(companies, **CONTEXT)
+    sipyung_sum, sipyung_ratio = calculation_logic.sipyung_totals(result["company_details"])
+    assert sipyung_sum == 3_000_000_000 + 1_250_000_000
+    assert sipyung_ratio == 3_000_000_000 * 0.6 + 1_250_000_000 * 0.4
+
+    for method, value in (("비율제", sipyung_ratio), ("합산제", sipyung_sum)):
+        for limit_amount, passed in ((value, True), (value + 1, False)):
+            sipyung_info = {**CONTEXT["sipyung_info"], "is_limited": True, "method": method,
+                            "limit_amount": limit_amount}
+            checked = calculation_logic.calculate_consortium(companies, **{**CONTEXT, "sipyung_info": sipyung_info})
+            assert checked["sipyung_check_result"]["passed"] is passed, (method, limit_amount)
+            assert f"평가액: {value:,.0f}원" in checked["sipyung_check_result"]["message"]
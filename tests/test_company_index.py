@@ -0,0 +1,62 @@
+# company_index: 색인 검색(CompanyIndex.filter)이 목록을 훑는 search_logic.filter_companies와 같은 결과를 내는지 확인합니다.
+import random
+
+import pytest
+
+import search_logic
+from company_index import CompanyIndex
+from company_repository import get_repository
+from utils import normalize_company_name
+
+_CORPORATE_CHARS = set("주식회사유합재()㈜")
+
+
+@pytest.fixture(scope="module")
+def companies(company_workbook):
+    return get_repository().get_companies(company_workbook)
+
+
+def _assert_same(companies, filters):
+    index = CompanyIndex(companies)
+    assert index.filter(filters) == search_logic.filter_companies(companies, filters), filters
+
+
+@pytest.mark.parametrize("name", ["(주)", "주식회사", "㈜", "주식회사 ", " ", "(유)"])
+def test_corporate_form_only_query_is_not_ignored(companies, name):
+    _assert_same(companies, {"name": name})
+    results = CompanyIndex(companies).filter({"name": name})
+    assert len(results) < len(companies)
+
+
+def test_matches_filter_companies_on_random_filters(companies):
+    rnd = random.Random(5)
+    names = [normalize_company_name(comp["검색된 회사"]) for comp in companies]
+    remarks = [str(comp.get("비고", "")) for comp in companies if comp.get("비고")]
+    regions = sorted({comp["대표지역"] for comp in companies}) + ["전체"]
+    amounts = [None, 1e8, 5e8, 1e9, 3e9, 1e10]
+
+    for _ in range(400):
+        filters = {}
+        if rnd.random() < 0.5:
+            name = rnd.choice(names)
+            start = rnd.randrange(len(name))
+            fragment = name[start:start + rnd.randint(2, 4)]
+            # 법인 표기 글자가 섞인 조각은 정규화 때문에 의도적으로 결과가 다를 수 있어 제외합니다.
+            if len(fragment) >= 2 and not _CORPORATE_CHARS & set(fragment):
+                filters["name"] = fragment.upper() if rnd.random() < 0.2 else fragment
+        if rnd.random() < 0.3 and remarks:
+            remark = rnd.choice(remarks)
+            filters["manager"] = remark[:rnd.randint(1, len(remark))]
+        if rnd.random() < 0.4:
+            filters["region"] = rnd.choice(regions)
+        for key in ("sipyung", "perf_3y", "perf_5y"):
+            if rnd.random() < 0.3:
+                low, high = sorted([rnd.choice(amounts[1:]), rnd.choice(amounts)], key=lambda v: v or float("inf"))
+                filters[f"min_{key}"], filters[f"max_{key}"] = low, high
+        _assert_same(companies, filters)
+
+
+def test_no_match_and_empty_list(companies):
+    _assert_same(companies, {"name": "없는회사이름"})
+    _assert_same(companies, {"min_sipyung": 1e15})
+    assert CompanyIndex([]).filter({}) == search_logic.filter_companies([], {})
@@ -0,0 +1,85 @@
+# company_repository: 여러 업체 파일 중 일부를 읽지 못해도 그 오류가 호출한 쪽에 전달되는지 확인합니다. (오류 로그는 임시 폴더에 기록)
+import logging
+import os
+import threading
+
+from company_repository import CompanyRepository
+
+
+def test_error_log_is_outside_repository():
+    """아래 테스트들이 남기는 파일 열기 오류 로그는 저장소의 logs/search_errors.log가 아닌 임시 폴더에 쌓여야 합니다."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    log_files = [handler.baseFilename for handler in logging.getLogger().handlers
+                 if isinstance(handler, logging.FileHandler)]
+    assert not [path for path in log_files if path.startswith(root + os.sep)]
+
+
+def _broken_workbook(tmp_path):
+    path = tmp_path / "깨진 파일.xlsx"
+    path.write_bytes(b"not an xlsx file")
+    return str(path)
+
+
+def test_search_sources_reports_failed_source(tmp_path, company_workbook):
+    repository = CompanyRepository()
+    broken = _broken_workbook(tmp_path)
+    expected = repository.search(company_workbook, {})
+
+    results, sources, failures = repository.search_sources([("전기", company_workbook), ("통신", broken)], {})
+
+    assert results == expected
+    assert sources == ["전기"] * len(expected)
+    assert [source_key for source_key, _ in failures] == ["통신"]
+    assert failures[0][1].startswith("파일 열기 오류")
+
+
+def test_search_sources_no_match_is_not_failure(company_workbook):
+    results, sources, failures = CompanyRepository().search_sources(
+        [("전기", company_workbook)], {"name": "절대 없는 업체 이름"})
+
+    assert failures == [] and sources == []
+    assert "오류" in results[0]
+
+
+def test_search_sources_all_failed_returns_error(tmp_path):
+    results, sources, failures = CompanyRepository().search_sources(
+        [("전기", _broken_workbook(tmp_path)), ("소방", str(tmp_path / "없는 파일.xlsx"))], {})
+
+    assert sources == []
+    assert [source_key for source_key, _ in failures] == ["전기", "소방"]
+    assert "[전기]" in results[0]["오류"] and "[소방]" in results[0]["오류"]
+
+
+def test_preload_sources_returns_errors(tmp_path, company_workbook):
+    repository = CompanyRepository()
+    loaded = []
+    source_files = {"전기": company_workbook, "통신": _broken_workbook(tmp_path),
+                    "소방": str(tmp_path / "없는 파일.xlsx")}
+
+    errors = repository.preload_sources(source_files, on_loaded=lambda *args: loaded.append(args), max_workers=1)
+
+    assert set(errors) == {"통신", "소방"}
+    assert {args[0]: args[2] for args in loaded} == {"전기": None, **errors}
+    # 이미 읽은 파일은 다시 읽지 않고, 실패한 파일은 다시 알립니다.
+    assert set(repository.preload_sources(source_files, max_workers=1)) == {"통신", "소방"}
+
+
+def test_is_fresh_during_concurrent_installs(company_workbook):
+    repository = CompanyRepository()
+    repository.get_index(company_workbook)
+    stop = threading.Event()
+
+    def reinstall():
+        while not stop.is_set():
+            repository.refresh(company_workbook)
+            repository.get_index(company_workbook)
+
+    worker = threading.Thread(target=reinstall)
+    worker.start()
+    try:
+        for _ in range(200):
+            repository._is_fresh(company_workbook)
+    finally:
+        stop.set()
+        worker.join()
+    assert repository._is_fresh(company_workbook)
@@ -0,0 +1,73 @@
+# consortium_optimizer: 최적 지분이 calculate_consortium의 검증 항목을 모두 통과하는지 확인합니다.
+from datetime import date
+
+import pytest
+
+import calculation_logic
+import consortium_optimizer
+
+ANNOUNCEMENT_DATE = date(2025, 3, 1)
+
+
+def company(name, region, sipyung, performance, debt="80.00", current="250.00"):
+    return {
+        "role": name, "name": name, "source_type": "전기", "share": 0,
+        "data": {"검색된 회사": name, "지역": region, "부채비율": debt, "유동비율": current, "영업기간": "12.0년",
+                 "신용평가": "", "5년 실적": performance, "시평": sipyung,
+                 "데이터상태": {"부채비율": "최신", "유동비율": "최신"}},
+    }
+
+
+def conditions(rule, limit_amount, method="비율제", tuchal=4_000_000_000, region="전체"):
+    return {
+        "price_data": {"estimation_price": 4_000_000_000, "notice_base_amount": 4_400_000_000, "tuchal_amount": tuchal},
+        "announcement_date": ANNOUNCEMENT_DATE, "rule_info": ("행안부", rule), "region_limit": region,
+        "sipyung_info": {"is_limited": True, "limit_amount": limit_amount, "method": method, "tuchal_amount": tuchal},
+    }
+
+
+@pytest.mark.parametrize("rule", ["30억미만", "30억이상"])
+def test_optimized_split_passes_sipyung_checks(rule):
+    companies = [company("가나전기", "서울", 3_500_000_000, 1_000_000_000),
+                 company("다라전기", "경기", 1_500_000_000, 6_000_000_000, debt="200.00", current="90.00"),
+                 company("마바전기", "서울", 2_500_000_000, 2_000_000_000)]
+    optimized = consortium_optimizer.optimize_shares(companies, duty_ratio=None, min_share=0.0,
+                                                     **conditions(rule, 2_800_000_000))
+    assert "오류" not in optimized
+
+    result = optimized["result"]
+    assert result["sipyung_check_result"]["passed"], result["sipyung_check_result"]["message"]
+    assert all(item["passed"] for item in result["individual_sipyung_results"])
+    assert sum(optimized["shares"]) == pytest.approx(1.0)
+    limits = calculation_logic.check_share_limit(result["company_details"], 4_000_000_000)
+    assert not any(item["is_problem"] for item in limits)
+
+
+def test_sipyung_check_uses_fractional_shares():
+    companies = [{**company("가나전기", "서울", 3_000_000_000, 0), "share": 0.5},
+                 {**company("다라전기", "서울", 1_000_000_000, 0), "share": 0.5}]
+    # 비율제 평가액 = 30억 × 0.5 + 10억 × 0.5 = 20억
+    passed = calculation_logic.calculate_consortium(companies, **conditions("30억미만", 2_000_000_000))
+    failed = calculation_logic.calculate_consortium(companies, **conditions("30억미만", 2_000_000_001))
+    assert passed["sipyung_check_result"]["passed"]
+    assert not failed["sipyung_check_result"]["passed"]
+
+    limits = calculation_logic.check_share_limit(companies, 4_000_000_000)
+    assert [item["input_share"] for item in limits] == [50.0, 50.0]
+    assert [item["is_problem"] for item in limits] == [False, True]
+
+
+def test_min_share_keeps_every_member():
+    # 시평액이 큰 대표사 혼자서도 조건을 채우는 구성: 최소 지분이 없으면 구성사 지분이 0이 될 수 있음
+    companies = [company("가나전기", "서울", 9_000_000_000, 9_000_000_000),
+                 company("다라전기", "서울", 500_000_000, 0, debt="300.00", current="60.00")]
+    optimized = consortium_optimizer.optimize_shares(companies, min_share=consortium_optimizer.MIN_MEMBER_SHARE,
+                                                     **conditions("30억미만", 0))
+    assert "오류" not in optimized
+    assert min(optimized["shares"]) >= consortium_optimizer.MIN_MEMBER_SHARE
+
+
+def test_infeasible_limit_returns_error():
+    companies = [company("가나전기", "서울", 1_000_000_000, 0), company("다라전기", "서울", 1_000_000_000, 0)]
+    optimized = consortium_optimizer.optimize_shares(companies, **conditions("30억미만", 5_000_000_000))
+    assert "오류" in optimized
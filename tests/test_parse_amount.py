@@ -0,0 +1,131 @@
+# utils.parse_amount: 한 번에 읽는 새 파서가 이전 정규식 파서(아래 _baseline_parse_amount)와 같은 값을 내는지 확인합니다.
+#
+# 의도한 차이 (이전 파서가 잘못 읽거나 읽지 못하던 입력):
+#   1. 조/천/백/십 단위를 읽습니다. 이전: '3천만' -> 3만(천을 버림), '1조' -> None, '5백만' -> None
+#      지금: '3천만' -> 3천만, '1조' -> 1조, '5백만' -> 5백만, '천만' -> 1천만
+#   2. 같은 큰 단위가 여러 번 나오면 모두 더합니다. 이전: '1억 2억' -> 1억(첫 번째만), 지금: 3억
+#   3. 앞에 숫자가 없는 큰 단위('만3', '억5000')는 0으로 보고 나머지 숫자를 읽습니다. 이전: None
+#   4. '1.2.3억'처럼 숫자가 아닌 조각은 0으로 봅니다. 이전: ValueError 발생
+# 그 밖의 입력(엑셀 숫자 셀, 쉼표/공백/'원'이 섞인 'N억 N만 N' 형식, 빈 값, 글자만 있는 값)은 결과가 같아야 합니다.
+import re
+import random
+
+import numpy as np
+import pytest
+
+import utils
+
+
+def _baseline_parse_amount(amount_str):
+    """변경 전 utils.parse_amount (비교 기준으로 그대로 옮겨 둠)"""
+    if amount_str is None or not str(amount_str).strip():
+        return None
+
+    s = str(amount_str).strip().replace(',', '')
+    s = re.sub(r'[^\d.억만백십]', '', s)
+
+    total = 0.0
+    억_match = re.search(r'([\d.]+)\s*억', s)
+    if 억_match:
+        total += float(억_match.group(1)) * 100000000
+        s = s.replace(억_match.group(0), '')
+
+    만_match = re.search(r'([\d.]+)\s*만', s)
+    if 만_match:
+        total += float(만_match.group(1)) * 10000
+        s = s.replace(만_match.group(0), '')
+
+    if s:
+        try:
+            total += float(s)
+        except ValueError:
+            pass
+
+    return total if total > 0 else None
+
+
+def _documented_difference(text):
+    """위의 의도한 차이(1~3)에 해당하는 입력인지 (4는 이전 파서가 예외를 내므로 따로 확인)"""
+    s = re.sub(r'[^\d.억만백십조천]', '', str(text).replace(',', ''))
+    if re.search(r'[조천백십]', s):
+        return True
+    if s.count('억') > 1 or s.count('만') > 1:
+        return True
+    return bool(re.search(r'(^|[^\d.])[억만]', s))
+
+
+def _assert_same(value):
+    expected = _baseline_parse_amount(value)
+    actual = utils.parse_amount(value)
+    if expected is None:
+        assert actual is None, value
+    else:
+        assert actual == pytest.approx(expected, rel=1e-12), value
+
+
+WORKBOOK_VALUES = [
+    None, "", " ", 0, 0.0, "0", 1, 15, 1234567, 2_500_000_000, 1.5, 12345678.9, 9.87e10, -5000, "-",
+    "1,234,000", " 1,234,000 ", "5,000원", "1억", "1억 5,000만", "2억3000만", "3억 2,500만 1,000원", "12.5억",
+    "0.5억", "7,500만", "1억원", "100만 원", "  25억  ", "N/A", "해당없음", "없음", "1억5000", "5만1억",
+]
+
+
+@pytest.mark.parametrize("value", WORKBOOK_VALUES)
+def test_workbook_values_match_baseline(value):
+    _assert_same(value)
+
+
+def _well_formed(rng):
+    parts = []
+    if rng.random() < 0.5:
+        parts.append(f"{rng.randint(1, 999):,}억" if rng.random() < 0.8 else f"{rng.uniform(0.1, 99):.1f}억")
+    if rng.random() < 0.5:
+        parts.append(f"{rng.randint(1, 9999):,}만")
+    if rng.random() < 0.5 or not parts:
+        parts.append(f"{rng.randint(0, 9999):,}")
+    text = rng.choice(["", " "]).join(parts)
+    return text + rng.choice(["", "원", " 원"]) if rng.random() < 0.5 else rng.choice(["", " "]) + text
+
+
+def test_fuzzed_well_formed_amounts_match_baseline():
+    rng = random.Random(22)
+    for _ in range(5000):
+        _assert_same(_well_formed(rng))
+
+
+def test_fuzzed_garbage_matches_baseline_outside_documented_differences():
+    rng = random.Random(2022)
+    alphabet = list("0123456789") * 3 + list(",. 억만원-abc") + ["  "]
+    compared = 0
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        try:
+            expected = _baseline_parse_amount(text)
+        except ValueError:
+            utils.parse_amount(text)  # 차이 4: 예외 없이 읽어야 함
+            continue
+        if _documented_difference(text):
+            continue
+        actual = utils.parse_amount(text)
+        assert (actual is None) == (expected is None), text
+        if expected is not None:
+            assert actual == pytest.approx(expected, rel=1e-12), text
+        compared += 1
+    assert compared > 10000
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1조", 1e12), ("1조 2,500억", 1.25e12), ("3천만", 3e7), ("3천5백만", 3.5e7), ("천만", 1e7), ("5백만원", 5e6),
+    ("2십만", 2e5), ("1억 2억", 3e8), ("만3", 3.0), ("1.2.3억", None), ("억", None),
+])
+def test_documented_differences(text, expected):
+    assert utils.parse_amount(text) == (pytest.approx(expected) if expected is not None else None)
+
+
+def test_parse_amounts_matches_parse_amount():
+    values = WORKBOOK_VALUES + ["3천만", "1조"]
+    amounts = utils.parse_amounts(values)
+    assert amounts.dtype == float and len(amounts) == len(values)
+    for value, amount in zip(values, amounts):
+        single = utils.parse_amount(value)
+        assert np.isnan(amount) if single is None else amount == single
@@ -0,0 +1,58 @@
+# partner_recommender: 추천 결과가 후보별 최적 지분 계산과 같고, 구성사 지분이 최소 지분 이상인지 확인합니다.
+from datetime import date
+
+import pytest
+
+import consortium_optimizer
+import partner_recommender
+from company_repository import get_repository
+
+CONDITIONS = {
+    "price_data": {"estimation_price": 3_000_000_000, "notice_base_amount": 3_300_000_000,
+                   "tuchal_amount": 2_900_000_000},
+    "announcement_date": date(2025, 3, 1), "rule_info": ("행안부", "30억미만"), "region_limit": "전체",
+    "sipyung_info": {"is_limited": False, "limit_amount": 0, "method": "비율제", "tuchal_amount": 2_900_000_000},
+}
+
+
+def dominant_leader():
+    """혼자서도 조건을 채우고 점수도 가장 높은 대표사 (최소 지분이 없으면 구성사 지분이 0이 됨)"""
+    return {"role": "대표사", "name": "대표전기", "source_type": "전기", "share": 0,
+            "data": {"검색된 회사": "대표전기", "지역": "서울", "부채비율": "10.00", "유동비율": "900.00",
+                     "영업기간": "30.0년", "신용평가": "", "5년 실적": 9_000_000_000, "시평": 20_000_000_000,
+                     "데이터상태": {"부채비율": "최신", "유동비율": "최신"}}}
+
+
+def test_partners_keep_minimum_share(company_workbook):
+    recommendations = partner_recommender.recommend_partners(dominant_leader(), "전기", company_workbook,
+                                                             top_k=5, **CONDITIONS)
+    assert recommendations and "오류" not in recommendations[0]
+    for item in recommendations:
+        assert item["shares"][1] >= consortium_optimizer.MIN_MEMBER_SHARE
+        assert sum(item["shares"]) == pytest.approx(1.0)
+    scores = [item["expected_score"] for item in recommendations]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_matches_optimizing_each_candidate(company_workbook):
+    leader = dominant_leader()
+    recommendations = partner_recommender.recommend_partners(leader, "전기", company_workbook, top_k=5, **CONDITIONS)
+
+    expected = []
+    for company in get_repository().get_companies(company_workbook):
+        if not company.get("검색된 회사"):
+            continue
+        partner = {"role": "구성사 1", "name": company["검색된 회사"], "data": company, "source_type": "전기", "share": 0}
+        optimized = consortium_optimizer.optimize_shares([leader, partner],
+                                                         min_share=consortium_optimizer.MIN_MEMBER_SHARE, **CONDITIONS)
+        if "오류" not in optimized:
+            expected.append(optimized["expected_score"])
+    expected.sort(reverse=True)
+
+    assert [item["expected_score"] for item in recommendations] == pytest.approx(expected[:5])
+
+
+def test_fixed_leader_share_must_leave_room_for_partner(company_workbook):
+    recommendations = partner_recommender.recommend_partners(dominant_leader(), "전기", company_workbook,
+                                                             leader_share=1.0, **CONDITIONS)
+    assert "오류" in recommendations[0]
@@ -0,0 +1,112 @@
+# report_writer: 함께 배포하는 행안부 보고서 양식(haeng_template.xlsx)으로 보고서를 만들어 셀 값과 행 수를 확인합니다.
+import os
+from datetime import date
+
+import pytest
+from openpyxl import load_workbook
+
+import calculation_logic
+import report_writer
+import utils
+from company_repository import get_repository
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), report_writer.TEMPLATE_FILENAME)
+HEADER = {"estimation_price": 2_500_000_000, "gongo_no": "R25BK00000001", "gongo_title": "전기공사",
+          "bid_opening": "2025-03-10 11:00", "region_limit": "전체"}
+CONTEXT = {
+    "price_data": {"estimation_price": 2_500_000_000, "notice_base_amount": 2_750_000_000,
+                   "tuchal_amount": 2_400_000_000},
+    "announcement_date": date(2025, 3, 1), "rule_info": ("행안부", "30억미만"), "region_limit": "전체",
+    "sipyung_info": {"is_limited": False, "limit_amount": 0, "method": "비율제", "tuchal_amount": 2_400_000_000},
+}
+
+
+@pytest.fixture(scope="module")
+def template_rows():
+    """템플릿에 준비된 마지막 협정 행"""
+    return report_writer._last_template_row(load_workbook(TEMPLATE).active)
+
+
+def _consortiums(company_workbook, count):
+    companies = get_repository().get_companies(company_workbook)
+    results = []
+    for number in range(count):
+        leader, member = companies[number % len(companies)], companies[(number + 1) % len(companies)]
+        results.append(calculation_logic.calculate_consortium([
+            {"role": "대표사", "name": leader["검색된 회사"], "data": leader, "source_type": "전기", "share": 0.6},
+            {"role": "구성사 1", "name": member["검색된 회사"], "data": member, "source_type": "전기", "share": 0.4},
+        ], **CONTEXT))
+    return results
+
+
+def _render(tmp_path, consortiums, template=TEMPLATE):
+    path = report_writer.write_report(consortiums, HEADER, str(tmp_path / "보고서.xlsx"), template=template)
+    return load_workbook(path).active
+
+
+def test_renders_bundled_template(tmp_path, company_workbook, template_rows):
+    consortiums = _consortiums(company_workbook, 3)
+    progress = []
+    path = report_writer.write_report(consortiums, HEADER, str(tmp_path / "보고서.xlsx"), template=TEMPLATE,
+                                      progress=lambda done, total: progress.append((done, total)))
+    ws = load_workbook(path).active
+
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert ws["D2"].value == HEADER["estimation_price"]
+    assert ws["M1"].value == "R25BK00000001 전기공사"
+    assert ws["P2"].value == HEADER["bid_opening"]
+    for number, result in enumerate(consortiums):
+        row = report_writer.FIRST_DATA_ROW + number
+        for offset, detail in enumerate(result["company_details"]):
+            name_cell = ws.cell(row, report_writer.NAME_COLUMN + offset)
+            assert name_cell.value.split("\n")[0] == utils.strip_corporate_suffix(detail["name"])
+            assert ws.cell(row, report_writer.SHARE_COLUMN + offset).value == detail["share"]
+            assert ws.cell(row, report_writer.SHARE_COLUMN + offset).number_format == "0.00%"
+            assert (ws.cell(row, report_writer.BUSINESS_SCORE_COLUMN + offset).value
+                    == detail["business_score_details"]["total"])
+            assert ws.cell(row, report_writer.PERFORMANCE_COLUMN + offset).value == detail["performance_5y"]
+    # 협정이 적으면 준비된 행은 그대로 남고 늘어나지 않습니다.
+    empty_row = report_writer.FIRST_DATA_ROW + len(consortiums)
+    assert ws.cell(empty_row, report_writer.NAME_COLUMN).value is None
+    assert ws.max_row == template_rows
+
+
+def test_extends_rows_beyond_template(tmp_path, company_workbook, template_rows):
+    count = template_rows - report_writer.FIRST_DATA_ROW + 1 + 4
+    consortiums = _consortiums(company_workbook, count)
+    ws = _render(tmp_path, consortiums)
+
+    last_row = report_writer.FIRST_DATA_ROW + count - 1
+    assert ws.max_row == last_row
+    assert ws.cell(last_row, report_writer.SHARE_SUM_COLUMN).value == f"=SUM(I{last_row}:M{last_row})"
+    assert ws.row_dimensions[last_row].height == ws.row_dimensions[template_rows].height
+    assert ws.cell(last_row, report_writer.SHARE_COLUMN).value == consortiums[-1]["company_details"][0]["share"]
+    assert ws.print_area.endswith(f"${last_row}")
+
+
+def test_rows_below_table_are_kept(tmp_path, company_workbook, template_rows):
+    """표 아래에 메모가 있는 양식이어도 마지막 협정 행을 기준으로 늘리고, 메모는 아래로 밀립니다."""
+    wb = load_workbook(TEMPLATE)
+    wb.active.cell(template_rows + 2, 1, value="작성자 메모")
+    template = str(tmp_path / "메모 양식.xlsx")
+    wb.save(template)
+
+    count = template_rows - report_writer.FIRST_DATA_ROW + 1 + 2
+    ws = _render(tmp_path, _consortiums(company_workbook, count), template=template)
+
+    last_row = report_writer.FIRST_DATA_ROW + count - 1
+    assert ws.cell(last_row, report_writer.SHARE_SUM_COLUMN).value == f"=SUM(I{last_row}:M{last_row})"
+    assert ws.cell(last_row + 2, 1).value == "작성자 메모"
+
+
+def test_member_without_name_does_not_abort_report(tmp_path, company_workbook):
+    consortiums = _consortiums(company_workbook, 2)
+    detail = consortiums[1]["company_details"][1]
+    detail["name"] = None
+    detail["data"] = {**detail["data"], "비고": "김철수 팀장"}
+
+    ws = _render(tmp_path, consortiums)
+
+    row = report_writer.FIRST_DATA_ROW + 1
+    assert ws.cell(row, report_writer.NAME_COLUMN + 1).value == "\n김철수"
+    assert ws.cell(row, report_writer.SHARE_COLUMN + 1).value == detail["share"]
@@ -0,0 +1,48 @@
+# saved_data_catalog: 저장 협정의 업체 역색인(SavedCompanyIndex) 검색이 참여 업체 목록을 훑은 결과와 같은지 확인합니다.
+import pytest
+
+from saved_data_catalog import SavedCompanyIndex
+from utils import normalize_company_name
+
+ENTRIES = [
+    {"filename": "가.bidpack", "mtime_ns": 1, "size": 1,
+     "members": [["(주)가나전기", "123-45-67890", 0, "대표사"], ["다라통신 주식회사", "222-33-44444", 0, "구성사 1"],
+                 ["마바소방", "", 1, "대표사"]]},
+    {"filename": "나.json", "mtime_ns": 1, "size": 1,
+     "members": [["㈜가나전기", "123-45-67890", 2, "구성사 1"], ["사아전기(유)", "555-66-77777", 0, "대표사"]]},
+    {"filename": "다.bidpack", "mtime_ns": 1, "size": 1,
+     "members": [["자차전력", "888-99-00000", 0, "대표사"]]},
+]
+
+
+def _scan(query):
+    """업체명은 정규화 부분 일치(정규화하면 비는 검색어는 소문자 부분 일치)로 참여 업체 목록을 직접 훑습니다."""
+    normalized = normalize_company_name(query)
+    results = {}
+    for entry in ENTRIES:
+        for name, biz_no, position, role in entry["members"]:
+            if normalized:
+                matched = normalized in normalize_company_name(name)
+            else:
+                matched = query.strip().lower() in name.lower()
+            if matched:
+                results.setdefault(entry["filename"], set()).add((position, role, name))
+    return {filename: sorted(hits) for filename, hits in results.items()}
+
+
+@pytest.mark.parametrize("query", ["(주)", "주식회사", "㈜", "(유)", "가나", "전기", "다라 통신", "없는업체"])
+def test_name_search_matches_scan(query):
+    assert SavedCompanyIndex(ENTRIES).search(query) == _scan(query)
+
+
+def test_corporate_form_only_query_does_not_hide_everything():
+    hits = SavedCompanyIndex(ENTRIES).search("(주)")
+    assert hits == {"가.bidpack": [(0, "대표사", "(주)가나전기")]}
+    assert set(SavedCompanyIndex(ENTRIES).search("주식회사")) == {"가.bidpack"}
+
+
+def test_business_number_and_empty_query():
+    index = SavedCompanyIndex(ENTRIES)
+    assert set(index.search("123-45-67890")) == {"가.bidpack", "나.json"}
+    assert set(index.search("888")) == {"다.bidpack"}
+    assert index.search("") is None and index.search("   ") is None
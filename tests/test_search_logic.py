@@ -0,0 +1,75 @@
+# search_logic: 읽기 전용 모드로 한 번 훑는 파서가 기존 전체 모드 파서와 같은 업체 목록을 만드는지 확인합니다.
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import PatternFill
+
+import search_logic
+from config import RELATIVE_OFFSETS
+
+LATEST_FILL = PatternFill(fill_type='solid', fgColor='FFE2EFDA')
+
+
+def _write_block(sheet, header_row, names, values=None):
+    sheet.cell(header_row, 1, "회사명")
+    for item, offset in RELATIVE_OFFSETS.items():
+        sheet.cell(header_row + offset, 1, item)
+    for column, name in enumerate(names, start=2):
+        if name is not None:
+            sheet.cell(header_row, column, name)
+        for item, offset in RELATIVE_OFFSETS.items():
+            value = (values or {}).get((column, item), f"{item}{column}")
+            if value is not None:
+                cell = sheet.cell(header_row + offset, column, value)
+                cell.fill = LATEST_FILL
+
+
+def _edge_workbook(path):
+    """병합 셀, 빈 회사명, 빈 값, 시트 끝에서 잘린 블록, 빈 시트가 섞인 업체 파일"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "서울 "
+    _write_block(sheet, 1, ["(주)가나전기", "  ", None, "다라\t 통신 ", 12345, "마바㈜"],
+                 values={(2, "부채비율"): 0.853, (2, "유동비율"): "145.2%", (2, "신용평가"): " A+  (24.05.01~25.12.30) ",
+                         (3, "시평"): None, (6, "비고"): None, (7, "5년 실적"): "12억 5,000만"})
+    sheet.merge_cells(start_row=1 + RELATIVE_OFFSETS["비고"], start_column=2,
+                      end_row=1 + RELATIVE_OFFSETS["비고"], end_column=4)        # 비고 칸을 가로로 병합
+    sheet.merge_cells(start_row=1 + RELATIVE_OFFSETS["여성기업"], start_column=5,
+                      end_row=1 + RELATIVE_OFFSETS["고용자수"], end_column=5)    # 세로 병합
+    _write_block(sheet, 20, ["사아건설", "자차전력"])
+    sheet.merge_cells(start_row=20, start_column=3, end_row=20, end_column=4)  # 회사명 칸 병합
+    sheet.cell(20 + RELATIVE_OFFSETS["시평"], 9, "오른쪽 밖 값")                  # 길이가 다른 행
+
+    partial = workbook.create_sheet("경기")
+    _write_block(partial, 1, ["카타산업"])
+    _write_block(partial, 20, ["파하기술", "한대엔지니어링"])
+    partial.delete_rows(20 + RELATIVE_OFFSETS["영업기간"], 20)                   # 마지막 블록이 시트 끝에서 잘림
+
+    workbook.create_sheet("빈 시트")
+    workbook.save(path)
+
+
+def _parse_both(path):
+    return search_logic._parse_workbook_streaming(path), search_logic._parse_workbook_full(path)
+
+
+def test_streaming_matches_full_parser_on_edge_cases(tmp_path):
+    path = str(tmp_path / "edge.xlsx")
+    _edge_workbook(path)
+    streaming, full = _parse_both(path)
+
+    assert [dict(comp) for comp in streaming] == [dict(comp) for comp in full]
+    names = [comp["검색된 회사"] for comp in streaming]
+    assert names == ["(주)가나전기", "다라 통신", "마바㈜", "사아건설", "자차전력", "카타산업", "파하기술", "한대엔지니어링"]
+    truncated = streaming[-1]
+    assert truncated["신용평가"] == "N/A" and truncated["데이터상태"]["신용평가"] == "범위 초과"
+
+
+def test_streaming_matches_full_parser_on_generated_workbook(company_workbook):
+    streaming, full = _parse_both(company_workbook)
+    assert len(streaming) == 60
+    assert [dict(comp) for comp in streaming] == [dict(comp) for comp in full]
+
+
+def test_edge_workbook_is_really_merged(tmp_path):
+    path = str(tmp_path / "edge.xlsx")
+    _edge_workbook(path)
+    assert len(load_workbook(path)["서울 "].merged_cells.ranges) == 3
@@ -0,0 +1,160 @@
+# session_store: 압축 형식 저장/읽기 왕복, 예전 형식 호환, 객체 정리(collect_garbage), 객체 캐시 크기를 확인합니다.
+import os
+import json
+import shutil
+from contextlib import closing
+from datetime import date
+
+import pytest
+
+import calculation_logic
+import session_store
+from company_record import json_default
+from company_repository import get_repository
+
+CONTEXT = {
+    "price_data": {"estimation_price": 2_500_000_000, "notice_base_amount": 2_750_000_000,
+                   "tuchal_amount": 2_400_000_000},
+    "announcement_date": date(2025, 3, 1), "rule_info": ("행안부", "30억미만"), "region_limit": "전체",
+    "sipyung_info": {"is_limited": False, "limit_amount": 0, "method": "비율제", "tuchal_amount": 2_400_000_000},
+}
+
+
+def _session(company_workbook, first, count, name="협정"):
+    """업체 first번부터 두 곳씩 묶은 협정 count개를 저장 내용 형식으로 만듭니다. (앞뒤 협정이 업체를 공유)"""
+    companies = [comp for comp in get_repository().get_companies(company_workbook) if comp.get("검색된 회사")]
+    consortiums = []
+    for position in range(first, first + count):
+        members = [{"role": "대표사", "name": companies[position]["검색된 회사"], "data": companies[position],
+                    "share": 0.6, "source_type": "전기"},
+                   {"role": "구성사 1", "name": companies[position + 1]["검색된 회사"], "data": companies[position + 1],
+                    "share": 0.4, "source_type": "전기"}]
+        consortiums.append(calculation_logic.calculate_consortium(members, **CONTEXT))
+    return {"saved_name": name, "saved_date": "2025-03-01 09:00:00", "region_limit": "전체", "project_type": "전기",
+            "consortiums": consortiums}
+
+
+def _plain(content):
+    return json.loads(json.dumps(content, default=json_default))
+
+
+@pytest.fixture(autouse=True)
+def small_object_cache(monkeypatch):
+    monkeypatch.setattr(session_store, "_object_cache", session_store.OrderedDict())
+
+
+def test_pack_unpack_round_trip(company_workbook):
+    content = _session(company_workbook, 0, 5)
+    packed, objects = session_store.pack_session(content)
+
+    assert session_store.is_packed(packed)
+    for result_data in packed["consortiums"]:
+        assert session_store._is_ref(result_data["ruleset"]) and session_store._is_ref(result_data["price_data"])
+        assert all(session_store._is_ref(comp["data"]) for comp in result_data["company_details"])
+    # 규칙/가격 정보는 한 번씩, 업체는 6곳(이웃한 협정이 한 곳씩 공유)만 저장
+    assert len(objects) == 1 + 1 + 6
+    assert session_store.unpack_session(packed, objects) == _plain(content)
+
+
+def test_write_read_round_trip_uses_packed_extension(company_workbook, tmp_path):
+    folder = str(tmp_path)
+    content = _session(company_workbook, 0, 4)
+    filename = session_store.write_session(folder, "협정.json", content)
+
+    assert filename == "협정.bidpack"
+    assert sorted(os.listdir(folder)) == ["_objects.db", "협정.bidpack"]
+    assert session_store.read_session(folder, filename) == _plain(content)
+
+    exported = tmp_path / "export" / session_store.export_filename(filename)
+    exported.parent.mkdir()
+    session_store.export_session(folder, filename, str(exported))
+    assert json.loads(exported.read_text(encoding='utf-8')) == _plain(content)
+
+
+def test_packed_file_is_not_a_legacy_session(company_workbook, tmp_path):
+    """이전 버전은 .json만 읽으므로 압축 형식 파일을 목록에 올리지 않고, 저장소 없이 복사한 파일은 오류로 알립니다."""
+    folder, copied = tmp_path / "saved", tmp_path / "copied"
+    filename = session_store.write_session(str(folder), "협정", _session(company_workbook, 0, 2))
+    assert not filename.endswith(".json")
+
+    copied.mkdir()
+    shutil.copy(folder / filename, copied / filename)
+    with pytest.raises(ValueError):
+        session_store.read_session(str(copied), filename)
+
+
+def test_legacy_files_are_read_and_replaced(company_workbook, tmp_path):
+    folder = str(tmp_path)
+    content = _plain(_session(company_workbook, 0, 3))
+    with open(os.path.join(folder, "예전.json"), 'w', encoding='utf-8') as f:
+        json.dump(content, f, ensure_ascii=False)
+    assert session_store.read_session(folder, "예전.json") == content
+
+    filename, imported = session_store.import_session(os.path.join(folder, "예전.json"), folder)
+    assert filename == "예전.bidpack" and imported == content
+    assert not os.path.exists(os.path.join(folder, "예전.json"))  # 같은 이름의 예전 형식 파일은 대체됨
+    assert session_store.read_session(folder, filename) == content
+
+
+def test_collect_garbage_keeps_referenced_objects(company_workbook, tmp_path):
+    folder = str(tmp_path)
+    first = session_store.write_session(folder, "가", _session(company_workbook, 0, 3))
+    second = session_store.write_session(folder, "나", _session(company_workbook, 2, 3))  # 업체 한 곳을 '가'와 공유
+    expected = session_store.read_session(folder, second)
+    assert session_store.collect_garbage(folder) == 0
+
+    os.remove(os.path.join(folder, first))
+    removed = session_store.collect_garbage(folder)
+    assert removed == 2  # '가'에서만 쓰던 업체 두 곳
+
+    session_store._object_cache.clear()
+    assert session_store.read_session(folder, second) == expected
+
+
+def _stored_hashes(folder):
+    with closing(session_store._connect(folder)) as conn:
+        return {row[0] for row in conn.execute("SELECT hash FROM objects")}
+
+
+def test_overwriting_a_save_drops_objects_only_it_used(company_workbook, tmp_path):
+    folder = str(tmp_path)
+    session_store.write_session(folder, "가", _session(company_workbook, 0, 3))
+    other = session_store.write_session(folder, "나", _session(company_workbook, 2, 3))  # 업체 한 곳을 '가'와 공유
+    replacement = _session(company_workbook, 20, 2)
+
+    filename = session_store.write_session(folder, "가", replacement)  # 같은 이름으로 다시 저장
+
+    refs = set()
+    for name in (filename, other):
+        with open(os.path.join(folder, name), 'r', encoding='utf-8') as f:
+            refs.update(json.load(f)["refs"])
+    assert _stored_hashes(folder) == refs
+    session_store._object_cache.clear()
+    assert session_store.read_session(folder, filename)["consortiums"] == \
+        json.loads(json.dumps(replacement, default=json_default))["consortiums"]
+    assert session_store.read_session(folder, other)
+
+
+def test_collect_garbage_skips_when_a_file_is_unreadable(company_workbook, tmp_path):
+    folder = str(tmp_path)
+    session_store.write_session(folder, "가", _session(company_workbook, 0, 3))
+    (tmp_path / "깨진.bidpack").write_text("{", encoding='utf-8')
+    os.remove(os.path.join(folder, "가.bidpack"))
+    assert session_store.collect_garbage(folder) == 0
+
+
+def test_object_cache_is_bounded_lru(company_workbook, tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, "_OBJECT_CACHE_SIZE", 5)
+    folder = str(tmp_path)
+    first = session_store.write_session(folder, "가", _session(company_workbook, 0, 2))   # 객체 5개
+    second = session_store.write_session(folder, "나", _session(company_workbook, 10, 2))  # 업체 3개 새로
+
+    packed_first = json.loads((tmp_path / first).read_text(encoding='utf-8'))
+    session_store.read_session(folder, first)
+    assert list(session_store._object_cache) == sorted(session_store._object_cache, key=packed_first["refs"].index)
+    session_store.read_session(folder, second)
+    assert len(session_store._object_cache) == 5
+
+    # 두 파일이 공유하는 규칙/가격 정보는 가장 최근에 썼으므로 남고, '가'의 업체는 밀려남
+    packed_second = json.loads((tmp_path / second).read_text(encoding='utf-8'))
+    assert set(session_store._object_cache) == set(packed_second["refs"])
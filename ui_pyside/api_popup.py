@@ -4,29 +4,36 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QGridLayout, QHBoxLayout,
                                QTableWidgetItem, QHeaderView, QMessageBox, QDateEdit, QWidget, QComboBox)
 from PySide6.QtCore import QDate, Qt, Signal, QThread
 import requests
-import json
 import config
-from requests.adapters import HTTPAdapter
-from urllib3.poolmanager import PoolManager
-import ssl
+import api_client
+import perf
 
-class TLSAdapter(HTTPAdapter):
-    def init_poolmanager(self, connections, maxsize, block=False):
-        context = ssl.create_default_context(); context.set_ciphers('DEFAULT@SECLEVEL=1'); context.minimum_version = ssl.TLSVersion.TLSv1_2
-        self.poolmanager = PoolManager(num_pools=connections, maxsize=maxsize, block=block, ssl_context=context)
+ALL_BIZ_FIELDS = "전체"
+DEFAULT_LIST_DAYS = 7  # 기간 조회 기본 기간 (오늘 포함 최근 7일)
+MAX_LIST_DAYS = 31  # 기간 조회 최대 기간: 업종마다 최대 api_client.MAX_PAGES 페이지를 받으므로 너무 긴 기간은 막습니다.
 
 class ApiSearchWorker(QThread):
-    finished = Signal(object)
-    def __init__(self, params, endpoint):
-        super().__init__(); self.params = params; self.endpoint = endpoint
+    finished = Signal(object)  # {"items": [...]} 또는 {"오류": 메시지}
+    def __init__(self, params, biz_field):
+        super().__init__(); self.params = params; self.biz_field = biz_field
     def run(self):
+        # 공용 클라이언트: 연결 재사용, 일시적 오류 자동 재시도, 같은 공고 재조회는 저장된 응답 사용
+        client = api_client.get_client()
+        biz_fields = None if self.biz_field == ALL_BIZ_FIELDS else [self.biz_field]
         try:
-            session = requests.Session(); session.mount('https://', TLSAdapter())
-            response = session.get(self.endpoint, params=self.params, timeout=15)
-            response.raise_for_status()
-            self.finished.emit(response.text)
+            if 'bidNtceNo' in self.params:
+                # 공고번호 조회: 업종을 모르면 모든 업종에 동시에 묻고 먼저 찾은 결과를 사용
+                with perf.span("api.find_bid_notice"):
+                    _, items = client.find_bid_notice(self.params, biz_fields)
+            else:
+                # 기간 조회: 100건이 넘으면 나머지 페이지를 동시에 받아 이어 붙임
+                with perf.span("api.list_bid_notices"):
+                    items = client.list_bid_notices(self.params, biz_fields)
+            self.finished.emit({"items": items})
         except requests.exceptions.RequestException as e:
-            self.finished.emit(f"API 요청 오류: {e}")
+            self.finished.emit({"오류": f"API 요청 오류: {e}"})
+        except ValueError as e:
+            self.finished.emit({"오류": str(e)})
 
 class ApiPopup(QDialog):
     gongo_selected = Signal(dict)
@@ -34,22 +41,16 @@ class ApiPopup(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("나라장터 공고 검색"); self.setMinimumSize(900, 700); self.search_results = []
-        BASE_URL = "https://apis.data.go.kr/1230000/ad/BidPublicInfoService"
-        self.endpoints = {
-            "공사": f"{BASE_URL}/getBidPblancListInfoCnstwk",
-            "용역": f"{BASE_URL}/getBidPblancListInfoServc",
-            "물품": f"{BASE_URL}/getBidPblancListInfoThng"
-        }
         self.setup_ui(); self.connect_signals()
 
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         search_box = QWidget(); search_box.setObjectName("filterBox"); search_layout = QGridLayout(search_box)
-        self.start_date_edit = QDateEdit(QDate.currentDate().addDays(-365)); self.start_date_edit.setCalendarPopup(True); self.start_date_edit.setDisplayFormat("yyyy-MM-dd")
+        self.start_date_edit = QDateEdit(QDate.currentDate().addDays(-(DEFAULT_LIST_DAYS - 1))); self.start_date_edit.setCalendarPopup(True); self.start_date_edit.setDisplayFormat("yyyy-MM-dd")
         self.end_date_edit = QDateEdit(QDate.currentDate()); self.end_date_edit.setCalendarPopup(True); self.end_date_edit.setDisplayFormat("yyyy-MM-dd")
-        self.keyword_entry = QLineEdit(); self.keyword_entry.setPlaceholderText("공고번호를 입력하세요")
+        self.keyword_entry = QLineEdit(); self.keyword_entry.setPlaceholderText("공고번호를 입력하세요 (비워 두면 공고일자 기간으로 검색)")
         self.search_button = QPushButton("🔍 공고번호 검색")
-        self.biz_field_combo = QComboBox(); self.biz_field_combo.addItems(self.endpoints.keys())
+        self.biz_field_combo = QComboBox(); self.biz_field_combo.addItems([ALL_BIZ_FIELDS, *api_client.BID_LIST_OPERATIONS.keys()])
         search_layout.addWidget(QLabel("<b>공고일자:</b>"), 0, 0); search_layout.addWidget(self.start_date_edit, 0, 1); search_layout.addWidget(QLabel("~"), 0, 2, Qt.AlignCenter); search_layout.addWidget(self.end_date_edit, 0, 3)
         search_layout.addWidget(QLabel("<b>업종:</b>"), 1, 0); search_layout.addWidget(self.biz_field_combo, 1, 1)
         search_layout.addWidget(QLabel("<b>공고번호:</b>"), 1, 2); search_layout.addWidget(self.keyword_entry, 1, 3)
@@ -92,46 +93,50 @@ class ApiPopup(QDialog):
         if not service_key:
             QMessageBox.critical(self, "인증키 오류", "config.json 또는 config.ini 파일에 'api_service_key'가 올바르게 설정되지 않았습니다."); return
 
-        self.search_button.setEnabled(False); self.search_button.setText("검색 중...")
         # 이제 입력창의 텍스트는 항상 정리된 상태이므로, 바로 사용 가능
         keyword = self.keyword_entry.text().strip()
-        if not keyword:
-            QMessageBox.warning(self, "입력 오류", "공고번호를 입력해주세요."); 
-            self.search_button.setEnabled(True); self.search_button.setText("🔍 공고번호 검색")
-            return
-
         params = {
             'serviceKey': service_key,
             'pageNo': '1',
             'numOfRows': '100',
             'type': 'json',
-            'inqryDiv': '2',
-            'bidNtceNo': keyword # 이미 정리된 텍스트를 사용
         }
-        
+        if keyword:
+            params.update({'inqryDiv': '2', 'bidNtceNo': keyword})  # 이미 정리된 텍스트를 사용
+        else:
+            # 공고번호가 없으면 공고게시일시 기간으로 조회합니다. (요청이 많아질 수 있으므로 기간을 확인하고 묻습니다)
+            start_date, end_date = self.start_date_edit.date(), self.end_date_edit.date()
+            days = start_date.daysTo(end_date) + 1
+            if days < 1:
+                QMessageBox.warning(self, "입력 오류", "공고일자 시작일이 종료일보다 늦습니다."); return
+            if days > MAX_LIST_DAYS:
+                QMessageBox.warning(self, "입력 오류", f"공고번호 없이 검색할 때는 공고일자 기간을 {MAX_LIST_DAYS}일 이내로 지정하세요. "
+                                                   f"(현재 {days}일)"); return
+            biz_field_text = self.biz_field_combo.currentText()
+            reply = QMessageBox.question(self, "기간 검색 확인",
+                                         f"공고번호가 비어 있어 공고일자 기간으로 검색합니다.\n\n"
+                                         f"기간: {start_date.toString('yyyy-MM-dd')} ~ {end_date.toString('yyyy-MM-dd')} ({days}일)\n"
+                                         f"업종: {biz_field_text}\n\n결과가 많으면 시간이 걸릴 수 있습니다. 검색하시겠습니까?",
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                         QMessageBox.StandardButton.No)
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+            params.update({'inqryDiv': '1',
+                           'inqryBgnDt': start_date.toString("yyyyMMdd") + "0000",
+                           'inqryEndDt': end_date.toString("yyyyMMdd") + "2359"})
+
+        self.search_button.setEnabled(False); self.search_button.setText("검색 중...")
         selected_biz_field = self.biz_field_combo.currentText()
-        endpoint = self.endpoints[selected_biz_field]
-        self.worker = ApiSearchWorker(params, endpoint)
+        self.worker = ApiSearchWorker(params, selected_biz_field)
         self.worker.finished.connect(self.on_list_search_finished)
         self.worker.start()
 
-    def on_list_search_finished(self, result_text):
+    def on_list_search_finished(self, result):
         self.search_button.setEnabled(True); self.search_button.setText("🔍 공고번호 검색")
-        if not result_text or not result_text.strip().startswith('{'):
-            QMessageBox.critical(self, "API 응답 오류", f"서버로부터 유효한 JSON 응답을 받지 못했습니다.\n응답 내용: {result_text}"); return
+        if "오류" in result:
+            QMessageBox.critical(self, "API 응답 오류", result["오류"]); return
         try:
-            data = json.loads(result_text)
-            response = data.get('response', {})
-            header = response.get('header', {})
-            result_code = header.get('resultCode')
-            result_msg = header.get('resultMsg', '알 수 없는 오류')
-            if str(result_code) != '00':
-                QMessageBox.critical(self, "API 응답 오류", f"API 서버에서 오류가 발생했습니다: {result_msg}"); return
-            
-            body = response.get('body', {})
-            items = body.get('items', [])
-            if isinstance(items, dict): items = [items]
-            
+            items = result["items"]
             if not items:
                 self.result_table.setRowCount(0); QMessageBox.information(self, "검색 결과", "해당 조건의 공고를 찾을 수 없습니다."); return
             
@@ -147,8 +152,6 @@ class ApiPopup(QDialog):
                 self.result_table.setItem(row, 3, QTableWidgetItem(f"{price:,}"))
                 self.result_table.setItem(row, 4, QTableWidgetItem(item_data.get('bidClseDt', '')))
 
-        except json.JSONDecodeError as e:
-            QMessageBox.critical(self, "JSON 파싱 오류", f"서버 응답을 처리할 수 없습니다. 응답 원본:\n{result_text}")
         except Exception as e:
             QMessageBox.critical(self, "처리 오류", f"알 수 없는 오류 발생: {type(e).__name__} - {e}")
 
@@ -3,8 +3,8 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineE
                                QPushButton, QTableWidget, QTableWidgetItem,
                                QHeaderView, QMessageBox)
 from PySide6.QtGui import QMovie
-from PySide6.QtCore import QThread, Signal, Qt
-import search_logic
+from PySide6.QtCore import QThread, Signal, Qt, QTimer
+from company_repository import get_repository
 import os
 import traceback
 
@@ -20,7 +20,7 @@ class PopupSearchWorker(QThread):
     def run(self):
         filters = {'name': self.name, 'region': '전체', 'min_sipyung': None, 'max_sipyung': None, 'min_perf_3y': None,
                    'max_perf_3y': None, 'min_perf_5y': None, 'max_perf_5y': None}
-        results = search_logic.find_and_filter_companies(self.file_path, filters)
+        results = get_repository().search(self.file_path, filters)
         self.finished.emit(results)
 
 
@@ -36,6 +36,14 @@ class CompanySelectPopupPyside(QDialog):
 
         self.worker = None
         self.results_data = []
+        self.manual_search = False  # 버튼/엔터로 실행한 검색인지 (입력 중 자동 검색과 구분)
+        self.pending_search = False  # 검색 중에 검색어가 또 바뀐 경우 끝난 뒤 한 번 더 검색
+
+        # 입력할 때마다 바로 검색하되, 빠르게 타이핑하는 동안에는 마지막 입력 후 잠깐 기다렸다가 검색
+        self.typing_timer = QTimer(self)
+        self.typing_timer.setSingleShot(True)
+        self.typing_timer.setInterval(150)
+        self.typing_timer.timeout.connect(self.start_auto_search)
 
         self.setWindowTitle(f"업체 선택 ({self.field_to_search} 분야)")
         self.setMinimumSize(600, 500)
@@ -59,6 +67,10 @@ class CompanySelectPopupPyside(QDialog):
         filter_layout.addWidget(self.loading_label)
         main_layout.addLayout(filter_layout)
 
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("font-size: 11px; color: #797D7F;")
+        main_layout.addWidget(self.status_label)
+
         self.results_table = QTableWidget()
         self.results_table.setColumnCount(5)
         self.results_table.setHorizontalHeaderLabels(["업체명", "대표자", "사업자번호", "지역", "구분"])
@@ -73,13 +85,23 @@ class CompanySelectPopupPyside(QDialog):
         self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
 
         self.search_entry.returnPressed.connect(self.start_search)
+        self.search_entry.textChanged.connect(lambda: self.typing_timer.start())
         self.search_button.clicked.connect(self.start_search)
         self.results_table.doubleClicked.connect(self.on_select)
 
         main_layout.addWidget(self.results_table)
 
     def start_search(self):
+        self.typing_timer.stop()
+        self._run_search(manual=True)
+
+    def start_auto_search(self):
+        """검색어 입력 중 자동으로 실행되는 검색입니다. 오류가 있어도 팝업 대신 상태 문구만 바꿉니다."""
+        self._run_search(manual=False)
+
+    def _run_search(self, manual):
         if self.worker is not None and self.worker.isRunning():
+            self.pending_search = True
             return
 
         name = self.search_entry.text().strip()
@@ -87,12 +109,21 @@ class CompanySelectPopupPyside(QDialog):
         filepath = self.controller.source_files.get(source)
 
         if not name:
-            QMessageBox.warning(self, "입력 오류", "업체명을 입력하세요.")
+            if manual:
+                QMessageBox.warning(self, "입력 오류", "업체명을 입력하세요.")
+            else:
+                self.results_data = []
+                self.results_table.setRowCount(0)
+                self.status_label.setText("")
             return
         if not filepath or not os.path.exists(filepath):
-            QMessageBox.critical(self, "파일 오류", f"'{source}' 데이터의 엑셀 파일 경로를 확인하세요.")
+            if manual:
+                QMessageBox.critical(self, "파일 오류", f"'{source}' 데이터의 엑셀 파일 경로를 확인하세요.")
+            else:
+                self.status_label.setText(f"'{source}' 데이터의 엑셀 파일 경로를 확인하세요.")
             return
 
+        self.manual_search = manual
         self.set_ui_for_search(True)
 
         self.worker = PopupSearchWorker(filepath, name, self)
@@ -107,9 +138,14 @@ class CompanySelectPopupPyside(QDialog):
 
             if not results or "오류" in results[0]:
                 error_msg = results[0].get("오류", "알 수 없는 오류") if results else "결과 없음"
-                QMessageBox.information(self, "검색 결과", error_msg)
+                self.results_data = []
+                self.results_table.setRowCount(0)
+                self.status_label.setText(error_msg)
+                if self.manual_search:
+                    QMessageBox.information(self, "검색 결과", error_msg)
             else:
                 self.results_data = results
+                self.status_label.setText(f"(총 {len(results)}건)")
                 self.results_table.setRowCount(len(results))
                 for row, data in enumerate(results):
                     self.results_table.setItem(row, 0, QTableWidgetItem(data.get("검색된 회사")))
@@ -124,14 +160,15 @@ class CompanySelectPopupPyside(QDialog):
         finally:
             self.set_ui_for_search(False)
             self.worker = None
+            if self.pending_search and self.isVisible():
+                self.pending_search = False
+                self.start_auto_search()
 
     def set_ui_for_search(self, is_searching):
-        """검색 중/완료 상태에 따라 UI를 설정합니다."""
-        self.search_entry.setEnabled(not is_searching)
+        """검색 중/완료 상태에 따라 UI를 설정합니다. (입력 중 검색이므로 입력창은 계속 사용할 수 있게 둡니다)"""
         self.search_button.setEnabled(not is_searching)
         self.loading_label.setVisible(is_searching)
         if is_searching:
-            self.results_table.setRowCount(0)
             self.loading_movie.start()
         else:
             self.loading_movie.stop()
@@ -4,8 +4,9 @@ import sys
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit,
                                QPushButton, QTableWidget, QTableWidgetItem,
                                QHeaderView, QMessageBox, QFrame, QSplitter, QApplication, QScrollArea,
-                               QComboBox, QDateEdit, QRadioButton, QGroupBox, QCheckBox, QMenu, QTextEdit)
-from PySide6.QtCore import Qt, QDate
+                               QComboBox, QDateEdit, QRadioButton, QGroupBox, QCheckBox, QMenu, QTextEdit,
+                               QProgressDialog)
+from PySide6.QtCore import Qt, QDate, QThread, Signal
 from PySide6.QtGui import QFont, QColor
 import utils
 import config
@@ -27,9 +28,37 @@ from PySide6.QtWidgets import QFileDialog
 from .result_management_dialog import ResultManagementDialog
 from .load_consortium_popup import LoadConsortiumPopup
 import search_logic
+import partner_recommender
+import batch_rescoring
 import re
 
 
+class PartnerRecommendWorker(QThread):
+    finished = Signal(list)
+    def __init__(self, recommend_args):
+        super().__init__()
+        self.recommend_args = recommend_args
+    def run(self):
+        self.finished.emit(partner_recommender.recommend_partners(**self.recommend_args))
+
+
+class RescoreWorker(QThread):
+    result_ready = Signal(int, object, int, int)  # 순번, 계산 결과, 완료 개수, 전체 개수
+    finished = Signal(list, bool)  # 입력 순서대로 정렬된 결과, 취소 여부
+    def __init__(self, consortiums, context):
+        super().__init__()
+        self.consortiums = consortiums
+        self.context = context
+        self._cancelled = False
+    def cancel(self):
+        self._cancelled = True
+    def run(self):
+        results = batch_rescoring.rescore_consortiums(
+            self.consortiums, self.context,
+            on_result=lambda position, result, done, total: self.result_ready.emit(position, result, done, total),
+            should_cancel=lambda: self._cancelled)
+        self.finished.emit(results, self._cancelled)
+
 
 class  ConsortiumViewHaeng(QWidget):
     def __init__(self, controller):
@@ -96,6 +125,7 @@ class  ConsortiumViewHaeng(QWidget):
         self.tuchal_rate_entry.textChanged.connect(self.calculate_tuchal_amount)
         self.sajung_rate_entry.textChanged.connect(self.calculate_tuchal_amount)
         self.pre_check_button.clicked.connect(self.run_pre_check)
+        self.recommend_button.clicked.connect(self.recommend_partners)
         self.tree.customContextMenuRequested.connect(self.show_context_menu)
         self.open_results_button.clicked.connect(self.open_result_management_dialog)
         self.load_button.clicked.connect(self.load_and_recalculate_consortium)
@@ -212,6 +242,10 @@ class  ConsortiumViewHaeng(QWidget):
         # 1. 지분율 사전검토 버튼
         self.pre_check_button = QPushButton("🔬 지분율 사전검토")
         button_layout.addWidget(self.pre_check_button)
+
+        # 대표사와 짝을 이룰 구성사 추천 버튼
+        self.recommend_button = QPushButton("🤝 구성사 추천")
+        button_layout.addWidget(self.recommend_button)
         
         # 2. 적격심사 검토 버튼
         self.review_button = QPushButton("📋 적격심사 검토")
@@ -595,20 +629,6 @@ class  ConsortiumViewHaeng(QWidget):
             business_score = comp_detail.get('business_score_details', {}).get('total', 0)
             performance_5y = comp_detail.get('performance_5y', 0)
 
-            # ▼▼▼▼▼ [디버깅] 지분율 값을 단계별로 출력 ▼▼▼▼▼
-            print(f"\n--- [디버깅] populate_report_table 함수 ---")
-            share_decimal = comp_detail.get('share', 0)
-            print(f"[1] result_data에서 가져온 share 값 (소수): {share_decimal}")
-
-            share_percent = share_decimal * 100.0
-            print(f"[2] 100을 곱한 퍼센트 값: {share_percent}")
-
-            formatted_share_text = f"{share_percent:.1f}%"
-            print(f"[3] 최종적으로 표에 표시될 텍스트: '{formatted_share_text}'")
-            print("------------------------------------")
-            # ▲▲▲▲▲ [디버깅] 여기까지 ▲▲▲▲▲
-
-
             self.set_item(table, data_row, col_offset, comp_detail.get('name', ''))
 
             # ▼▼▼▼▼ [핵심 수정] 지분율을 100 곱해서 퍼센트로 표시 ▼▼▼▼▼
@@ -714,6 +734,60 @@ class  ConsortiumViewHaeng(QWidget):
         popup = ShareCheckPopup(results, self)
         popup.exec()
 
+    def recommend_partners(self):
+        """대표사와 현재 공고 조건으로 예상점수가 가장 높은 구성사 후보를 찾아 보여줍니다."""
+        leader = self.company_data_map.get(0)
+        if not leader or not leader.get('data'):
+            QMessageBox.warning(self, "선택 필요", "먼저 '대표사'를 선택하고 지분율을 입력해주세요.")
+            return
+
+        validated_data = self.validate_inputs()
+        if not validated_data: return
+        _, price_data, announcement_date, rule_info, sipyung_info, region_limit = validated_data
+
+        selected_field = self.gongo_field_combo.currentText()
+        file_path = self.controller.source_files.get(selected_field)
+        if not file_path:
+            QMessageBox.warning(self, "파일 없음", f"'{selected_field}' 업체 파일이 설정되지 않았습니다.")
+            return
+
+        try:
+            duty_ratio = float(self.duty_ratio_entry.text().strip())
+        except ValueError:
+            duty_ratio = None
+
+        # 이미 표에 들어 있는 업체는 후보에서 제외
+        exclude_names = [info['data'].get("검색된 회사") for info in self.company_data_map.values()
+                         if info and info.get('data')]
+
+        self.recommend_button.setEnabled(False)
+        self.recommend_button.setText("추천 계산 중...")
+        self.recommend_worker = PartnerRecommendWorker({
+            "leader": leader, "source_type": selected_field, "file_path": file_path,
+            "price_data": price_data, "announcement_date": announcement_date, "rule_info": rule_info,
+            "sipyung_info": sipyung_info, "region_limit": region_limit, "duty_ratio": duty_ratio,
+            "leader_share": leader.get('share') or None, "exclude_names": exclude_names
+        })
+        self.recommend_worker.finished.connect(self.on_recommend_finished)
+        self.recommend_worker.start()
+
+    def on_recommend_finished(self, recommendations):
+        self.recommend_button.setEnabled(True)
+        self.recommend_button.setText("🤝 구성사 추천")
+        if recommendations and "오류" in recommendations[0]:
+            QMessageBox.warning(self, "구성사 추천", recommendations[0]["오류"])
+            return
+
+        lines = []
+        for rank, item in enumerate(recommendations, 1):
+            company = item['company']
+            leader_share, partner_share = item['shares']
+            lines.append(f"{rank}. {company.get('검색된 회사', '')} ({company.get('지역', '')})\n"
+                         f"    예상점수: {item['expected_score']:.4f} | "
+                         f"지분 대표사 {leader_share:.2%} / 구성사 {partner_share:.2%}")
+        popup = TextDisplayPopup("구성사 추천 결과", "\n".join(lines), self)
+        popup.exec()
+
     # [이 함수 두 개를 클래스 내부에 추가하세요]
 
     def show_context_menu(self, pos):
@@ -1030,32 +1104,56 @@ class  ConsortiumViewHaeng(QWidget):
                         "tuchal_amount": price_data["tuchal_amount"]}
         region_limit = self.region_limit_combo.currentText()
 
-        # --- 협정 재구성 및 재계산 ---
-        newly_added_count = 0
-        for saved_session_data in selected_data_list:
-            loaded_consortiums_info = saved_session_data.get("consortiums", [])
-
-            for result_data in loaded_consortiums_info:
-                reconstructed_companies = result_data.get("company_details", [])
+        # --- 협정 재구성 및 재계산 (작업 스레드에서 여러 프로세스로 동시에 계산) ---
+        consortiums = batch_rescoring.collect_consortiums(selected_data_list)
+        if not consortiums:
+            return
+        context = {"price_data": price_data, "announcement_date": announcement_date, "rule_info": rule_info,
+                   "sipyung_info": sipyung_info, "region_limit": region_limit}
+
+        self.rescore_progress = QProgressDialog("저장된 협정을 재계산하는 중...", "취소", 0, len(consortiums), self)
+        self.rescore_progress.setWindowTitle("협정 불러오기")
+        self.rescore_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.rescore_progress.setMinimumDuration(0)
+        self.rescore_progress.setValue(0)
+
+        self.rescore_worker = RescoreWorker(consortiums, context)
+        self.rescore_worker.result_ready.connect(self.on_rescore_result)
+        self.rescore_worker.finished.connect(
+            lambda results, cancelled: self.on_rescore_finished(results, cancelled, len(selected_data_list)))
+        self.rescore_progress.canceled.connect(self.rescore_worker.cancel)
+        self.load_button.setEnabled(False)
+        self.rescore_worker.start()
+
+    def on_rescore_result(self, position, result, done, total):
+        self.rescore_progress.setLabelText(f"저장된 협정을 재계산하는 중... ({done}/{total})")
+        self.rescore_progress.setValue(done)
+
+    def on_rescore_finished(self, results, cancelled, file_count):
+        self.load_button.setEnabled(True)
+        self.rescore_progress.close()
 
-                if not reconstructed_companies: continue
+        newly_added_count = 0
+        failed_count = 0
+        for new_result in results:
+            if not new_result:
+                failed_count += 1
+                continue
 
-                new_result = calculation_logic.calculate_consortium(reconstructed_companies, price_data,
-                                                                    announcement_date, rule_info, sipyung_info,
-                                                                    region_limit)
-                if not new_result:
-                    QMessageBox.warning(self, "계산 실패", "불러온 협정을 재계산하는 중 오류가 발생했습니다.")
-                    continue
+            new_result['gongo_title'] = self.gongo_title_entry.text()
+            new_result['gongo_no'] = self.gongo_no_entry.text()
 
-                new_result['gongo_title'] = self.gongo_title_entry.text()
-                new_result['gongo_no'] = self.gongo_no_entry.text()
+            widget = QFrame()
+            widget.result_data = new_result
+            self.result_widgets.append(widget)
+            newly_added_count += 1
 
-                widget = QFrame()
-                widget.result_data = new_result
-                self.result_widgets.append(widget)
-                newly_added_count += 1
+        if failed_count:
+            QMessageBox.warning(self, "계산 실패", f"불러온 협정 {failed_count}개를 재계산하는 중 오류가 발생했습니다.")
 
         if newly_added_count > 0:
             self.update_summary_display()
+            cancelled_note = "\n(취소되어 나머지 협정은 불러오지 않았습니다.)" if cancelled else ""
             QMessageBox.information(self, "불러오기 완료",
-                                    f"선택한 {len(selected_data_list)}개 파일에서 총 {newly_added_count}개의 컨소시엄을 목록에 추가했습니다.")
\ No newline at end of file
+                                    f"선택한 {file_count}개 파일에서 총 {newly_added_count}개의 컨소시엄을 목록에 추가했습니다."
+                                    + cancelled_note)
\ No newline at end of file
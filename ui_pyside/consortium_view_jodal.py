@@ -5,6 +5,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, Q
                                QComboBox, QDateEdit, QRadioButton, QGroupBox, QCheckBox, QMenu)
 from PySide6.QtCore import Qt, QDate
 from PySide6.QtGui import QFont, QColor
+import logging
 import utils
 import config
 import calculation_logic # [핵심] 누락되었던 import 문
@@ -228,49 +229,22 @@ class  ConsortiumViewJodal(QWidget):
             self.performance_label.setText("실적만점:")
             self.performance_target_label.setText("")
     
-    # [calculate_performance_target 함수를 이 진단 모드 코드로 통째로 교체하세요]
     def calculate_performance_target(self):
-        # --- 진단 시작 ---
-        print("\n--- [진단] calculate_performance_target 함수 실행됨 ---")
-        
+        """기초금액 × 심사 기준의 실적 배수로 실적만점액을 계산해 표시합니다."""
         try:
-            # 1. 현재 선택된 룰 가져오기
             selected_rule_key = self.rule_combo.currentText()
-            print(f"  [1] 선택된 심사 기준: '{selected_rule_key}'")
             if not selected_rule_key:
-                print("  [오류] 심사 기준이 선택되지 않아 계산을 중단합니다.")
                 self.performance_target_label.setText("")
-                print("---------------------------------------------------\n")
                 return
 
-            # 2. 룰셋에서 배수 가져오기
             ruleset = config.CONSORTIUM_RULES.get(self.mode, {}).get(selected_rule_key, {})
             multiplier = ruleset.get('performance_multiplier', 1.0)
-            print(f"  [2] 적용 배수: {multiplier}")
-            
-            # 3. 기초금액 입력칸에서 텍스트 읽기
-            base_amount_text = self.notice_base_amount_entry.text()
-            print(f"  [3] '기초금액' 입력칸의 텍스트: '{base_amount_text}'")
-
-            # 4. 텍스트를 숫자로 변환
-            price_val = utils.parse_amount(base_amount_text)
-            print(f"  [4] 숫자로 변환된 값: {price_val}")
-
-            # 5. 최종 실적만점 계산
+            price_val = utils.parse_amount(self.notice_base_amount_entry.text())
             target = price_val * multiplier if price_val else 0
-            print(f"  [5] 계산된 최종 실적만점액: {target}")
-
-            # 6. 라벨에 텍스트 설정
-            final_text = f"{target:,.0f}" if target else ""
-            self.performance_target_label.setText(final_text)
-            print(f"  [6] 라벨에 설정할 텍스트: '{final_text}'")
-            
+            self.performance_target_label.setText(f"{target:,.0f}" if target else "")
         except Exception as e:
-            print(f"  [치명적 오류] 함수 실행 중 예외 발생: {e}")
-        
-        print("--- [진단] 함수 실행 완료 ---")
-        # --- 진단 끝 ---
-    
+            logging.error(f"실적만점액 계산 오류: {e}")
+
     # [calculate_tuchal_amount 함수를 이 코드로 통째로 교체하세요]
     def calculate_tuchal_amount(self):
         try:
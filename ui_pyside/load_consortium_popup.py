@@ -1,10 +1,26 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget,
                                QPushButton, QListWidgetItem, QComboBox, QLabel,
-                               QMessageBox)
-from PySide6.QtCore import Qt
+                               QMessageBox, QLineEdit, QFileDialog, QProgressDialog)
+from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QColor, QBrush
 import os
-import json
+import batch_report
+import saved_data_catalog
+import session_store
+
+
+class BatchReportWorker(QThread):
+    progress = Signal(int, int)  # 완료 개수, 전체 개수
+    finished = Signal(list)  # manifest 항목 목록
+    def __init__(self, session_paths, output_dir):
+        super().__init__()
+        self.session_paths = session_paths
+        self.output_dir = output_dir
+    def run(self):
+        records = batch_report.export_reports(
+            self.session_paths, self.output_dir,
+            on_result=lambda item, done, total: self.progress.emit(done, total))
+        self.finished.emit(records)
 
 
 class LoadConsortiumPopup(QDialog):
@@ -13,7 +29,7 @@ class LoadConsortiumPopup(QDialog):
         self.setWindowTitle(f"[{mode}] 협정 파일 불러오기 (체크하여 다중 선택 가능)")
         self.setMinimumSize(600, 500)
         self.selected_data_list = []  # 여러 데이터를 담을 리스트
-        self.data_folder = os.path.join("saved_data", mode)
+        self.data_folder = saved_data_catalog.data_folder(mode)
 
         self.all_files_data = self.scan_and_read_files()
 
@@ -21,25 +37,10 @@ class LoadConsortiumPopup(QDialog):
         self.populate_list()
 
     def scan_and_read_files(self):
-        """데이터 폴더를 스캔하여 각 파일의 내용과 '파일 이름'을 함께 읽어옵니다."""
-        all_data = []
-        if not os.path.exists(self.data_folder):
-            return all_data
-
-        for filename in os.listdir(self.data_folder):
-            if not filename.endswith('.json'): continue
-
-            file_path = os.path.join(self.data_folder, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_content = json.load(f)
-                    if isinstance(file_content, dict):
-                        # ▼▼▼▼▼ [핵심 수정] 파일 내용에 'filename' 키를 추가하여 저장 ▼▼▼▼▼
-                        file_content['filename'] = filename
-                        all_data.append(file_content)
-            except Exception:
-                continue
-        return all_data
+        """카탈로그에서 각 저장 파일의 요약 정보('filename' 포함)를 읽어옵니다. 협정 본문은 불러올 때 읽습니다."""
+        entries = saved_data_catalog.load_catalog(self.data_folder)
+        self.company_index = saved_data_catalog.get_company_index(self.data_folder, entries)
+        return entries
 
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -59,6 +60,10 @@ class LoadConsortiumPopup(QDialog):
         filter_layout.addWidget(QLabel("지역제한:"))
         filter_layout.addWidget(self.region_combo)
         filter_layout.addStretch(1)
+        self.company_search_input = QLineEdit()
+        self.company_search_input.setPlaceholderText("업체명 또는 사업자번호")
+        filter_layout.addWidget(QLabel("업체 검색:"))
+        filter_layout.addWidget(self.company_search_input)
         main_layout.addLayout(filter_layout)
 
         self.list_widget = QListWidget()
@@ -68,6 +73,12 @@ class LoadConsortiumPopup(QDialog):
         button_layout = QHBoxLayout()
         self.delete_button = QPushButton("🗑️ 선택 파일 삭제")  # <--- 추가
         button_layout.addWidget(self.delete_button)  # <--- 추가
+        self.import_button = QPushButton("📥 JSON 가져오기")
+        self.export_button = QPushButton("📤 JSON 내보내기")
+        button_layout.addWidget(self.import_button)
+        button_layout.addWidget(self.export_button)
+        self.batch_report_button = QPushButton("📊 보고서 일괄 생성")
+        button_layout.addWidget(self.batch_report_button)
         button_layout.addStretch(1)
         self.load_button = QPushButton("선택 항목 불러오기")
         self.cancel_button = QPushButton("취소")
@@ -77,9 +88,13 @@ class LoadConsortiumPopup(QDialog):
 
         self.type_combo.currentTextChanged.connect(self.populate_list)
         self.region_combo.currentTextChanged.connect(self.populate_list)
+        self.company_search_input.textChanged.connect(self.populate_list)
         self.cancel_button.clicked.connect(self.reject)
         self.load_button.clicked.connect(self.on_load_clicked)
         self.delete_button.clicked.connect(self.delete_selected_file)
+        self.import_button.clicked.connect(self.import_json_files)
+        self.export_button.clicked.connect(self.export_checked_files)
+        self.batch_report_button.clicked.connect(self.generate_batch_reports)
 
     def populate_list(self):
         """필터 조건에 맞게 목록을 채웁니다."""
@@ -87,6 +102,8 @@ class LoadConsortiumPopup(QDialog):
         selected_type = self.type_combo.currentText()
         selected_region = self.region_combo.currentText()
         color_map = {"전기": QColor("#FFFACD"), "통신": QColor("#E0FFFF"), "소방": QColor("#FFE4E1")}
+        # 업체 검색어가 있으면 그 업체가 들어 있는 파일만 보여 줍니다. (파일명 -> [(협정 번호, 역할, 업체명)])
+        company_hits = self.company_index.search(self.company_search_input.text())
 
         sorted_data = sorted(self.all_files_data, key=lambda x: x.get("saved_date", ""), reverse=True)
 
@@ -94,6 +111,9 @@ class LoadConsortiumPopup(QDialog):
             type_match = (selected_type == "전체 공사" or data.get("project_type") == selected_type)
             region_match = (selected_region == "전체 지역" or data.get("region_limit") == selected_region)
 
+            if company_hits is not None and data.get('filename') not in company_hits:
+                continue
+
             if type_match and region_match:
                 # [수정] 날짜를 포함한 최종 텍스트 형식
                 saved_name = data.get('saved_name', '이름 없음')
@@ -101,6 +121,10 @@ class LoadConsortiumPopup(QDialog):
                 region = data.get('region_limit', '전체')
                 proj_type = data.get('project_type', '기타')
                 display_text = f"[{saved_date}] {saved_name}  [{region}] [{proj_type}]"
+                if company_hits is not None:
+                    positions = ", ".join(f"{position + 1}번 {role}({name})"
+                                          for position, role, name in company_hits[data['filename']])
+                    display_text += f"\n    ▶ {positions}"
 
                 item = QListWidgetItem(display_text)
 
@@ -111,20 +135,32 @@ class LoadConsortiumPopup(QDialog):
                 if data.get('project_type') in color_map:
                     item.setBackground(QBrush(color_map[data['project_type']]))
 
+                item.setToolTip(", ".join(data.get('company_names', [])))
                 item.setData(Qt.ItemDataRole.UserRole, data)
                 self.list_widget.addItem(item)
 
     def on_load_clicked(self):
-        """체크된 모든 항목의 데이터를 가져옵니다."""
+        """체크된 모든 항목의 파일 내용을 읽어옵니다."""
+        checked_entries = []
         for i in range(self.list_widget.count()):
             item = self.list_widget.item(i)
             if item.checkState() == Qt.CheckState.Checked:
-                self.selected_data_list.append(item.data(Qt.ItemDataRole.UserRole))
+                checked_entries.append(item.data(Qt.ItemDataRole.UserRole))
 
-        if not self.selected_data_list:
+        if not checked_entries:
             QMessageBox.information(self, "알림", "불러올 항목을 하나 이상 체크해주세요.")
             return
 
+        self.selected_data_list = []
+        for entry in checked_entries:
+            try:
+                self.selected_data_list.append(saved_data_catalog.load_saved_file(self.data_folder, entry['filename']))
+            except Exception as e:
+                QMessageBox.warning(self, "불러오기 실패", f"'{entry['filename']}' 파일을 읽는 중 오류가 발생했습니다:\n{e}")
+
+        if not self.selected_data_list:
+            return
+
         self.accept()
 
     def get_selected_data(self):
@@ -170,12 +206,104 @@ class LoadConsortiumPopup(QDialog):
                 try:
                     file_path = os.path.join(self.data_folder, filename)
                     os.remove(file_path)
+                    saved_data_catalog.remove_entry(self.data_folder, filename)
                     deleted_count += 1
                 except Exception as e:
                     QMessageBox.critical(self, "삭제 실패", f"'{filename}' 파일 삭제 중 오류가 발생했습니다:\n{e}")
 
+            if deleted_count > 0:
+                # 삭제한 파일만 쓰던 업체/규칙 데이터를 저장소에서 정리합니다.
+                session_store.collect_garbage(self.data_folder)
+
             if deleted_count > 0:
                 QMessageBox.information(self, "삭제 완료", f"{deleted_count}개의 파일을 삭제했습니다.")
 
             self.all_files_data = self.scan_and_read_files()
-            self.populate_list()
\ No newline at end of file
+            self.populate_list()
+
+    def import_json_files(self):
+        """다른 곳에서 내보낸 협정 JSON 파일을 이 모드의 저장 폴더로 가져옵니다."""
+        paths, _ = QFileDialog.getOpenFileNames(self, "가져올 협정 JSON 파일 선택", "", "JSON 파일 (*.json)")
+        if not paths:
+            return
+
+        imported_count = 0
+        for path in paths:
+            filename = session_store.packed_filename(os.path.basename(path))
+            if any(os.path.exists(os.path.join(self.data_folder, name))
+                   for name in (filename, session_store.export_filename(filename))):
+                reply = QMessageBox.question(self, "덮어쓰기 확인", f"'{filename}' 파일이 이미 있습니다. 덮어쓰시겠습니까?")
+                if reply == QMessageBox.StandardButton.No:
+                    continue
+            try:
+                filename, content = session_store.import_session(path, self.data_folder)
+                saved_data_catalog.remove_entry(self.data_folder, session_store.export_filename(filename))
+                saved_data_catalog.update_entry(self.data_folder, filename, content)
+                imported_count += 1
+            except Exception as e:
+                QMessageBox.critical(self, "가져오기 실패", f"'{filename}' 파일을 가져오는 중 오류가 발생했습니다:\n{e}")
+
+        if imported_count > 0:
+            QMessageBox.information(self, "가져오기 완료", f"{imported_count}개의 파일을 가져왔습니다.")
+            self.all_files_data = self.scan_and_read_files()
+            self.populate_list()
+
+    def export_checked_files(self):
+        """체크된 파일을 내용 전체가 담긴 JSON으로 내보냅니다. (다른 PC나 이전 버전에서도 열 수 있음)"""
+        filenames = [self.list_widget.item(i).data(Qt.ItemDataRole.UserRole).get('filename')
+                     for i in range(self.list_widget.count())
+                     if self.list_widget.item(i).checkState() == Qt.CheckState.Checked]
+        if not filenames:
+            QMessageBox.warning(self, "선택 오류", "먼저 내보낼 파일을 목록에서 체크하세요.")
+            return
+
+        dest_folder = QFileDialog.getExistingDirectory(self, "내보낼 폴더 선택")
+        if not dest_folder:
+            return
+
+        exported_count = 0
+        for filename in filenames:
+            try:
+                session_store.export_session(self.data_folder, filename,
+                                             os.path.join(dest_folder, session_store.export_filename(filename)))
+                exported_count += 1
+            except Exception as e:
+                QMessageBox.critical(self, "내보내기 실패", f"'{filename}' 파일을 내보내는 중 오류가 발생했습니다:\n{e}")
+
+        if exported_count > 0:
+            QMessageBox.information(self, "내보내기 완료", f"{exported_count}개의 파일을 내보냈습니다.")
+
+    def generate_batch_reports(self):
+        """체크된 저장 파일마다 엑셀 보고서를 만들어 선택한 폴더에 저장합니다. (목록은 manifest.json)"""
+        session_paths = [os.path.join(self.data_folder, self.list_widget.item(i).data(Qt.ItemDataRole.UserRole)['filename'])
+                         for i in range(self.list_widget.count())
+                         if self.list_widget.item(i).checkState() == Qt.CheckState.Checked]
+        if not session_paths:
+            QMessageBox.warning(self, "선택 오류", "먼저 보고서를 만들 파일을 목록에서 체크하세요.")
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(self, "보고서를 저장할 폴더 선택")
+        if not output_dir:
+            return
+
+        self.report_progress = QProgressDialog("엑셀 보고서를 작성하는 중...", None, 0, len(session_paths), self)
+        self.report_progress.setWindowTitle("보고서 일괄 생성")
+        self.report_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.report_progress.setMinimumDuration(0)
+        self.report_progress.setValue(0)
+
+        self.report_worker = BatchReportWorker(session_paths, output_dir)
+        self.report_worker.progress.connect(lambda done, total: self.report_progress.setValue(done))
+        self.report_worker.finished.connect(lambda records: self.on_batch_reports_finished(records, output_dir))
+        self.batch_report_button.setEnabled(False)
+        self.report_worker.start()
+
+    def on_batch_reports_finished(self, records, output_dir):
+        self.report_progress.close()
+        self.batch_report_button.setEnabled(True)
+        failed = [item for item in records if item["status"] != "ok"]
+        message = f"보고서 {len(records) - len(failed)}개를 저장했습니다.\n폴더: {output_dir}"
+        if failed:
+            message += "\n\n실패한 파일:\n" + "\n".join(
+                f" - {os.path.basename(item['source'])}: {item['error']}" for item in failed)
+        QMessageBox.information(self, "보고서 일괄 생성 완료", message)
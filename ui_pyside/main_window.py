@@ -1,11 +1,12 @@
 # ui_pyside/main_window.py
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QStackedWidget, QLabel, QFrame
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QStackedWidget, QLabel, QFrame, QMessageBox
+from PySide6.QtCore import Qt, QSize, QThread, Signal
 from PySide6.QtGui import QFont, QIcon
 from .search_view import SearchViewPyside
 from .consortium_view_haeng import ConsortiumViewHaeng
 from .consortium_view_jodal import ConsortiumViewJodal
 import config
+from company_repository import get_repository
 from .message_generator_view import MessageGeneratorViewPyside
 from .account_view import AccountViewPyside # <-- import 문 확인
 import os
@@ -22,6 +23,20 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+class SourcePreloadWorker(QThread):
+    """프로그램 시작 시 전기/통신/소방 엑셀 파일을 백그라운드에서 동시에 미리 읽습니다."""
+    source_loaded = Signal(str, int, str)  # 분야, 업체 수, 오류 메시지("" 이면 성공)
+
+    def __init__(self, source_files, parent=None):
+        super().__init__(parent)
+        self.source_files = dict(source_files)
+
+    def run(self):
+        get_repository().preload_sources(
+            self.source_files,
+            on_loaded=lambda source_type, count, error: self.source_loaded.emit(source_type, count, error or ""))
+
+
 class MainWindow(QMainWindow):
     def __init__(self, source_files_config):
         super().__init__()
@@ -73,6 +88,31 @@ class MainWindow(QMainWindow):
         self.nav_list.setCurrentRow(0)
 
         self.apply_stylesheet()
+
+        # 업체 자료를 미리 읽어 두어 첫 검색부터 바로 결과가 나오도록 합니다.
+        self.statusBar().showMessage("업체 자료를 불러오는 중...")
+        self.preload_worker = SourcePreloadWorker(self.source_files, self)
+        self.preload_errors = {}
+        self.preload_worker.source_loaded.connect(self.on_source_preloaded)
+        self.preload_worker.finished.connect(self.on_preload_finished)
+        self.preload_worker.start()
+
+    def on_source_preloaded(self, source_type, count, error):
+        if error:
+            self.preload_errors[source_type] = error
+            self.statusBar().showMessage(f"[{source_type}] 자료 불러오기 실패: {error}")
+        else:
+            self.statusBar().showMessage(f"[{source_type}] 업체 {count:,}곳 불러옴")
+
+    def on_preload_finished(self):
+        if not self.preload_errors:
+            self.statusBar().showMessage("업체 자료 준비 완료", 5000)
+            return
+        # 실패한 분야는 상태 표시줄에 남겨 두고, 한 번 알려 줍니다.
+        self.statusBar().showMessage(f"업체 자료 불러오기 실패: {', '.join(self.preload_errors)}")
+        QMessageBox.warning(self, "업체 자료 불러오기 실패",
+                            "다음 업체 파일을 읽지 못했습니다. 검색 결과에서 빠집니다.\n\n" +
+                            "\n".join(f"[{source_type}] {error}" for source_type, error in self.preload_errors.items()))
     
 # [on_nav_changed 함수를 이 코드로 통째로 교체하세요]
     def on_nav_changed(self, index):
@@ -146,4 +186,6 @@ class MainWindow(QMainWindow):
         
     def closeEvent(self, event):
         config.save_config(self.source_files)
+        if self.preload_worker.isRunning():
+            self.preload_worker.wait()  # 사전 로딩 중인 작업 프로세스가 정리될 때까지 대기
         event.accept()
\ No newline at end of file
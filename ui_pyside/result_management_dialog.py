@@ -1,36 +1,43 @@
 # ui_pyside/result_management_dialog.py
 
 import os
-import json
 import copy
-import sys
-import re
-
-from openpyxl.styles import PatternFill, Alignment
 
 import calculation_logic
+import report_writer
+import saved_data_catalog
+import session_store
 import utils
 from datetime import datetime
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
                                QPushButton, QTableWidget, QTableWidgetItem,
                                QHeaderView, QSplitter, QLabel, QMessageBox,
-                               QInputDialog, QGridLayout, QFileDialog)
-from PySide6.QtCore import Qt, Signal
+                               QInputDialog, QGridLayout, QFileDialog, QProgressDialog)
+from PySide6.QtCore import Qt, Signal, QThread
 from .load_consortium_popup import LoadConsortiumPopup
 from PySide6.QtWidgets import QFrame # QFrame 추가
 from .text_display_popup import TextDisplayPopup
 from consortium_manager import ConsortiumManagerDialog
-from openpyxl import load_workbook
-
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
 
+class ExcelReportWorker(QThread):
+    progress = Signal(int, int)  # 완료 개수, 전체 개수
+    finished = Signal(str, str)  # 저장 경로, 오류 메시지 (성공하면 빈 문자열)
+    def __init__(self, consortiums, header, save_path):
+        super().__init__()
+        self.consortiums = consortiums
+        self.header = header
+        self.save_path = save_path
+    def run(self):
+        try:
+            report_writer.write_report(self.consortiums, self.header, self.save_path,
+                                       progress=lambda done, total: self.progress.emit(done, total))
+            self.finished.emit(self.save_path, "")
+        except FileNotFoundError:
+            self.finished.emit(self.save_path, f"템플릿 파일('{report_writer.TEMPLATE_FILENAME}')을 찾을 수 없습니다.\n"
+                                               f"프로젝트 폴더에 파일이 있는지 확인해주세요.")
+        except Exception as e:
+            self.finished.emit(self.save_path, f"파일 저장 중 오류가 발생했습니다: {e}")
 
 
 class ResultManagementDialog(QDialog):
@@ -287,7 +294,7 @@ class ResultManagementDialog(QDialog):
 
 
     def save_consortiums_list(self):
-        """현재 목록에 있는 협정들을 '이름.json' 파일 하나로 저장합니다."""
+        """현재 목록에 있는 협정들을 '이름.bidpack' 파일 하나로 저장합니다."""
         if not self.result_widgets:
             QMessageBox.warning(self, "알림", "저장할 협정 결과가 없습니다.")
             return
@@ -296,14 +303,15 @@ class ResultManagementDialog(QDialog):
         if not ok or not save_name.strip():
             return
 
-        safe_filename = "".join(c for c in save_name if c not in r'<>:"/\|?*') + ".json"
+        safe_filename = session_store.packed_filename("".join(c for c in save_name if c not in r'<>:"/\|?*'))
 
         current_mode = self.controller.mode
-        data_folder = os.path.join("saved_data", current_mode)
+        data_folder = saved_data_catalog.data_folder(current_mode)
         os.makedirs(data_folder, exist_ok=True)
         file_path = os.path.join(data_folder, safe_filename)
 
-        if os.path.exists(file_path):
+        legacy_filename = session_store.export_filename(safe_filename)
+        if os.path.exists(file_path) or os.path.exists(os.path.join(data_folder, legacy_filename)):
             reply = QMessageBox.question(self, "덮어쓰기 확인", f"'{safe_filename}' 파일이 이미 있습니다. 덮어쓰시겠습니까?")
             if reply == QMessageBox.StandardButton.No:
                 return
@@ -320,8 +328,9 @@ class ResultManagementDialog(QDialog):
         }
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=4, ensure_ascii=False)
+            session_store.write_session(data_folder, safe_filename, data_to_save)
+            saved_data_catalog.remove_entry(data_folder, legacy_filename)  # 같은 이름의 예전 형식 파일은 대체됨
+            saved_data_catalog.update_entry(data_folder, safe_filename, data_to_save)
             QMessageBox.information(self, "저장 완료", f"'{safe_filename}' 이름으로 협정을 저장했습니다.")
         except Exception as e:
             QMessageBox.critical(self, "저장 실패", f"파일 저장 중 오류가 발생했습니다:\n{e}")
@@ -401,7 +410,7 @@ class ResultManagementDialog(QDialog):
         popup.exec()
 
     def generate_excel_report(self):
-        """사용자가 제공한 최종 보고서 양식(시공실적 포함)에 맞춰 엑셀 파일을 생성합니다."""
+        """사용자가 제공한 최종 보고서 양식(시공실적 포함)에 맞춰 엑셀 파일을 생성합니다. (작성은 백그라운드에서)"""
         if not self.result_widgets:
             QMessageBox.warning(self, "알림", "먼저 '결과 표 추가' 버튼으로 내보낼 결과를 추가해주세요.")
             return
@@ -413,124 +422,38 @@ class ResultManagementDialog(QDialog):
         if not save_path:
             return
 
-        try:
-            # 2. 템플릿 파일 불러오기
-            template_path = resource_path("haeng_template.xlsx")
-            wb = load_workbook(template_path)
-            ws = wb.active
-
-            # 3. 상단 고정 정보 채우기
-            # [수정] self. -> self.controller. 로 변경
-            ws['D2'] = utils.parse_amount(self.controller.estimation_price_entry.text())
-            ws['M1'] = f"{self.controller.gongo_no_entry.text()} {self.controller.gongo_title_entry.text()}"
-            if self.controller.bid_opening_date and self.controller.bid_opening_date.isValid():
-                ws['P2'] = self.controller.bid_opening_date.toString("yyyy-MM-dd HH:mm")
-
-                # 4. 데이터 채우기
-                yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                # [수정] self. -> self.controller. 로 변경
-                region_limit = self.controller.region_limit_combo.currentText()
-                wrap_alignment = Alignment(vertical='center', wrap_text=True)
-
-
-            # 목록에 있는 모든 컨소시엄 결과에 대해 반복 (5행부터 시작)
-            for index, result_widget in enumerate(self.result_widgets):
-                current_row = 5 + index
-                result_data = result_widget.result_data
-                details = result_data.get("company_details", [])
-
-                # 업체별 상세정보 기록
-                for comp_detail in details:
-                    role = comp_detail.get('role')
-
-                    # 1. 업체명에서 법인 형태 제거 (기존과 동일)
-                    original_name = comp_detail.get('name', '')
-                    company_name = re.sub(r'\s*㈜\s*|\s*\((주|유|합|재)\)\s*|\s*(주|유|합|재)식회사\s*', '', original_name).strip()
-
-                    # ▼▼▼▼▼ [핵심 추가] 비고란에서 담당자 이름 추출 ▼▼▼▼▼
-                    remarks = comp_detail.get('data', {}).get('비고', '')
-                    manager_name = None
-                    if remarks:
-                        # '김OO', '김OO팀장' 등 2~4글자의 한글 이름을 찾는 정규표현식
-                        match = re.search(r'([가-힣]{2,4})(님|팀장|실장|부장|과장|대리|주임|사원)?', remarks)
-                        if match:
-                            manager_name = match.group(1) # '김장섭' 부분만 추출
-
-                        # [디버깅용 코드 추가]
-                        print(f"회사: {company_name}, 비고: '{remarks}', 추출된 담당자: {manager_name}")
-
-                    # 최종적으로 셀에 들어갈 텍스트 조합
-                    final_cell_text = company_name
-                    if manager_name:
-                        final_cell_text += f"\n{manager_name}" # 줄바꿈 문자로 이름 추가
-
-                    company_region = comp_detail.get('data', {}).get('지역', '')
-
-                    if role == "대표사":
-                        cell = ws.cell(current_row, 3, value=final_cell_text)
-                        cell.alignment = wrap_alignment# C열
-                    elif role.startswith("구성사"):
-                        try:
-                            col_offset = 3 + int(role.split(' ')[1])
-                            cell = ws.cell(current_row, col_offset, value=final_cell_text)
-                            cell.alignment = wrap_alignment
-                        except:
-                            continue
-
-                    if region_limit != "전체" and region_limit in company_region:
-                        cell.fill = yellow_fill
-
-                    # I,J,K... : 지분율
-                    share = comp_detail.get('share', 0)
-
-                    # ▼▼▼▼▼ [디버깅] 엑셀에 쓰기 직전의 값을 확인합니다 ▼▼▼▼▼
-                    print(f"[디버깅] 엑셀에 쓸 지분율 값: {share} (타입: {type(share)})")
-                    # ▲▲▲▲▲ 여기까지 추가 ▲▲▲▲▲
-
-                    if role == "대표사":
-                        # [수정] 숫자 값을 그대로 셀에 쓰고, 셀 서식은 '백분율'로 지정
-                        ws.cell(current_row, 9, value=share).number_format = '0.00%'
-                    elif role.startswith("구성사"):
-                        try:
-                            col_offset = 9 + int(role.split(' ')[1])
-                            ws.cell(current_row, col_offset, value=share).number_format = '0.00%'
-                        except:
-                            continue
-
-                    # P,Q,R... : 경영상태 점수
-                    biz_details = comp_detail.get('business_score_details', {})
-                    biz_score = biz_details.get('total', 0)
-                    if role == "대표사":
-                        ws.cell(current_row, 16, value=biz_score)  # P열
-                    elif role.startswith("구성사"):
-                        try:
-                            col_offset = 16 + int(role.split(' ')[1])
-                            ws.cell(current_row, col_offset, value=biz_score)
-                        except:
-                            continue
-
-                    # ▼▼▼▼▼ [추가] W,X,Y... : 5년 실적 ▼▼▼▼▼
-                    performance_5y = comp_detail.get('performance_5y', 0)
-                    if role == "대표사":
-                        ws.cell(current_row, 23, value=performance_5y).number_format = '#,##0'  # W열
-                    elif role.startswith("구성사"):
-                        try:
-                            col_offset = 23 + int(role.split(' ')[1])  # X, Y, Z...열
-                            ws.cell(current_row, col_offset, value=performance_5y).number_format = '#,##0'
-                        except:
-                            continue
-                    # ▲▲▲▲▲ [추가] 여기까지 ▲▲▲▲▲
-
-            # 5. 파일 저장
-            wb.save(save_path)
+        # 2. 화면 값은 여기서 모아 두고, 파일 작성은 작업 스레드에서 합니다.
+        bid_opening_date = self.controller.bid_opening_date
+        header = {
+            "estimation_price": utils.parse_amount(self.controller.estimation_price_entry.text()),
+            "gongo_no": self.controller.gongo_no_entry.text(),
+            "gongo_title": self.controller.gongo_title_entry.text(),
+            "bid_opening": bid_opening_date.toString("yyyy-MM-dd HH:mm")
+            if bid_opening_date and bid_opening_date.isValid() else None,
+            "region_limit": self.controller.region_limit_combo.currentText(),
+        }
+        consortiums = [widget.result_data for widget in self.result_widgets]
+
+        self.report_progress = QProgressDialog("엑셀 보고서를 작성하는 중...", None, 0, len(consortiums), self)
+        self.report_progress.setWindowTitle("엑셀로 내보내기")
+        self.report_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.report_progress.setMinimumDuration(0)
+        self.report_progress.setValue(0)
+
+        self.report_worker = ExcelReportWorker(consortiums, header, save_path)
+        self.report_worker.progress.connect(lambda done, total: self.report_progress.setValue(done))
+        self.report_worker.finished.connect(self.on_report_finished)
+        self.excel_export_button.setEnabled(False)
+        self.report_worker.start()
+
+    def on_report_finished(self, save_path, error_message):
+        self.report_progress.close()
+        self.excel_export_button.setEnabled(True)
+        if error_message:
+            QMessageBox.critical(self, "오류", error_message)
+        else:
             QMessageBox.information(self, "성공", f"엑셀 보고서가 성공적으로 저장되었습니다.\n경로: {save_path}")
 
-        except FileNotFoundError:
-            QMessageBox.critical(self, "템플릿 파일 오류",
-                                 f"템플릿 파일('haeng_template.xlsx')을 찾을 수 없습니다.\n프로젝트 폴더에 파일이 있는지 확인해주세요.")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다: {e}")
-
     def _open_consortium_editor(self):
         """'상세 수정' 시점에 점수 계산에 필요한 모든 정보를 수집하여 전달합니다."""
 
@@ -556,6 +479,12 @@ class ResultManagementDialog(QDialog):
                 ",", "")
             tuchal_amount = utils.parse_amount(tuchal_amount_text) or 0
 
+            # 지분 최적화에서 지킬 지역 의무비율(%) - 비어 있거나 숫자가 아니면 적용하지 않음
+            try:
+                duty_ratio = float(self.controller.duty_ratio_entry.text().strip())
+            except ValueError:
+                duty_ratio = None
+
             price_data = {
                 "estimation_price": estimation_price,
                 "notice_base_amount": base_amount,
@@ -575,7 +504,8 @@ class ResultManagementDialog(QDialog):
                 "price_data": price_data,
                 "sipyung_info": sipyung_info,
                 "region_limit": self.region_limit,
-                "field_to_search": self.controller.gongo_field_combo.currentText()
+                "field_to_search": self.controller.gongo_field_combo.currentText(),
+                "duty_ratio": duty_ratio
             }
         except Exception as e:
             QMessageBox.critical(self, "오류", f"점수 계산에 필요한 공고 정보를 가져오는 데 실패했습니다:\n{e}")
@@ -594,6 +524,7 @@ class ResultManagementDialog(QDialog):
 
                 context_for_calc = calculation_context.copy()
                 context_for_calc.pop('field_to_search', None)  # 'field_to_search' 키를 안전하게 제거
+                context_for_calc.pop('duty_ratio', None)  # 지분 최적화에만 쓰는 값
 
                 for i, new_details in enumerate(updated_consortiums_details_list):
                     if not new_details:  # 빈 협정은 건너뛰기
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import (QDialog, QHBoxLayout, QVBoxLayout, QWidget,
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QColor
 import utils
+import calculation_logic
 
 class ReviewDialogPyside(QDialog):
     def __init__(self, result_data, parent=None):
@@ -184,8 +185,8 @@ class ReviewDialogPyside(QDialog):
         self.bidding_score_label.setText(f"{self.result_data.get('bid_score', 0)} / 65.0")
         self.total_score_label.setText(f"{self.result_data.get('expected_score', 0):.4f} / 95.0")
         
-        sipyung_sum = sum(utils.parse_amount(str(comp['data'].get("시평", 0))) or 0 for comp in self.result_data.get("company_details", []))
-        sipyung_ratio = sum((utils.parse_amount(str(comp['data'].get("시평", 0))) or 0) * (comp.get('share', 0) / 100.0) for comp in self.result_data.get("company_details", []))
+        # 시평액 제한 검사(calculate_consortium)와 같은 계산 (지분 share는 0~1 사이의 소수)
+        sipyung_sum, sipyung_ratio = calculation_logic.sipyung_totals(self.result_data.get("company_details", []))
         self.sipyung_sum_label.setText(f"{sipyung_sum:,.0f} 원")
         self.sipyung_ratio_label.setText(f"{sipyung_ratio:,.0f} 원")
 
@@ -6,18 +6,21 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, Q
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QColor, QFont
 
-import config, utils, search_logic
+import config, utils
+from company_repository import get_repository
 import os
 
+ALL_SOURCES_KEY = "전체"  # 전기/통신/소방 파일을 한 번에 검색하는 선택지
+
+
 class SearchWorker(QThread):
-    finished = Signal(list)
-    def __init__(self, file_path, filters):
+    finished = Signal(list, list, list)  # 검색 결과, 결과마다의 분야(전기/통신/소방), 읽지 못한 파일 [(분야, 오류)]
+    def __init__(self, sources, filters):
         super().__init__()
-        self.file_path = file_path
+        self.sources = sources  # [(분야, 파일 경로), ...]
         self.filters = filters
     def run(self):
-        results = search_logic.find_and_filter_companies(self.file_path, self.filters)
-        self.finished.emit(results)
+        self.finished.emit(*get_repository().search_sources(self.sources, self.filters))
 
 class SearchViewPyside(QWidget):
     def __init__(self, controller):
@@ -25,6 +28,7 @@ class SearchViewPyside(QWidget):
         self.controller = controller
         self.is_searching = False
         self.last_search_results = []
+        self.last_search_sources = []
         
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(10,10,10,10)
@@ -118,6 +122,7 @@ class SearchViewPyside(QWidget):
             rb = QRadioButton(key)
             if key == list(self.controller.source_files.keys())[0]: rb.setChecked(True)
             self.source_radio_group.addWidget(rb); self.source_var_group[key] = rb
+        all_rb = QRadioButton(ALL_SOURCES_KEY); self.source_radio_group.addWidget(all_rb); self.source_var_group[ALL_SOURCES_KEY] = all_rb
         layout.addLayout(self.source_radio_group, 4, 0, 1, 2)
         layout.addWidget(QLabel("<b>검색 조건</b>"), 5, 0, 1, 2)
         layout.addWidget(QLabel("회사 이름:"), 6, 0)
@@ -225,10 +230,18 @@ class SearchViewPyside(QWidget):
                 source_key = key
                 break
         
-        source_file = self.controller.source_files.get(source_key)
-        if not source_file or not os.path.exists(source_file):
-            QMessageBox.critical(self, "오류", f"'{source_key}' 파일 경로가 설정되지 않았습니다.\n'경로 설정' 버튼으로 파일을 지정해주세요.")
-            return
+        if source_key == ALL_SOURCES_KEY:
+            sources = [(key, self.controller.source_files.get(key)) for key in config.SOURCE_TYPES]
+            sources = [(key, path) for key, path in sources if path]  # 없는 파일은 검색 후 실패 목록으로 알림
+            if not sources:
+                QMessageBox.critical(self, "오류", "설정된 파일 경로가 없습니다.\n'경로 설정' 버튼으로 파일을 지정해주세요.")
+                return
+        else:
+            source_file = self.controller.source_files.get(source_key)
+            if not source_file or not os.path.exists(source_file):
+                QMessageBox.critical(self, "오류", f"'{source_key}' 파일 경로가 설정되지 않았습니다.\n'경로 설정' 버튼으로 파일을 지정해주세요.")
+                return
+            sources = [(source_key, source_file)]
 
         filters = {
             'name': self.search_entry.text().strip(),
@@ -248,13 +261,14 @@ class SearchViewPyside(QWidget):
         self.is_searching = True
         self.source_display_label.setText(f"[{source_key}]")
 
-        self.worker = SearchWorker(source_file, filters)
+        self.worker = SearchWorker(sources, filters)
         self.worker.finished.connect(self.on_search_finished)
         self.worker.start()
         
         # [on_search_finished 함수를 이 ко드로 통째로 교체하세요]
-    def on_search_finished(self, results):
+    def on_search_finished(self, results, result_sources, failures):
         self.last_search_results = results
+        self.last_search_sources = result_sources
         self.is_searching = False
         self.search_button.setText("검색 실행")
         self.search_button.setEnabled(True)
@@ -266,13 +280,20 @@ class SearchViewPyside(QWidget):
             QMessageBox.information(self, "검색 결과", error_msg)
             self.results_count_label.setText("(총 0건)") # [핵심] 에러 또는 결과 없음 시 0건 표시
             return
+        if failures:
+            # 전체 검색에서 일부 파일만 실패한 경우: 결과는 보여주되 빠진 분야를 알립니다.
+            QMessageBox.warning(self, "일부 파일 검색 실패",
+                                "다음 파일을 읽지 못해 검색 결과에서 빠졌습니다.\n\n" +
+                                "\n".join(f"[{source_key}] {message}" for source_key, message in failures))
         
         # [핵심] 검색 건수 업데이트
         self.results_count_label.setText(f"(총 {len(results)}건)")
         
         self.results_table.setRowCount(len(results))
+        show_source = len(set(result_sources)) > 1
         for row, data in enumerate(results):
-            item = QTableWidgetItem(data.get("검색된 회사", ""))
+            name = data.get("검색된 회사", "")
+            item = QTableWidgetItem(f"[{result_sources[row]}] {name}" if show_source else name)
             self.results_table.setItem(row, 0, item)
             company_statuses = data.get("데이터상태", {})
             # [수정] 경영상태 대신, 데이터가 확실히 있는 '부채비율'을 기준으로 색상 표시
@@ -283,21 +304,22 @@ class SearchViewPyside(QWidget):
         
         if results:
             self.results_table.selectRow(0)
-            self.display_company_details(results[0])
+            self.display_company_details(results[0], result_sources[0])
         
     def on_result_selected(self, row, column):
-        if self.last_search_results and row < len(self.last_search_results): self.display_company_details(self.last_search_results[row])
+        if self.last_search_results and row < len(self.last_search_results): self.display_company_details(self.last_search_results[row], self.last_search_sources[row])
         
     # [display_company_details 함수를 이 코드로 통째로 교체하세요]
-    def display_company_details(self, data):
+    def display_company_details(self, data, selected_source=None):
         if not data: self.clear_details(); return
 
         danger_color = QColor("#E74C3C")
         default_color = QColor("black")
         
-        selected_source = ""
-        for key, rb in self.source_var_group.items():
-            if rb.isChecked(): selected_source = key; break
+        if selected_source is None:
+            for key, rb in self.source_var_group.items():
+                if rb.isChecked(): selected_source = key; break
+        self.source_display_label.setText(f"[{selected_source}]")
         thresholds = config.RATIO_THRESHOLDS.get(selected_source)
 
         # [핵심] 상세한 데이터 상태 딕셔너리를 가져옵니다.
@@ -1,29 +1,79 @@
 # utils.py
 import re
+from functools import lru_cache
+
+import numpy as np
+
+# 회사명 앞뒤에 붙는 법인 형태 표기: ㈜, (주)/(유)/(합)/(재), 주식회사/유식회사 등
+CORPORATE_SUFFIX_PATTERN = re.compile(r'\s*㈜\s*|\s*\((주|유|합|재)\)\s*|\s*(주|유|합|재)식회사\s*')
+
+# 금액 단위: 큰 단위(조/억/만)는 앞에 모인 숫자 묶음 전체에, 작은 단위(천/백/십)는 바로 앞 숫자에 곱합니다.
+# 예) '1조 2,500억' = 1×조 + 2500×억, '3천5백만' = (3×천 + 5×백)×만
+# 이전 정규식 파서와 결과가 달라지는 입력('3천만', '1억 2억', '만3' 등)은 tests/test_parse_amount.py에 정리되어 있습니다.
+_LARGE_UNITS = {'조': 1e12, '억': 1e8, '만': 1e4}
+_SMALL_UNITS = {'천': 1e3, '백': 1e2, '십': 1e1}
+_NUMBER_CHARS = frozenset('0123456789.')
+AMOUNT_CACHE_SIZE = 65536
+
+
+def _to_float(text):
+    try:
+        return float(text)
+    except ValueError:  # '1.2.3'처럼 숫자가 아닌 조각은 무시합니다.
+        return 0.0
+
+
+@lru_cache(maxsize=AMOUNT_CACHE_SIZE)
+def _parse_amount_text(text):
+    # 대부분의 값(엑셀 숫자 셀, '1,234,000')은 단위 없는 숫자라 바로 변환합니다.
+    plain = text.strip().replace(',', '')
+    if plain.isascii() and plain.replace('.', '', 1).isdigit():
+        value = float(plain)
+        return value if value > 0 else None
+
+    total = section = 0.0
+    number = ''
+    for ch in text:
+        if ch in _NUMBER_CHARS:
+            number += ch
+        elif ch in _SMALL_UNITS:
+            section += (_to_float(number) if number else 1.0) * _SMALL_UNITS[ch]
+            number = ''
+        elif ch in _LARGE_UNITS:
+            if number:
+                section += _to_float(number)
+            total += section * _LARGE_UNITS[ch]
+            section, number = 0.0, ''
+        # 쉼표, 공백, '원' 같은 나머지 글자는 건너뜁니다.
+    if number:
+        section += _to_float(number)
+    total += section
+    return total if total > 0 else None
+
 
 def parse_amount(amount_str):
-    """'1억 5,000만' 같은 금액 문자열을 숫자로 변환합니다."""
-    if amount_str is None or not str(amount_str).strip():
+    """'1억 5,000만', '3천만원' 같은 금액 문자열을 숫자로 변환합니다. 변환할 수 없거나 0 이하이면 None을 반환합니다."""
+    if amount_str is None:
         return None
-    
-    s = str(amount_str).strip().replace(',', '')
-    s = re.sub(r'[^\d.억만백십]', '', s)
-    
-    total = 0.0
-    억_match = re.search(r'([\d.]+)\s*억', s)
-    if 억_match:
-        total += float(억_match.group(1)) * 100000000
-        s = s.replace(억_match.group(0), '')
-        
-    만_match = re.search(r'([\d.]+)\s*만', s)
-    if 만_match:
-        total += float(만_match.group(1)) * 10000
-        s = s.replace(만_match.group(0), '')
-        
-    if s:
-        try:
-            total += float(s)
-        except ValueError:
-            pass
-            
-    return total if total > 0 else None
\ No newline at end of file
+    return _parse_amount_text(str(amount_str))
+
+
+def parse_amounts(values):
+    """금액 목록(엑셀 한 열 등)을 한 번에 float 배열로 변환합니다. 변환할 수 없는 값은 NaN입니다."""
+    values = list(values)
+    return np.fromiter((np.nan if (amount := parse_amount(value)) is None else amount for value in values),
+                       dtype=float, count=len(values))
+
+
+def strip_corporate_suffix(name):
+    """회사명에서 ㈜, (주), 주식회사 같은 법인 형태 표기를 제거합니다."""
+    if not isinstance(name, str):
+        return name
+    return CORPORATE_SUFFIX_PATTERN.sub('', name).strip()
+
+
+def normalize_company_name(name):
+    """검색 비교용 회사명: 법인 형태 표기와 공백을 모두 없애고 소문자로 바꿉니다."""
+    if name is None:
+        return ""
+    return "".join(strip_corporate_suffix(str(name)).split()).lower()